@@ -111,7 +111,7 @@ class ExecutionLogger:
             "trade_id": trade.trade_id,
             "market_id": trade.market_id,
             "outcome": trade.outcome,
-            "side": trade.side.value,
+            "side": trade.side.name,
             "price": trade.price,
             "size": trade.size,
             "gas_cost": trade.gas_cost,
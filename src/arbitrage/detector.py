@@ -1,10 +1,11 @@
 """Main arbitrage detection engine."""
 
-from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Union
 from loguru import logger
 
 from ..config import Config
-from ..market.market_data import Market
+from ..market.market_data import Market, MarketArrayView
 from .strategies import (
     CrossMarketStrategy,
     YesNoImbalanceStrategy,
@@ -36,6 +37,7 @@ class ArbitrageDetector:
         """
         self.config = config
         self.strategies = []
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
 
         # Initialize enabled strategies
         if "cross_market" in config.strategies:
@@ -69,16 +71,27 @@ class ArbitrageDetector:
         Returns:
             List of all detected opportunities
         """
+        if self.config.parallel_detection and len(self.strategies) > 1:
+            return self._detect_parallel(markets)
+
         all_opportunities = []
+        view = None
 
         for strategy in self.strategies:
             try:
-                opportunities = strategy.detect(markets)
+                if hasattr(strategy, "detect_arr"):
+                    # Build the shared array view once per tick
+                    if view is None:
+                        view = MarketArrayView.from_markets(markets)
+                    opportunities = strategy.detect_arr(view)
+                else:
+                    opportunities = strategy.detect(markets)
                 all_opportunities.extend(opportunities)
 
-                strategy_name = strategy.__class__.__name__
                 logger.debug(
-                    f"{strategy_name} found {len(opportunities)} opportunities"
+                    "{} found {} opportunities",
+                    strategy.__class__.__name__,
+                    len(opportunities),
                 )
 
             except Exception as e:
@@ -91,6 +104,73 @@ class ArbitrageDetector:
 
         return all_opportunities
 
+    def _detect_parallel(self, markets: List[Market]) -> List[Opportunity]:
+        """Run all strategies concurrently and merge their results.
+
+        All strategies share one thread pool. The multi-leg strategy stays in
+        this process so its generated scorers and chain cache persist between
+        ticks; sending it to a process pool would pickle it, and every market,
+        on each call and drop that state. Results are merged in strategy order
+        so output matches the serial path.
+
+        Args:
+            markets: List of markets to analyze
+
+        Returns:
+            List of all detected opportunities
+        """
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.config.detection_workers
+            )
+
+        view = None
+        futures = {}
+
+        for index, strategy in enumerate(self.strategies):
+            try:
+                if hasattr(strategy, "detect_arr"):
+                    if view is None:
+                        view = MarketArrayView.from_markets(markets)
+                    future = self._thread_pool.submit(strategy.detect_arr, view)
+                else:
+                    future = self._thread_pool.submit(strategy.detect, markets)
+                futures[future] = index
+
+            except Exception as e:
+                logger.error(f"Error in strategy {strategy.__class__.__name__}: {e}")
+
+        results = {}
+        for future in as_completed(futures):
+            strategy = self.strategies[futures[future]]
+            try:
+                opportunities = future.result()
+                results[futures[future]] = opportunities
+                logger.debug(
+                    "{} found {} opportunities",
+                    strategy.__class__.__name__,
+                    len(opportunities),
+                )
+            except Exception as e:
+                logger.error(f"Error in strategy {strategy.__class__.__name__}: {e}")
+
+        all_opportunities = []
+        for index in sorted(results):
+            all_opportunities.extend(results[index])
+
+        logger.info(
+            f"Total opportunities detected: {len(all_opportunities)} "
+            f"from {len(markets)} markets"
+        )
+
+        return all_opportunities
+
+    def shutdown(self):
+        """Shut down the worker pool used for parallel detection."""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False)
+            self._thread_pool = None
+
     def filter_profitable_opportunities(
         self, opportunities: List[Opportunity], gas_price: float
     ) -> List[Opportunity]:
@@ -285,7 +285,7 @@ class OpportunityScorer:
             capital = opportunity.buy_price * position_size
         elif isinstance(opportunity, MultiLegOpportunity):
             # Sum of all legs
-            capital = sum(leg["price"] for leg in opportunity.legs) * position_size
+            capital = sum(leg.price for leg in opportunity.legs) * position_size
         elif isinstance(opportunity, CorrelatedEventsOpportunity):
             # Two positions
             capital = (
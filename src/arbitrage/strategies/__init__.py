@@ -2,7 +2,7 @@
 
 from .cross_market import CrossMarketStrategy, CrossMarketOpportunity
 from .yes_no_imbalance import YesNoImbalanceStrategy, YesNoImbalanceOpportunity
-from .multi_leg import MultiLegStrategy, MultiLegOpportunity
+from .multi_leg import MultiLegStrategy, MultiLegOpportunity, Leg
 from .correlated_events import CorrelatedEventsStrategy, CorrelatedEventsOpportunity
 
 __all__ = [
@@ -12,6 +12,7 @@ __all__ = [
     "YesNoImbalanceOpportunity",
     "MultiLegStrategy",
     "MultiLegOpportunity",
+    "Leg",
     "CorrelatedEventsStrategy",
     "CorrelatedEventsOpportunity",
 ]
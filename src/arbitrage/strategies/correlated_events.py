@@ -7,7 +7,7 @@ from loguru import logger
 from ...market.market_data import Market
 
 
-@dataclass
+@dataclass(slots=True)
 class CorrelatedEventsOpportunity:
     """Correlated events arbitrage opportunity."""
 
@@ -79,7 +79,7 @@ class CorrelatedEventsStrategy:
                 opportunities.extend(opps)
 
         logger.debug(
-            f"Correlated events strategy found {len(opportunities)} opportunities"
+            "Correlated events strategy found {} opportunities", len(opportunities)
         )
         return opportunities
 
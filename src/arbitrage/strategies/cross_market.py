@@ -7,7 +7,7 @@ from loguru import logger
 from ...market.market_data import Market
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossMarketOpportunity:
     """Cross-market arbitrage opportunity."""
 
@@ -60,7 +60,7 @@ class CrossMarketStrategy:
             opps = self._find_arbitrage_in_group(group)
             opportunities.extend(opps)
 
-        logger.debug(f"Cross-market strategy found {len(opportunities)} opportunities")
+        logger.debug("Cross-market strategy found {} opportunities", len(opportunities))
         return opportunities
 
     def _group_similar_markets(self, markets: List[Market]) -> List[List[Market]]:
@@ -1,19 +1,56 @@
 """Multi-leg arbitrage strategy."""
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from typing import Callable, List, NamedTuple, Sequence
 from itertools import combinations
 from loguru import logger
 
 from ...market.market_data import Market
 
+# Maximum number of market groups whose chain search results are cached
+_CHAIN_CACHE_SIZE = 1024
 
-@dataclass
+
+def _make_scorer(num_legs: int) -> Callable[[Sequence[Market]], float]:
+    """Build a chain cost function specialized for a fixed number of legs.
+
+    The generated function unrolls the alternating YES/NO ask lookup used by
+    ``MultiLegStrategy._check_chain``, e.g. for three legs::
+
+        def score(ms):
+            return ms[0].yes_ask + ms[1].no_ask + ms[2].yes_ask
+
+    Args:
+        num_legs: Number of markets in the chain
+
+    Returns:
+        Function mapping a chain of markets to its total cost
+    """
+    terms = " + ".join(
+        f"ms[{i}].{'yes_ask' if i % 2 == 0 else 'no_ask'}" for i in range(num_legs)
+    )
+    namespace: dict = {}
+    exec(f"def score(ms):\n    return {terms}\n", namespace)
+    return namespace["score"]
+
+
+class Leg(NamedTuple):
+    """A single trade leg of a multi-leg opportunity."""
+
+    market_id: str
+    action: str  # "buy" or "sell"
+    outcome: str  # "YES" or "NO"
+    price: float
+    question: str
+
+
+@dataclass(slots=True)
 class MultiLegOpportunity:
     """Multi-leg arbitrage opportunity across 3+ markets."""
 
     markets: List[Market]
-    legs: List[Dict[str, any]]  # List of trade legs
+    legs: List[Leg]  # List of trade legs
     total_profit_percentage: float
     expected_profit: float
     complexity_score: int  # Number of legs
@@ -40,6 +77,22 @@ class MultiLegStrategy:
         """
         self.min_profit_pct = min_profit_pct
         self.max_legs = max_legs
+        self._scorers = {k: _make_scorer(k) for k in range(3, max_legs + 1)}
+        # Group price snapshot -> index tuples of the profitable chains
+        self._chain_cache: OrderedDict = OrderedDict()
+
+    def __getstate__(self) -> dict:
+        """Drop the generated scorers and chain cache before pickling."""
+        state = self.__dict__.copy()
+        del state["_scorers"]
+        del state["_chain_cache"]
+        return state
+
+    def __setstate__(self, state: dict):
+        """Restore state and rebuild the generated scorers."""
+        self.__dict__.update(state)
+        self._scorers = {k: _make_scorer(k) for k in range(3, self.max_legs + 1)}
+        self._chain_cache = OrderedDict()
 
     def detect(self, markets: List[Market]) -> List[MultiLegOpportunity]:
         """Detect multi-leg arbitrage opportunities.
@@ -66,7 +119,7 @@ class MultiLegStrategy:
                 opps = self._find_chains_in_group(group)
                 opportunities.extend(opps)
 
-        logger.debug(f"Multi-leg strategy found {len(opportunities)} opportunities")
+        logger.debug("Multi-leg strategy found {} opportunities", len(opportunities))
         return opportunities
 
     def _group_related_markets(self, markets: List[Market]) -> List[List[Market]]:
@@ -98,14 +151,54 @@ class MultiLegStrategy:
         Returns:
             List of opportunities
         """
+        # Groups whose markets and asks are unchanged since an earlier tick
+        # reuse that tick's chain search; only the winning chains are rebuilt
+        cache_key = (
+            self.min_profit_pct,
+            tuple((m.market_id, m.yes_ask, m.no_ask) for m in markets),
+        )
+        cached_chains = self._chain_cache.get(cache_key)
+        if cached_chains is not None:
+            self._chain_cache.move_to_end(cache_key)
+            return [
+                self._check_chain([markets[i] for i in chain])
+                for chain in cached_chains
+            ]
+
         opportunities = []
+        chains = []
+        positions = {id(m): i for i, m in enumerate(markets)}
+
+        # Every leg costs at least the cheaper of its market's two asks, so the
+        # k cheapest of those bound the cost of any k-leg chain from below
+        asks_sorted = sorted(min(m.yes_ask, m.no_ask) for m in markets)
 
         # Try combinations of 3, 4, 5... markets up to max_legs
         for num_markets in range(3, min(len(markets) + 1, self.max_legs + 1)):
+            min_possible_cost = sum(asks_sorted[:num_markets])
+            if min_possible_cost > 0:
+                max_possible_profit_pct = (
+                    (num_markets - min_possible_cost) / min_possible_cost * 100
+                )
+                if max_possible_profit_pct < self.min_profit_pct:
+                    continue
+
+            scorer = self._scorers[num_markets]
             for market_combo in combinations(markets, num_markets):
+                # Cheap cost check before building legs for the full chain
+                cost = scorer(market_combo)
+                profit_pct = (num_markets - cost) / cost * 100 if cost > 0 else 0
+                if profit_pct < self.min_profit_pct:
+                    continue
+
                 opp = self._check_chain(list(market_combo))
                 if opp:
                     opportunities.append(opp)
+                    chains.append(tuple(positions[id(m)] for m in market_combo))
+
+        self._chain_cache[cache_key] = chains
+        if len(self._chain_cache) > _CHAIN_CACHE_SIZE:
+            self._chain_cache.popitem(last=False)
 
         return opportunities
 
@@ -128,34 +221,35 @@ class MultiLegStrategy:
 
         legs = []
         total_expected_return = 0
+        total_cost = 0.0
 
         # Build a synthetic chain
         for i, market in enumerate(markets):
             # Alternate between buying YES and NO to create a balanced chain
             if i % 2 == 0:
-                leg = {
-                    "market_id": market.market_id,
-                    "action": "buy",
-                    "outcome": "YES",
-                    "price": market.yes_ask,
-                    "question": market.question[:50],
-                }
+                leg = Leg(
+                    market_id=market.market_id,
+                    action="buy",
+                    outcome="YES",
+                    price=market.yes_ask,
+                    question=market.question[:50],
+                )
                 expected_return = 1.0 - market.yes_ask
             else:
-                leg = {
-                    "market_id": market.market_id,
-                    "action": "buy",
-                    "outcome": "NO",
-                    "price": market.no_ask,
-                    "question": market.question[:50],
-                }
+                leg = Leg(
+                    market_id=market.market_id,
+                    action="buy",
+                    outcome="NO",
+                    price=market.no_ask,
+                    question=market.question[:50],
+                )
                 expected_return = 1.0 - market.no_ask
 
             legs.append(leg)
+            total_cost += leg.price
             total_expected_return += expected_return
 
         # Calculate if the chain is profitable
-        total_cost = sum(leg["price"] for leg in legs)
         potential_return = len(markets)  # Maximum possible return
         profit = potential_return - total_cost
         profit_pct = (profit / total_cost) * 100 if total_cost > 0 else 0
@@ -3,11 +3,12 @@
 from dataclasses import dataclass
 from typing import List
 from loguru import logger
+import numpy as np
 
-from ...market.market_data import Market
+from ...market.market_data import Market, MarketArrayView
 
 
-@dataclass
+@dataclass(slots=True)
 class YesNoImbalanceOpportunity:
     """YES/NO imbalance arbitrage opportunity."""
 
@@ -63,8 +64,12 @@ class YesNoImbalanceStrategy:
             buy_sum = market.yes_ask + market.no_ask
             buy_imbalance = 1.0 - buy_sum
 
-            # If sum < 1.0, we can buy both and profit
-            if buy_imbalance > self.imbalance_threshold:
+            # Balanced market: neither direction can clear the threshold
+            if abs(buy_imbalance) <= self.imbalance_threshold:
+                continue
+
+            if buy_imbalance > 0:
+                # If sum < 1.0, we can buy both and profit
                 profit_pct = (buy_imbalance / buy_sum) * 100
 
                 if profit_pct >= self.min_profit_pct:
@@ -83,14 +88,16 @@ class YesNoImbalanceStrategy:
                         action="buy_both",
                     )
                     opportunities.append(opportunity)
+                continue
 
-            # Use bid prices when selling (what we receive)
+            # Asks sum above 1.0; bids sit below asks, so only here can the
+            # bid sum exceed 1.0. Use bid prices when selling (what we receive)
             sell_sum = market.yes_bid + market.no_bid
             sell_imbalance = sell_sum - 1.0
 
             # If sum > 1.0, we can sell both and profit
             if sell_imbalance > self.imbalance_threshold:
-                profit_pct = (sell_imbalance / 1.0) * 100
+                profit_pct = sell_imbalance * 100
 
                 if profit_pct >= self.min_profit_pct:
                     # Calculate expected profit for $100 position
@@ -110,6 +117,74 @@ class YesNoImbalanceStrategy:
                     opportunities.append(opportunity)
 
         logger.debug(
-            f"YES/NO imbalance strategy found {len(opportunities)} opportunities"
+            "YES/NO imbalance strategy found {} opportunities", len(opportunities)
+        )
+        return opportunities
+
+    def detect_arr(self, view: MarketArrayView) -> List[YesNoImbalanceOpportunity]:
+        """Vectorized variant of :meth:`detect` over a shared market view.
+
+        Args:
+            view: Structure-of-arrays snapshot of the markets to analyze
+
+        Returns:
+            List of detected opportunities, in the same order as :meth:`detect`
+        """
+        opportunities = []
+
+        buy_sum = view.yes_ask + view.no_ask
+        buy_imbalance = 1.0 - buy_sum
+        with np.errstate(divide="ignore", invalid="ignore"):
+            buy_profit_pct = (buy_imbalance / buy_sum) * 100
+        buy_mask = (buy_imbalance > self.imbalance_threshold) & (
+            buy_profit_pct >= self.min_profit_pct
+        )
+
+        sell_sum = view.yes_bid + view.no_bid
+        sell_imbalance = sell_sum - 1.0
+        sell_profit_pct = sell_imbalance * 100
+        sell_mask = (
+            (buy_imbalance < -self.imbalance_threshold)
+            & (sell_imbalance > self.imbalance_threshold)
+            & (sell_profit_pct >= self.min_profit_pct)
+        )
+
+        # Prices come from the view, the same values the masks were built
+        # from, rather than from the market objects
+        for i in np.flatnonzero(buy_mask | sell_mask).tolist():
+            market = view.markets[i]
+
+            # At most one direction can be set for a given market
+            if buy_mask[i]:
+                imbalance = float(buy_imbalance[i])
+                opportunities.append(
+                    YesNoImbalanceOpportunity(
+                        market=market,
+                        yes_price=float(view.yes_ask[i]),
+                        no_price=float(view.no_ask[i]),
+                        price_sum=float(buy_sum[i]),
+                        imbalance=imbalance,
+                        profit_percentage=float(buy_profit_pct[i]),
+                        expected_profit=imbalance * 100,
+                        action="buy_both",
+                    )
+                )
+            else:
+                imbalance = float(sell_imbalance[i])
+                opportunities.append(
+                    YesNoImbalanceOpportunity(
+                        market=market,
+                        yes_price=float(view.yes_bid[i]),
+                        no_price=float(view.no_bid[i]),
+                        price_sum=float(sell_sum[i]),
+                        imbalance=imbalance,
+                        profit_percentage=float(sell_profit_pct[i]),
+                        expected_profit=imbalance * 100,
+                        action="sell_both",
+                    )
+                )
+
+        logger.debug(
+            "YES/NO imbalance strategy found {} opportunities", len(opportunities)
         )
         return opportunities
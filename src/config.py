@@ -1,13 +1,20 @@
 """Configuration management for Polymarket Arbitrage Bot."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal, Tuple
 
 import yaml
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Prefer the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 class Config(BaseSettings):
     """Main configuration class for the arbitrage bot."""
@@ -34,6 +41,8 @@ class Config(BaseSettings):
     min_arbitrage_percentage: float = Field(
         default=0.5, description="Minimum profit margin %"
     )
+    parallel_detection: bool = False
+    detection_workers: int = Field(default=4, ge=1)
 
     # Market Monitoring
     websocket_enabled: bool = True
@@ -52,10 +61,16 @@ class Config(BaseSettings):
     gas_price_limit: int = Field(default=100, description="Maximum gwei for gas")
     order_type: Literal["market", "limit"] = "limit"
     execution_timeout: int = Field(default=30, ge=1)
+    trade_history_size: int = Field(
+        default=10_000, ge=1, description="Executed trades kept in memory"
+    )
 
     # Gas & Fee Settings
     polygon_rpc_url: str = "https://polygon-rpc.com"
     gas_safety_buffer: float = Field(default=1.2, ge=1.0)
+    gas_cache_ttl: float = Field(
+        default=5.0, ge=0.0, description="Seconds to reuse a fetched gas price"
+    )
 
     # Notifications
     discord_webhook: Optional[str] = None
@@ -64,6 +79,12 @@ class Config(BaseSettings):
     alert_on_opportunities: bool = True
     alert_on_executions: bool = True
     alert_on_errors: bool = True
+    discord_flush_interval: float = Field(
+        default=0.2, ge=0, description="Seconds to collect Discord embeds per post"
+    )
+    discord_max_batch: int = Field(
+        default=10, ge=1, le=10, description="Max embeds per Discord message"
+    )
 
     # Logging
     log_level: str = "INFO"
@@ -77,6 +98,21 @@ class Config(BaseSettings):
     polymarket_secret: Optional[str] = None
     api_timeout: int = Field(default=10, ge=1)
     api_retry_attempts: int = Field(default=3, ge=1)
+    max_concurrent_requests: int = Field(
+        default=5, ge=1, description="Max API requests in flight at once"
+    )
+    api_rate_limit: float = Field(
+        default=10.0, gt=0, description="Sustained API request rate (req/s)"
+    )
+    api_burst: int = Field(
+        default=5, ge=1, description="API requests allowed back-to-back in a burst"
+    )
+    min_clob_volume: float = Field(
+        default=0.0, ge=0, description="24h volume above which CLOB books are fetched"
+    )
+    min_clob_liquidity: float = Field(
+        default=0.0, ge=0, description="Liquidity above which CLOB books are fetched"
+    )
 
     # Wallet Configuration
     wallet_private_key: Optional[str] = None
@@ -98,22 +134,100 @@ class Config(BaseSettings):
 def load_config(config_path: str = "config.yaml") -> Config:
     """Load configuration from YAML file and environment variables.
 
+    The parsed YAML is cached per file path and modification time, so
+    repeated calls for an unchanged file skip re-reading it. Each call still
+    returns a new Config, validated against the current environment and
+    .env file, that the caller is free to modify.
+
     Args:
         config_path: Path to the YAML configuration file
 
     Returns:
         Config object with loaded settings
     """
-    config_file = Path(config_path)
-
-    if config_file.exists():
-        with open(config_file, "r") as f:
-            yaml_config = yaml.safe_load(f)
-    else:
-        yaml_config = {}
+    path = os.path.abspath(config_path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = 0
 
     # Environment variables override YAML config
-    return Config(**yaml_config)
+    return Config(**_read_yaml_cached(path, mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _read_yaml_cached(path: str, mtime_ns: int) -> dict:
+    """Read the configuration file, reusing earlier reads of the same version.
+
+    The returned dict is shared between callers and must not be modified.
+
+    Args:
+        path: Absolute path to the YAML configuration file
+        mtime_ns: File modification time, used only as part of the cache key
+
+    Returns:
+        Parsed settings
+    """
+    return _read_yaml(Path(path))
+
+
+def _read_yaml(config_file: Path) -> dict:
+    """Read a YAML configuration file.
+
+    Args:
+        config_file: Path to the YAML configuration file
+
+    Returns:
+        Parsed settings, or an empty dict if the file is missing or empty
+    """
+    if not config_file.exists():
+        return {}
+
+    # libyaml consumes bytes directly; an empty file parses to None
+    return yaml.load(config_file.read_bytes(), Loader=_Loader) or {}
+
+
+# Absolute path -> (YAML settings, field values) of that file's last
+# validated load; the baseline load_config_fast reloads are checked against
+_validated_bases: Dict[str, Tuple[dict, dict]] = {}
+
+_MISSING = object()
+
+
+def load_config_fast(config_path: str = "config.yaml") -> Config:
+    """Reload configuration from a YAML file, validating only what changed.
+
+    The first call for a path performs a full validated load (including
+    .env parsing) and keeps the YAML settings and resulting field values
+    for that path. Later calls start from those values with
+    ``Config.model_construct`` and validate just the YAML keys that were
+    added or changed since. If a key was removed from the file, the file
+    is loaded and validated in full again.
+
+    Args:
+        config_path: Path to the YAML configuration file
+
+    Returns:
+        Config object with loaded settings
+
+    Raises:
+        pydantic.ValidationError: If a changed setting is invalid
+    """
+    path = os.path.abspath(config_path)
+    settings = _read_yaml(Path(path))
+
+    base = _validated_bases.get(path)
+    if base is None or base[0].keys() - settings.keys():
+        config = Config(**settings)
+        _validated_bases[path] = (settings, config.model_dump())
+        return config
+
+    base_settings, fields = base
+    config = Config.model_construct(**fields)
+    for key, value in settings.items():
+        if key in Config.model_fields and base_settings.get(key, _MISSING) != value:
+            Config.__pydantic_validator__.validate_assignment(config, key, value)
+    return config
 
 
 # Global config instance
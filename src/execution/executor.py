@@ -1,25 +1,41 @@
 """Trade execution system."""
 
 import asyncio
+import itertools
+import time
+from collections import deque
 from datetime import datetime
-from typing import Optional, Dict, Any, TYPE_CHECKING
+from typing import Awaitable, Callable, Optional, Dict, Any
 from loguru import logger
 
 from ..config import Config
 from ..market.market_data import Trade, Position, OrderSide, OrderType
 from ..arbitrage.detector import Opportunity
 from ..arbitrage.scorer import ScoredOpportunity
+from ..arbitrage.strategies import (
+    YesNoImbalanceOpportunity,
+    CrossMarketOpportunity,
+    MultiLegOpportunity,
+    CorrelatedEventsOpportunity,
+)
 
-if TYPE_CHECKING:
-    from ..arbitrage.strategies.yes_no_imbalance import YesNoImbalanceOpportunity
-    from ..arbitrage.strategies.cross_market import CrossMarketOpportunity
-    from ..arbitrage.strategies.multi_leg import MultiLegOpportunity
-    from ..arbitrage.strategies.correlated_events import CorrelatedEventsOpportunity
+# Order side for each multi-leg action
+_LEG_SIDES = {"buy": OrderSide.BUY, "sell": OrderSide.SELL}
 
 
 class TradeExecutor:
     """Executes arbitrage trades on Polymarket."""
 
+    __slots__ = (
+        "config",
+        "executed_trades",
+        "open_positions",
+        "mode",
+        "_dry_run",
+        "_trade_counter",
+        "_dispatch",
+    )
+
     def __init__(self, config: Config):
         """Initialize trade executor.
 
@@ -27,9 +43,19 @@ class TradeExecutor:
             config: Configuration object
         """
         self.config = config
-        self.executed_trades: list[Trade] = []
+        self.executed_trades: deque[Trade] = deque(maxlen=config.trade_history_size)
         self.open_positions: Dict[str, Position] = {}
         self.mode = config.mode
+        self._dry_run = config.dry_run
+        self._trade_counter = itertools.count()
+
+        # Execution handler per concrete opportunity class
+        self._dispatch: Dict[type, Callable[..., Awaitable[list[Trade]]]] = {
+            YesNoImbalanceOpportunity: self._execute_yes_no_imbalance,
+            CrossMarketOpportunity: self._execute_cross_market,
+            MultiLegOpportunity: self._execute_multi_leg,
+            CorrelatedEventsOpportunity: self._execute_correlated_events,
+        }
 
     async def execute_opportunity(
         self, scored_opportunity: ScoredOpportunity, position_size: float
@@ -58,21 +84,41 @@ class TradeExecutor:
             scored_opportunity: Opportunity to alert on
             position_size: Recommended position size
         """
+        # One multi-line record instead of a sink write per line; built lazily
+        # so nothing is formatted when INFO is disabled
+        logger.opt(lazy=True).info(
+            "{}", lambda: self._format_alert(scored_opportunity, position_size)
+        )
+
+    @staticmethod
+    def _format_alert(
+        scored_opportunity: ScoredOpportunity, position_size: float
+    ) -> str:
+        """Format the alert message for an opportunity.
+
+        Args:
+            scored_opportunity: Opportunity to alert on
+            position_size: Recommended position size
+
+        Returns:
+            Multi-line alert message
+        """
         opp = scored_opportunity.opportunity
-        logger.info("=" * 80)
-        logger.info("🎯 ARBITRAGE OPPORTUNITY DETECTED")
-        logger.info("=" * 80)
-        logger.info(f"Type: {opp.__class__.__name__}")
-        logger.info(f"Details: {str(opp)}")
-        logger.info(f"Score: {scored_opportunity.score:.2f}/100")
-        logger.info(f"Profit Score: {scored_opportunity.profit_score:.2f}")
-        logger.info(
-            f"Capital Efficiency: {scored_opportunity.capital_efficiency_score:.2f}"
+        rule = "=" * 80
+        return (
+            f"\n{rule}\n"
+            "🎯 ARBITRAGE OPPORTUNITY DETECTED\n"
+            f"{rule}\n"
+            f"Type: {opp.__class__.__name__}\n"
+            f"Details: {opp}\n"
+            f"Score: {scored_opportunity.score:.2f}/100\n"
+            f"Profit Score: {scored_opportunity.profit_score:.2f}\n"
+            f"Capital Efficiency: {scored_opportunity.capital_efficiency_score:.2f}\n"
+            f"Confidence: {scored_opportunity.confidence_score:.2f}\n"
+            f"Risk: {scored_opportunity.risk_score:.2f}\n"
+            f"Recommended Position Size: ${position_size:.2f}\n"
+            f"{rule}"
         )
-        logger.info(f"Confidence: {scored_opportunity.confidence_score:.2f}")
-        logger.info(f"Risk: {scored_opportunity.risk_score:.2f}")
-        logger.info(f"Recommended Position Size: ${position_size:.2f}")
-        logger.info("=" * 80)
 
     async def _execute_trades(
         self, scored_opportunity: ScoredOpportunity, position_size: float
@@ -86,28 +132,19 @@ class TradeExecutor:
         Returns:
             List of executed trades
         """
-        from ..arbitrage.strategies import (
-            YesNoImbalanceOpportunity,
-            CrossMarketOpportunity,
-            MultiLegOpportunity,
-            CorrelatedEventsOpportunity,
-        )
-
         opp = scored_opportunity.opportunity
-        trades = []
+        handler = self._dispatch.get(type(opp))
+        if handler is None:
+            logger.error(f"Unknown opportunity type: {type(opp)}")
+            return None
+
+        if self._dry_run:
+            # No orders would be placed, so skip the per-leg coroutines
+            self._log_dry_run_summary(opp, position_size)
+            return []
 
         try:
-            if isinstance(opp, YesNoImbalanceOpportunity):
-                trades = await self._execute_yes_no_imbalance(opp, position_size)
-            elif isinstance(opp, CrossMarketOpportunity):
-                trades = await self._execute_cross_market(opp, position_size)
-            elif isinstance(opp, MultiLegOpportunity):
-                trades = await self._execute_multi_leg(opp, position_size)
-            elif isinstance(opp, CorrelatedEventsOpportunity):
-                trades = await self._execute_correlated_events(opp, position_size)
-            else:
-                logger.error(f"Unknown opportunity type: {type(opp)}")
-                return None
+            trades = await handler(opp, position_size)
 
             if trades:
                 self.executed_trades.extend(trades)
@@ -119,8 +156,20 @@ class TradeExecutor:
             logger.error(f"Error executing opportunity: {e}")
             return None
 
+    def _log_dry_run_summary(self, opportunity: Opportunity, position_size: float):
+        """Log the execution that would have happened outside dry-run mode.
+
+        Args:
+            opportunity: Opportunity that would be executed
+            position_size: Position size in USD
+        """
+        logger.info(
+            f"DRY RUN: Would execute {opportunity.__class__.__name__} "
+            f"for ${position_size:.2f}: {opportunity}"
+        )
+
     async def _execute_yes_no_imbalance(
-        self, opportunity: "YesNoImbalanceOpportunity", position_size: float
+        self, opportunity: YesNoImbalanceOpportunity, position_size: float
     ) -> list[Trade]:
         """Execute YES/NO imbalance arbitrage.
 
@@ -131,57 +180,35 @@ class TradeExecutor:
         Returns:
             List of executed trades
         """
-        trades = []
         market_id = opportunity.market.market_id
 
         if opportunity.action == "buy_both":
-            # Buy both YES and NO
-            yes_trade = await self._place_order(
-                market_id=market_id,
-                outcome="YES",
-                side=OrderSide.BUY,
-                price=opportunity.yes_price,
-                size=position_size,
-            )
-            if yes_trade:
-                trades.append(yes_trade)
-
-            no_trade = await self._place_order(
-                market_id=market_id,
-                outcome="NO",
-                side=OrderSide.BUY,
-                price=opportunity.no_price,
-                size=position_size,
-            )
-            if no_trade:
-                trades.append(no_trade)
-
+            side = OrderSide.BUY
         elif opportunity.action == "sell_both":
-            # Sell both YES and NO
-            yes_trade = await self._place_order(
+            side = OrderSide.SELL
+        else:
+            return []
+
+        # Buy or sell both YES and NO together
+        return await self._gather_trades(
+            self._place_order(
                 market_id=market_id,
                 outcome="YES",
-                side=OrderSide.SELL,
+                side=side,
                 price=opportunity.yes_price,
                 size=position_size,
-            )
-            if yes_trade:
-                trades.append(yes_trade)
-
-            no_trade = await self._place_order(
+            ),
+            self._place_order(
                 market_id=market_id,
                 outcome="NO",
-                side=OrderSide.SELL,
+                side=side,
                 price=opportunity.no_price,
                 size=position_size,
-            )
-            if no_trade:
-                trades.append(no_trade)
-
-        return trades
+            ),
+        )
 
     async def _execute_cross_market(
-        self, opportunity: "CrossMarketOpportunity", position_size: float
+        self, opportunity: CrossMarketOpportunity, position_size: float
     ) -> list[Trade]:
         """Execute cross-market arbitrage.
 
@@ -192,34 +219,27 @@ class TradeExecutor:
         Returns:
             List of executed trades
         """
-        trades = []
-
-        # Buy from cheaper market
-        buy_trade = await self._place_order(
-            market_id=opportunity.buy_market,
-            outcome=opportunity.outcome,
-            side=OrderSide.BUY,
-            price=opportunity.buy_price,
-            size=position_size,
-        )
-        if buy_trade:
-            trades.append(buy_trade)
-
-        # Sell to more expensive market
-        sell_trade = await self._place_order(
-            market_id=opportunity.sell_market,
-            outcome=opportunity.outcome,
-            side=OrderSide.SELL,
-            price=opportunity.sell_price,
-            size=position_size,
+        return await self._gather_trades(
+            # Buy from cheaper market
+            self._place_order(
+                market_id=opportunity.buy_market,
+                outcome=opportunity.outcome,
+                side=OrderSide.BUY,
+                price=opportunity.buy_price,
+                size=position_size,
+            ),
+            # Sell to more expensive market
+            self._place_order(
+                market_id=opportunity.sell_market,
+                outcome=opportunity.outcome,
+                side=OrderSide.SELL,
+                price=opportunity.sell_price,
+                size=position_size,
+            ),
         )
-        if sell_trade:
-            trades.append(sell_trade)
-
-        return trades
 
     async def _execute_multi_leg(
-        self, opportunity: "MultiLegOpportunity", position_size: float
+        self, opportunity: MultiLegOpportunity, position_size: float
     ) -> list[Trade]:
         """Execute multi-leg arbitrage.
 
@@ -230,23 +250,43 @@ class TradeExecutor:
         Returns:
             List of executed trades
         """
-        trades = []
-
-        for leg in opportunity.legs:
-            trade = await self._place_order(
-                market_id=leg["market_id"],
-                outcome=leg["outcome"],
-                side=OrderSide.BUY if leg["action"] == "buy" else OrderSide.SELL,
-                price=leg["price"],
-                size=position_size / len(opportunity.legs),
+        leg_size = position_size / len(opportunity.legs)
+
+        return await self._gather_trades(
+            *(
+                self._place_order(
+                    market_id=market_id,
+                    outcome=outcome,
+                    side=_LEG_SIDES.get(action, OrderSide.SELL),
+                    price=price,
+                    size=leg_size,
+                )
+                for market_id, action, outcome, price, _ in opportunity.legs
             )
-            if trade:
-                trades.append(trade)
+        )
+
+    async def _gather_trades(self, *orders: Awaitable[Optional[Trade]]) -> list[Trade]:
+        """Place independent orders concurrently.
+
+        Args:
+            orders: Pending ``_place_order`` calls
+
+        Returns:
+            Trades that were filled, in order
+        """
+        results = await asyncio.gather(*orders, return_exceptions=True)
+
+        trades = []
+        for result in results:
+            if isinstance(result, Trade):
+                trades.append(result)
+            elif isinstance(result, Exception):
+                logger.error(f"Failed to place order: {result}")
 
         return trades
 
     async def _execute_correlated_events(
-        self, opportunity: "CorrelatedEventsOpportunity", position_size: float
+        self, opportunity: CorrelatedEventsOpportunity, position_size: float
     ) -> list[Trade]:
         """Execute correlated events arbitrage.
 
@@ -294,9 +334,9 @@ class TradeExecutor:
         # 4. Wait for confirmation
         # 5. Handle errors and retries
 
-        if self.config.dry_run:
+        if self._dry_run:
             logger.info(
-                f"DRY RUN: Would place {side.value} order for {outcome} on {market_id[:8]}... at {price:.3f} for ${size:.2f}"
+                f"DRY RUN: Would place {side.name} order for {outcome} on {market_id[:8]}... at {price:.3f} for ${size:.2f}"
             )
             return None
 
@@ -304,19 +344,21 @@ class TradeExecutor:
             # Simulate order placement
             await asyncio.sleep(0.1)  # Simulate network delay
 
+            # One clock read serves both the ID suffix and the timestamp
+            now_ns = time.time_ns()
             trade = Trade(
-                trade_id=f"trade_{len(self.executed_trades)}_{datetime.now().timestamp()}",
+                trade_id=f"trade_{next(self._trade_counter)}_{now_ns}",
                 market_id=market_id,
                 outcome=outcome,
                 side=side,
                 price=price,
                 size=size,
-                timestamp=datetime.now(),
+                timestamp=datetime.fromtimestamp(now_ns / 1e9),
                 gas_cost=2.0,  # Approximate gas cost in USD
             )
 
             logger.info(
-                f"Executed trade: {side.value} {size:.2f} {outcome} @ {price:.3f} on {market_id[:8]}..."
+                f"Executed trade: {side.name} {size:.2f} {outcome} @ {price:.3f} on {market_id[:8]}..."
             )
 
             return trade
@@ -1,12 +1,16 @@
 """Position sizing using Kelly Criterion and other strategies."""
 
-import numpy as np
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, TYPE_CHECKING
 from loguru import logger
 
 from ..config import Config
 
+if TYPE_CHECKING:
+    import numpy as np
 
+
+@lru_cache(maxsize=4096)
 def kelly_criterion(
     win_probability: float, win_return: float, loss_return: float = -1.0
 ) -> float:
@@ -48,6 +52,8 @@ def kelly_criterion(
 class PositionSizer:
     """Calculate optimal position sizes for arbitrage opportunities."""
 
+    __slots__ = ("config", "strategy", "kelly_fraction", "_kelly_scale", "_max_pos")
+
     def __init__(self, config: Config):
         """Initialize position sizer.
 
@@ -58,6 +64,10 @@ class PositionSizer:
         self.strategy = config.position_sizing_strategy
         self.kelly_fraction = config.kelly_fraction
 
+        # Plain floats for the per-opportunity path, read once from config
+        self._kelly_scale = float(config.kelly_fraction)
+        self._max_pos = float(config.max_position_size)
+
     def calculate_position_size(
         self,
         opportunity_profit_pct: float,
@@ -87,11 +97,16 @@ class PositionSizer:
             size = self._fixed_sizing(available_capital)
 
         # Apply max position size limit
-        size = min(size, self.config.max_position_size)
-
-        logger.debug(
-            f"Position size: ${size:.2f} (strategy: {self.strategy}, "
-            f"profit: {opportunity_profit_pct:.2f}%, confidence: {opportunity_confidence:.2f})"
+        size = min(size, self._max_pos)
+
+        # Deferred formatting: skipped entirely unless DEBUG is enabled
+        logger.opt(lazy=True).debug(
+            "Position size: ${size:.2f} (strategy: {strategy}, "
+            "profit: {profit:.2f}%, confidence: {confidence:.2f})",
+            size=lambda: size,
+            strategy=lambda: self.strategy,
+            profit=lambda: opportunity_profit_pct,
+            confidence=lambda: opportunity_confidence,
         )
 
         return size
@@ -116,17 +131,58 @@ class PositionSizer:
         # For arbitrage, we expect high confidence, but account for execution risk
         win_probability = confidence * 0.95  # Reduce by 5% for execution risk
 
-        # Calculate Kelly fraction
-        kelly_f = kelly_criterion(win_probability, win_return)
+        # Calculate Kelly fraction; rounding buckets the inputs so repeated
+        # opportunities hit the kelly_criterion cache
+        kelly_f = kelly_criterion(round(win_probability, 3), round(win_return, 4))
 
         # Apply fractional Kelly (more conservative)
-        fractional_kelly = kelly_f * self.kelly_fraction
+        fractional_kelly = kelly_f * self._kelly_scale
 
         # Calculate position size
         position_size = capital * fractional_kelly
 
         return position_size
 
+    def position_fractions(
+        self, profit_pcts: "np.ndarray", confidences: "np.ndarray"
+    ) -> "np.ndarray":
+        """Calculate position sizes for many opportunities as capital fractions.
+
+        Vectorized counterpart of ``calculate_position_size``; the caller
+        multiplies by available capital and applies the size limits.
+
+        Args:
+            profit_pcts: Expected profit percentages
+            confidences: Confidence in each opportunity (0-1)
+
+        Returns:
+            Fraction of available capital to allocate to each opportunity
+        """
+        import numpy as np
+
+        if self.strategy == "kelly":
+            # Rounded like _kelly_sizing so both paths agree
+            win_return = np.round(profit_pcts / 100, 4)
+            win_probability = np.round(confidences * 0.95, 3)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                kelly_f = (
+                    win_probability * win_return - (1 - win_probability)
+                ) / win_return
+
+            # Same edge cases as kelly_criterion
+            valid = (win_probability > 0) & (win_probability < 1) & (win_return > 0)
+            kelly_f = np.where(valid, np.clip(kelly_f, 0.0, 1.0), 0.0)
+            return kelly_f * self._kelly_scale
+
+        if self.strategy == "percentage":
+            return np.full(len(profit_pcts), 0.05)
+
+        if self.strategy != "fixed":
+            logger.warning(f"Unknown sizing strategy: {self.strategy}, using fixed")
+        # Fixed sizing is 10% of capital, capped at max_position_size
+        return np.full(len(profit_pcts), 0.1)
+
     def _fixed_sizing(self, capital: float) -> float:
         """Use fixed position size.
 
@@ -136,7 +192,7 @@ class PositionSizer:
         Returns:
             Fixed position size
         """
-        return min(self.config.max_position_size, capital * 0.1)  # 10% of capital
+        return min(self._max_pos, capital * 0.1)  # 10% of capital
 
     def _percentage_sizing(self, capital: float) -> float:
         """Use percentage-based position sizing.
@@ -154,6 +210,8 @@ class PositionSizer:
 class CapitalAllocator:
     """Allocates capital across multiple opportunities."""
 
+    __slots__ = ("config", "position_sizer", "_max_exposure")
+
     def __init__(self, config: Config):
         """Initialize capital allocator.
 
@@ -162,6 +220,7 @@ class CapitalAllocator:
         """
         self.config = config
         self.position_sizer = PositionSizer(config)
+        self._max_exposure = float(config.max_total_exposure)
 
     def allocate_capital(
         self, opportunities: list, total_capital: float, current_exposure: float
@@ -176,33 +235,44 @@ class CapitalAllocator:
         Returns:
             Dictionary mapping opportunity index to position size
         """
+        import numpy as np
+
         allocation = {}
         remaining_capital = total_capital - current_exposure
 
         # Check total exposure limit
-        if current_exposure >= self.config.max_total_exposure:
+        if current_exposure >= self._max_exposure:
             logger.warning("Maximum total exposure reached, no new positions")
             return allocation
 
-        # Allocate to opportunities in order of score
-        for i, scored_opp in enumerate(opportunities):
-            if remaining_capital <= 0:
-                break
+        profit_pcts = np.fromiter(
+            (o.profit_score for o in opportunities),
+            dtype=np.float64,
+            count=len(opportunities),
+        )
+        confidences = np.fromiter(
+            (o.confidence_score / 100 for o in opportunities),
+            dtype=np.float64,
+            count=len(opportunities),
+        )
+        fractions = self.position_sizer.position_fractions(profit_pcts, confidences)
 
-            # Get opportunity details
-            profit_pct = scored_opp.profit_score
-            confidence = scored_opp.confidence_score / 100
+        max_position = self.position_sizer._max_pos
+        max_exposure = self._max_exposure
 
-            # Calculate position size
-            position_size = self.position_sizer.calculate_position_size(
-                profit_pct, confidence, remaining_capital
-            )
+        # Allocate to opportunities in order of score. Each size depends on the
+        # capital left by the previous ones, so only this recurrence is scalar.
+        for i, fraction in enumerate(fractions.tolist()):
+            if remaining_capital <= 0:
+                break
 
             # Don't exceed remaining capital or exposure limit
-            max_allowed = min(
-                remaining_capital, self.config.max_total_exposure - current_exposure
+            position_size = min(
+                remaining_capital * fraction,
+                max_position,
+                remaining_capital,
+                max_exposure - current_exposure,
             )
-            position_size = min(position_size, max_allowed)
 
             if position_size > 0:
                 allocation[i] = position_size
@@ -1,12 +1,125 @@
 """Risk management system."""
 
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+import heapq
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 from loguru import logger
 
 from ..config import Config
 from ..market.market_data import Position, Market
 
+# Row layout of the position table
+POSITION_DTYPE = np.dtype(
+    [
+        ("entry", np.float64),
+        ("inv_entry", np.float64),  # 1 / entry price
+        ("size", np.float64),
+        ("current", np.float64),
+        ("is_yes", np.bool_),
+    ],
+    align=True,
+)
+
+
+class _PositionTable:
+    """Structure-of-arrays copy of open positions for vectorized checks.
+
+    All numeric columns live in one structured array, so growing the table or
+    moving a row is a single copy. Rows are kept dense: removing a position
+    moves the last row into its slot, so checks never need a liveness mask.
+    """
+
+    def __init__(self, capacity: int = 64):
+        """Initialize an empty table.
+
+        Args:
+            capacity: Initial number of rows to allocate
+        """
+        self.ids: List[str] = []
+        self.market_ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.slab = np.zeros(capacity, dtype=POSITION_DTYPE)
+
+    def __len__(self) -> int:
+        """Number of positions in the table."""
+        return len(self.ids)
+
+    @property
+    def is_yes(self) -> np.ndarray:
+        """Whether each row holds the YES outcome."""
+        return self.slab["is_yes"]
+
+    @property
+    def entry(self) -> np.ndarray:
+        """Entry price of each row."""
+        return self.slab["entry"]
+
+    @property
+    def inv_entry(self) -> np.ndarray:
+        """Reciprocal entry price of each row (0 for a zero entry price)."""
+        return self.slab["inv_entry"]
+
+    @property
+    def size(self) -> np.ndarray:
+        """Size of each row."""
+        return self.slab["size"]
+
+    @property
+    def current(self) -> np.ndarray:
+        """Last known price of each row."""
+        return self.slab["current"]
+
+    def add(self, position: Position):
+        """Append a position, growing the slab when full.
+
+        Args:
+            position: Position to add
+        """
+        if position.position_id in self.rows:
+            self.remove(position.position_id)
+
+        row = len(self.ids)
+        if row == len(self.slab):
+            grown = np.zeros(2 * row, dtype=POSITION_DTYPE)
+            grown[:row] = self.slab
+            self.slab = grown
+
+        self.ids.append(position.position_id)
+        self.market_ids.append(position.market_id)
+        self.rows[position.position_id] = row
+        entry = position.entry_price
+        self.slab[row] = (
+            entry,
+            1.0 / entry if entry else 0.0,
+            position.size,
+            position.current_price,
+            position.is_yes,
+        )
+
+    def remove(self, position_id: str):
+        """Remove a position by moving the last row into its slot.
+
+        Args:
+            position_id: Position ID to remove
+        """
+        row = self.rows.pop(position_id, None)
+        if row is None:
+            return
+
+        last = len(self.ids) - 1
+        if row != last:
+            moved_id = self.ids[last]
+            self.ids[row] = moved_id
+            self.market_ids[row] = self.market_ids[last]
+            self.rows[moved_id] = row
+            self.slab[row] = self.slab[last]
+
+        self.ids.pop()
+        self.market_ids.pop()
+
 
 class RiskManager:
     """Manages risk across all trading positions."""
@@ -21,6 +134,17 @@ class RiskManager:
         self.positions: Dict[str, Position] = {}
         self.total_capital = config.initial_capital
         self.current_exposure = 0.0
+        self._stop_loss = config.stop_loss_percentage
+        self._table = _PositionTable()
+        # Running total of unrealized P&L over tracked positions
+        self._unrealized_pnl_sum = 0.0
+        # (expiry timestamp, position_id) min-heap for the max-age check
+        self._max_age_seconds = config.max_position_age_hours * 3600
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Positions already past max age but not yet removed
+        self._expired: Dict[str, None] = {}
+        # Open position count per market, for the diversification score
+        self._market_counts: Counter[str] = Counter()
 
     def can_open_position(self, position_size: float) -> tuple[bool, str]:
         """Check if a new position can be opened.
@@ -60,13 +184,56 @@ class RiskManager:
         Args:
             position: Position to track
         """
+        replaced = self.positions.get(position.position_id)
+        if replaced is not None:
+            # Same ID tracked already: drop the old position's exposure, P&L
+            # and market count so they are not counted twice
+            self._untrack(replaced)
+
         self.positions[position.position_id] = position
-        self.current_exposure += position.entry_price * position.size
+        self._table.add(position)
+        self._market_counts[position.market_id] += 1
+        self.current_exposure += position.notional
+        heapq.heappush(
+            self._expiry_heap,
+            (
+                position.entry_ts + self._max_age_seconds,
+                position.position_id,
+            ),
+        )
+        self._unrealized_pnl_sum += position.unrealized_pnl
+        # Template and args: loguru only formats when the level is enabled
         logger.info(
-            f"Added position {position.position_id}: {position.outcome} @ {position.entry_price:.3f}, "
-            f"Current exposure: ${self.current_exposure:.2f}"
+            "Added position {}: {} @ {:.3f}, Current exposure: ${:.2f}",
+            position.position_id,
+            position.outcome,
+            position.entry_price,
+            self.current_exposure,
         )
 
+    def _untrack(self, position: Position):
+        """Drop a tracked position and its share of the running totals.
+
+        Args:
+            position: Currently tracked position
+        """
+        position_id = position.position_id
+        self.current_exposure -= position.notional
+
+        # Drop the P&L this position contributed at its last tracked price
+        table = self._table
+        row = table.rows[position_id]
+        self._unrealized_pnl_sum -= (
+            table.current[row] - table.entry[row]
+        ) * table.size[row] - position.gas_costs
+
+        del self.positions[position_id]
+        self._market_counts[position.market_id] -= 1
+        if not self._market_counts[position.market_id]:
+            del self._market_counts[position.market_id]
+        self._expired.pop(position_id, None)
+        table.remove(position_id)
+
     def remove_position(self, position_id: str):
         """Remove a position from risk tracking.
 
@@ -75,15 +242,19 @@ class RiskManager:
         """
         if position_id in self.positions:
             position = self.positions[position_id]
-            self.current_exposure -= position.entry_price * position.size
 
             # Update capital with realized P&L
             if position.realized_pnl:
                 self.total_capital += position.realized_pnl
 
-            del self.positions[position_id]
+            self._untrack(position)
+            if not self.positions:
+                # Reset accumulated rounding drift
+                self._unrealized_pnl_sum = 0.0
             logger.info(
-                f"Removed position {position_id}, Current exposure: ${self.current_exposure:.2f}"
+                "Removed position {}, Current exposure: ${:.2f}",
+                position_id,
+                self.current_exposure,
             )
 
     def update_position_prices(self, market_prices: Dict[str, Market]):
@@ -92,13 +263,39 @@ class RiskManager:
         Args:
             market_prices: Dictionary mapping market_id to Market object
         """
-        for position in self.positions.values():
-            if position.market_id in market_prices:
-                market = market_prices[position.market_id]
-                if position.outcome == "YES":
-                    position.current_price = market.yes_price
-                else:
-                    position.current_price = market.no_price
+        table = self._table
+        n = len(table)
+        if n == 0:
+            return
+
+        # Gather both prices per row; NaN marks positions without a quote
+        yes = np.fromiter(
+            (
+                market_prices[m].yes_price if m in market_prices else np.nan
+                for m in table.market_ids
+            ),
+            dtype=np.float64,
+            count=n,
+        )
+        no = np.fromiter(
+            (
+                market_prices[m].no_price if m in market_prices else np.nan
+                for m in table.market_ids
+            ),
+            dtype=np.float64,
+            count=n,
+        )
+        new_prices = np.where(table.is_yes[:n], yes, no)
+
+        # Only rows with a quote that moved need writing back to the objects
+        current = table.current[:n]
+        changed = np.flatnonzero(~np.isnan(new_prices) & (new_prices != current))
+        self._unrealized_pnl_sum += float(
+            np.dot(new_prices[changed] - current[changed], table.size[:n][changed])
+        )
+        current[changed] = new_prices[changed]
+        for row, price in zip(changed.tolist(), new_prices[changed].tolist()):
+            self.positions[table.ids[row]].current_price = price
 
     def check_stop_losses(self) -> list[str]:
         """Check if any positions should be stopped out.
@@ -106,45 +303,62 @@ class RiskManager:
         Returns:
             List of position IDs that should be closed
         """
-        to_close = []
+        table = self._table
+        n = len(table)
+        if n == 0:
+            return []
+
+        # Multiply by the reciprocal cached at add time instead of dividing
+        current = table.current[:n]
+        loss_pct = (table.entry[:n] - current) * table.inv_entry[:n]
+        rows = np.flatnonzero((loss_pct > self._stop_loss) & (current > 0))
+        if rows.size == 0:
+            return []
 
-        for position_id, position in self.positions.items():
-            # Calculate loss percentage
-            if position.current_price > 0:
-                loss_pct = (
-                    position.entry_price - position.current_price
-                ) / position.entry_price
-
-                if loss_pct > self.config.stop_loss_percentage:
-                    logger.warning(
-                        f"Stop loss triggered for {position_id}: "
-                        f"loss {loss_pct*100:.2f}% > {self.config.stop_loss_percentage*100:.2f}%"
-                    )
-                    to_close.append(position_id)
+        to_close = []
+        for row in rows.tolist():
+            position_id = table.ids[row]
+            logger.warning(
+                "Stop loss triggered for {}: loss {:.2f}% > {:.2f}%",
+                position_id,
+                loss_pct[row] * 100,
+                self._stop_loss * 100,
+            )
+            to_close.append(position_id)
 
         return to_close
 
-    def check_position_age(self) -> list[str]:
+    def check_position_age(self, now: Optional[float] = None) -> list[str]:
         """Check if any positions are too old and should be closed.
 
+        Args:
+            now: Current Unix time, defaults to time.time()
+
         Returns:
             List of position IDs that should be closed
         """
-        to_close = []
-        max_age = timedelta(hours=self.config.max_position_age_hours)
-        now = datetime.now()
-
-        for position_id, position in self.positions.items():
-            age = now - position.entry_time
-
-            if age > max_age:
-                logger.warning(
-                    f"Position {position_id} exceeded max age: "
-                    f"{age.total_seconds()/3600:.1f}h > {self.config.max_position_age_hours}h"
-                )
-                to_close.append(position_id)
+        if now is None:
+            now = time.time()
+        heap = self._expiry_heap
+
+        # Only positions whose expiry has passed are popped; the rest of the
+        # heap is never touched
+        while heap and heap[0][0] < now:
+            expiry, position_id = heapq.heappop(heap)
+            position = self.positions.get(position_id)
+            if position is None or position.entry_ts + self._max_age_seconds != expiry:
+                continue  # Removed (or replaced) before expiring
+            age_hours = (now - expiry + self._max_age_seconds) / 3600
+            logger.warning(
+                "Position {} exceeded max age: {:.1f}h > {}h",
+                position_id,
+                age_hours,
+                self.config.max_position_age_hours,
+            )
+            self._expired[position_id] = None
 
-        return to_close
+        # Expired positions stay flagged until they are removed
+        return list(self._expired)
 
     def get_risk_metrics(self) -> Dict[str, float]:
         """Calculate current risk metrics.
@@ -152,7 +366,7 @@ class RiskManager:
         Returns:
             Dictionary of risk metrics
         """
-        total_unrealized_pnl = sum(p.unrealized_pnl for p in self.positions.values())
+        total_unrealized_pnl = self._unrealized_pnl_sum
 
         exposure_pct = (
             (self.current_exposure / self.total_capital * 100)
@@ -179,7 +393,7 @@ class RiskManager:
             return 100.0
 
         # Count unique markets
-        unique_markets = len(set(p.market_id for p in self.positions.values()))
+        unique_markets = len(self._market_counts)
 
         # More markets = better diversification
         score = min(unique_markets / 10 * 100, 100)
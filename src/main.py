@@ -1,12 +1,18 @@
 """Main entry point for Polymarket Arbitrage Bot."""
 
 import asyncio
+import copy
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
+from itertools import chain
+from typing import Any, Dict, Optional, Tuple
+
 from loguru import logger
 
 from .config import load_config
+from .market.market_data import Market, MarketUpdate
 from .market.polymarket_api import PolymarketAPIClient
 from .market.websocket_client import WebSocketClient
 from .arbitrage.detector import ArbitrageDetector
@@ -16,8 +22,7 @@ from .execution.executor import TradeExecutor
 from .execution.risk_manager import RiskManager
 from .analytics.logger import OpportunityLogger, ExecutionLogger
 from .analytics.performance import PerformanceTracker
-from .notifications.discord import DiscordNotifier
-from .notifications.telegram import TelegramNotifier
+from .notifications.hub import NotificationHub
 
 
 class PolymarketArbitrageBot:
@@ -52,12 +57,17 @@ class PolymarketArbitrageBot:
         self.performance_tracker = PerformanceTracker(self.config.initial_capital)
 
         # Notifications
-        self.discord = DiscordNotifier(self.config)
-        self.telegram = TelegramNotifier(self.config)
+        self.notifications = NotificationHub(self.config)
+        # (hub method name, args) pairs sent by a background worker
+        self._notify_queue: asyncio.Queue = asyncio.Queue()
+        self._notify_task: Optional[asyncio.Task] = None
 
         # State
         self.is_running = False
         self.markets = []
+        self._market_index: Dict[str, Market] = {}
+        self._tick_now = time.time()  # Wall clock sampled once per iteration
+        self._gas_cache: Optional[Tuple[float, float]] = None  # (fetched_at, gwei)
 
         logger.info("Polymarket Arbitrage Bot initialized")
         logger.info(f"Mode: {self.config.mode}")
@@ -65,25 +75,30 @@ class PolymarketArbitrageBot:
 
     def _setup_logging(self):
         """Setup logging configuration."""
-        # Remove default handler
-        logger.remove()
-
-        # Add console handler
-        logger.add(
-            sys.stdout,
-            level=self.config.log_level,
-            format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> | <level>{message}</level>",
-        )
-
-        # Add file handler
         log_dir = Path(self.config.log_file).parent
         log_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.add(
-            self.config.log_file,
-            level=self.config.log_level,
-            rotation=self.config.log_rotation,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function} | {message}",
+        # Replace all handlers in one step so no records are dropped between
+        # removing the default handler and adding ours
+        logger.configure(
+            handlers=[
+                # Console handler
+                {
+                    "sink": sys.stdout,
+                    "level": self.config.log_level,
+                    "format": "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> | <level>{message}</level>",
+                },
+                # File handler
+                {
+                    "sink": self.config.log_file,
+                    "level": self.config.log_level,
+                    "rotation": self.config.log_rotation,
+                    "format": "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function} | {message}",
+                    # Write from a background thread, off the event loop
+                    "enqueue": True,
+                    "diagnose": False,
+                },
+            ]
         )
 
     async def start(self):
@@ -91,6 +106,9 @@ class PolymarketArbitrageBot:
         self.is_running = True
         logger.info("Starting Polymarket Arbitrage Bot...")
 
+        # Deliver alerts off the opportunity-processing path
+        self._notify_task = asyncio.create_task(self._notify_worker())
+
         try:
             # Connect to API
             await self.api_client.connect()
@@ -111,8 +129,7 @@ class PolymarketArbitrageBot:
         except Exception as e:
             logger.error(f"Fatal error in main loop: {e}")
             if self.config.alert_on_errors:
-                self.discord.send_error_alert(f"Fatal error: {e}")
-                await self.telegram.send_error_alert(f"Fatal error: {e}")
+                await self.notifications.error(f"Fatal error: {e}")
         finally:
             await self.stop()
 
@@ -125,11 +142,16 @@ class PolymarketArbitrageBot:
         if self.ws_client:
             await self.ws_client.disconnect()
         await self.api_client.close()
+        self.detector.shutdown()
+        await self._stop_notify_worker()
 
         # Generate final report
-        self._generate_final_report()
+        await self._generate_final_report()
+        await self.notifications.aclose()
 
         logger.info("Bot stopped successfully")
+        # Wait for the file sink's background writer to drain
+        await logger.complete()
 
     async def _main_loop(self):
         """Main processing loop."""
@@ -137,6 +159,7 @@ class PolymarketArbitrageBot:
 
         while self.is_running:
             iteration += 1
+            self._tick_now = time.time()
             logger.info(f"Starting iteration {iteration}")
 
             try:
@@ -144,13 +167,13 @@ class PolymarketArbitrageBot:
                 await self._fetch_markets()
 
                 # Detect arbitrage opportunities
-                opportunities = self.detector.detect_opportunities(self.markets)
+                opportunities = await self._detect_opportunities()
 
                 if not opportunities:
                     logger.info("No opportunities detected in this iteration")
                 else:
                     # Filter profitable opportunities
-                    gas_price = await self.api_client.get_gas_price()
+                    gas_price = await self._cached_gas_price()
                     profitable = self.detector.filter_profitable_opportunities(
                         opportunities, gas_price
                     )
@@ -180,7 +203,39 @@ class PolymarketArbitrageBot:
             except Exception as e:
                 logger.error(f"Error in main loop iteration: {e}")
                 if self.config.alert_on_errors:
-                    self.discord.send_error_alert(f"Iteration error: {e}")
+                    self._notify("error", f"Iteration error: {e}")
+
+    async def _detect_opportunities(self) -> list:
+        """Run detection in a worker thread on a snapshot of the markets.
+
+        The event loop keeps servicing WebSocket updates while detection
+        runs, and those updates change the live Market objects one field at
+        a time. Copying the markets first means detection only ever sees
+        prices from a single instant, and the opportunities it returns keep
+        the prices they were detected at.
+
+        Returns:
+            Detected opportunities
+        """
+        snapshot = [copy.copy(market) for market in self.markets]
+        return await asyncio.to_thread(self.detector.detect_opportunities, snapshot)
+
+    async def _cached_gas_price(self) -> float:
+        """Get the gas price, reusing a recent value within gas_cache_ttl.
+
+        Returns:
+            Gas price in gwei
+        """
+        now = time.monotonic()
+        if (
+            self._gas_cache is not None
+            and now - self._gas_cache[0] < self.config.gas_cache_ttl
+        ):
+            return self._gas_cache[1]
+
+        gas_price = await self.api_client.get_gas_price()
+        self._gas_cache = (now, gas_price)
+        return gas_price
 
     async def _fetch_markets(self):
         """Fetch current market data."""
@@ -191,20 +246,41 @@ class PolymarketArbitrageBot:
                 isinstance(self.config.markets_to_monitor, str)
                 and self.config.markets_to_monitor == "all"
             ):
-                self.markets = await self.api_client.get_markets(limit=markets_to_fetch)
+                markets = await self.api_client.get_markets(limit=markets_to_fetch)
             elif isinstance(self.config.markets_to_monitor, list):
-                all_markets = []
-                for category in self.config.markets_to_monitor:
-                    markets = await self.api_client.get_markets(
-                        category=category,
-                        limit=markets_to_fetch // len(self.config.markets_to_monitor),
-                    )
-                    all_markets.extend(markets)
-                self.markets = all_markets
+                categories = self.config.markets_to_monitor
+                per_category = markets_to_fetch // len(categories)
+                semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
+
+                async def fetch_category(category: str) -> list:
+                    async with semaphore:
+                        return await self.api_client.get_markets(
+                            category=category, limit=per_category
+                        )
+
+                # Fetch all categories concurrently, bounded by the semaphore
+                results = await asyncio.gather(
+                    *(fetch_category(category) for category in categories),
+                    return_exceptions=True,
+                )
+
+                markets = []
+                for category, result in zip(categories, results):
+                    if isinstance(result, Exception):
+                        logger.error(
+                            f"Error fetching markets for category {category}: {result}"
+                        )
+                        continue
+                    markets.extend(result)
             else:
-                self.markets = await self.api_client.get_markets(limit=markets_to_fetch)
+                markets = await self.api_client.get_markets(limit=markets_to_fetch)
 
-            logger.debug(f"Fetched {len(self.markets)} markets")
+            # Build the new snapshot privately, then publish list and index
+            # together; readers holding the old list are unaffected
+            market_index = {m.market_id: m for m in markets}
+            self.markets, self._market_index = markets, market_index
+
+            logger.debug("Fetched {} markets", len(self.markets))
 
         except Exception as e:
             logger.error(f"Error fetching markets: {e}")
@@ -229,8 +305,7 @@ class PolymarketArbitrageBot:
 
             # Send alert
             if self.config.alert_on_opportunities:
-                self.discord.send_opportunity_alert(scored_opp, position_size)
-                await self.telegram.send_opportunity_alert(scored_opp, position_size)
+                self._notify("opportunity", scored_opp, position_size)
 
             # Execute if in auto-trade mode
             if self.config.mode == "auto_trade":
@@ -251,28 +326,65 @@ class PolymarketArbitrageBot:
                         # Send execution alert
                         if self.config.alert_on_executions:
                             net_profit = sum(t.net_amount for t in trades)
-                            self.discord.send_execution_alert(trades, net_profit)
-                            await self.telegram.send_execution_alert(trades, net_profit)
+                            self._notify("execution", trades, net_profit)
                 else:
                     logger.warning(f"Cannot open position: {reason}")
 
+    def _notify(self, method: str, *args: Any):
+        """Queue a notification for Discord and Telegram without waiting.
+
+        Args:
+            method: Name of the NotificationHub method to call
+            *args: Arguments for the hub method
+        """
+        self._notify_queue.put_nowait((method, args))
+
+    async def _notify_worker(self):
+        """Send queued notifications to Discord and Telegram concurrently."""
+        while True:
+            method, args = await self._notify_queue.get()
+            try:
+                await getattr(self.notifications, method)(*args)
+            except Exception as e:
+                logger.error(f"Error sending notification {method}: {e}")
+            finally:
+                self._notify_queue.task_done()
+
+    async def _stop_notify_worker(self, timeout: float = 5.0):
+        """Flush pending notifications and stop the worker.
+
+        Args:
+            timeout: Seconds to wait for queued notifications to be sent
+        """
+        if self._notify_task is None:
+            return
+
+        try:
+            await asyncio.wait_for(self._notify_queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Dropping {self._notify_queue.qsize()} unsent notifications"
+            )
+
+        self._notify_task.cancel()
+        self._notify_task = None
+
     async def _manage_positions(self):
         """Manage existing positions (stop losses, profit taking)."""
         if self.config.mode != "auto_trade":
             return
 
         # Update position prices
-        market_prices = {m.market_id: m for m in self.markets}
-        self.risk_manager.update_position_prices(market_prices)
+        self.risk_manager.update_position_prices(self._market_index)
 
         # Check stop losses
         to_close_sl = self.risk_manager.check_stop_losses()
 
         # Check position age
-        to_close_age = self.risk_manager.check_position_age()
+        to_close_age = self.risk_manager.check_position_age(self._tick_now)
 
         # Close positions
-        for position_id in set(to_close_sl + to_close_age):
+        for position_id in set(chain(to_close_sl, to_close_age)):
             # In production, this would execute closing trades
             logger.info(f"Closing position {position_id}")
             # self.risk_manager.remove_position(position_id)
@@ -289,37 +401,39 @@ class PolymarketArbitrageBot:
             f"Open Positions: {risk_metrics['open_positions']}"
         )
 
-    def _generate_final_report(self):
+    async def _generate_final_report(self):
         """Generate and log final performance report."""
         report = self.performance_tracker.generate_report()
         logger.info("\n" + report)
 
         # Send performance report
         metrics = self.performance_tracker.calculate_metrics().to_dict()
-        self.discord.send_performance_report(metrics)
-
-        # Note: Telegram is async, so we can't easily call it here
-        # In production, you'd want to handle this better
+        await self.notifications.performance(metrics)
 
-    async def _on_market_update(self, update: dict):
+    async def _on_market_update(self, update: MarketUpdate):
         """Handle real-time market update from WebSocket.
 
         Args:
             update: Market update data
         """
         # Update market in our list
-        market_id = update.get("market_id")
-
-        for i, market in enumerate(self.markets):
-            if market.market_id == market_id:
-                # Update prices
-                market.yes_price = update.get("yes_price", market.yes_price)
-                market.no_price = update.get("no_price", market.no_price)
-                market.yes_bid = update.get("yes_bid", market.yes_bid)
-                market.yes_ask = update.get("yes_ask", market.yes_ask)
-                market.no_bid = update.get("no_bid", market.no_bid)
-                market.no_ask = update.get("no_ask", market.no_ask)
-                break
+        market = self._market_index.get(update.market_id)
+        if market is None:
+            return
+
+        # Update prices the message carried
+        if update.yes_price is not None:
+            market.yes_price = update.yes_price
+        if update.no_price is not None:
+            market.no_price = update.no_price
+        if update.yes_bid is not None:
+            market.yes_bid = update.yes_bid
+        if update.yes_ask is not None:
+            market.yes_ask = update.yes_ask
+        if update.no_bid is not None:
+            market.no_bid = update.no_bid
+        if update.no_ask is not None:
+            market.no_ask = update.no_ask
 
 
 async def main():
@@ -2,6 +2,7 @@
 
 from .market_data import (
     Market,
+    MarketArrayView,
     MarketStatus,
     OrderBook,
     Trade,
@@ -12,6 +13,7 @@ from .market_data import (
 
 __all__ = [
     "Market",
+    "MarketArrayView",
     "MarketStatus",
     "OrderBook",
     "Trade",
@@ -1,35 +1,45 @@
 """Market data models and structures."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
-from typing import Optional, Dict, Any
+from enum import IntEnum
+from operator import itemgetter
+from typing import Optional, Dict, Any, List
 
+import numpy as np
+import orjson
 
-class MarketStatus(Enum):
+
+class MarketStatus(IntEnum):
     """Market status enumeration."""
 
-    ACTIVE = "active"
-    CLOSED = "closed"
-    RESOLVED = "resolved"
-    SUSPENDED = "suspended"
+    ACTIVE = 0
+    CLOSED = 1
+    RESOLVED = 2
+    SUSPENDED = 3
+
+    @property
+    def label(self) -> str:
+        """Lowercase status name used in serialized output."""
+        return self.name.lower()
 
 
-class OrderSide(Enum):
+class OrderSide(IntEnum):
     """Order side enumeration."""
 
-    BUY = "BUY"
-    SELL = "SELL"
+    BUY = 0
+    SELL = 1
 
 
-class OrderType(Enum):
+class OrderType(IntEnum):
     """Order type enumeration."""
 
-    MARKET = "MARKET"
-    LIMIT = "LIMIT"
+    MARKET = 0
+    LIMIT = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Market:
     """Represents a Polymarket market."""
 
@@ -48,6 +58,14 @@ class Market:
     volume_24h: float
     liquidity: float
     metadata: Dict[str, Any] = field(default_factory=dict)
+    end_ts: float = field(init=False, repr=False)  # end_date as Unix seconds
+
+    def __post_init__(self):
+        """Intern the market ID and cache the resolution time."""
+        # IDs are repeated across markets, positions and trades and used as
+        # dict/set keys; interning shares one string and speeds up equality
+        self.market_id = sys.intern(self.market_id)
+        self.end_ts = self.end_date.timestamp()
 
     @property
     def spread(self) -> float:
@@ -67,7 +85,7 @@ class Market:
             "description": self.description,
             "category": self.category,
             "end_date": self.end_date.isoformat(),
-            "status": self.status.value,
+            "status": self.status.label,
             "yes_price": self.yes_price,
             "no_price": self.no_price,
             "yes_bid": self.yes_bid,
@@ -79,26 +97,103 @@ class Market:
             "metadata": self.metadata,
         }
 
+    def to_json(self) -> bytes:
+        """Serialize the market to UTF-8 JSON bytes."""
+        return orjson.dumps(self.to_dict())
+
 
 @dataclass
+class MarketArrayView:
+    """Structure-of-arrays snapshot of a market list.
+
+    Built once per detection tick so that vectorized strategies can share a
+    single pass over the market objects instead of each re-reading the same
+    attributes.
+    """
+
+    markets: List[Market]
+    market_ids: List[str]
+    yes_bid: np.ndarray
+    yes_ask: np.ndarray
+    no_bid: np.ndarray
+    no_ask: np.ndarray
+    liquidity: np.ndarray
+    end_ts: np.ndarray
+
+    @classmethod
+    def from_markets(cls, markets: List[Market]) -> "MarketArrayView":
+        """Build a view over the given markets.
+
+        Args:
+            markets: List of markets
+
+        Returns:
+            MarketArrayView with one row per market
+        """
+        n = len(markets)
+
+        def column(attr: str) -> np.ndarray:
+            return np.fromiter(
+                (getattr(m, attr) for m in markets), dtype=np.float64, count=n
+            )
+
+        return cls(
+            markets=markets,
+            market_ids=[m.market_id for m in markets],
+            yes_bid=column("yes_bid"),
+            yes_ask=column("yes_ask"),
+            no_bid=column("no_bid"),
+            no_ask=column("no_ask"),
+            liquidity=column("liquidity"),
+            end_ts=column("end_ts"),
+        )
+
+    def __len__(self) -> int:
+        """Number of markets in the view."""
+        return len(self.markets)
+
+
+@dataclass(slots=True, frozen=True)
+class MarketUpdate:
+    """Real-time price update for a market received over the WebSocket.
+
+    Prices missing from the message are ``None``.
+    """
+
+    market_id: str
+    yes_price: Optional[float]
+    no_price: Optional[float]
+    yes_bid: Optional[float]
+    yes_ask: Optional[float]
+    no_bid: Optional[float]
+    no_ask: Optional[float]
+    timestamp: float  # Unix seconds when the update was received
+
+
+@dataclass(slots=True)
 class OrderBook:
     """Order book for a market outcome."""
 
     market_id: str
     outcome: str  # "YES" or "NO"
-    bids: list[tuple[float, float]]  # [(price, size), ...]
-    asks: list[tuple[float, float]]  # [(price, size), ...]
+    bids: list[tuple[float, float]]  # [(price, size), ...], highest price first
+    asks: list[tuple[float, float]]  # [(price, size), ...], lowest price first
     timestamp: datetime = field(default_factory=datetime.now)
 
+    def __post_init__(self):
+        """Sort both sides so the top of book is the first level."""
+        self.bids.sort(key=itemgetter(0), reverse=True)
+        self.asks.sort(key=itemgetter(0))
+
     @property
     def best_bid(self) -> Optional[tuple[float, float]]:
         """Get best bid (highest price)."""
-        return max(self.bids, key=lambda x: x[0]) if self.bids else None
+        return self.bids[0] if self.bids else None
 
     @property
     def best_ask(self) -> Optional[tuple[float, float]]:
         """Get best ask (lowest price)."""
-        return min(self.asks, key=lambda x: x[0]) if self.asks else None
+        return self.asks[0] if self.asks else None
 
     @property
     def mid_price(self) -> Optional[float]:
@@ -110,7 +205,7 @@ class OrderBook:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """Represents a trade execution."""
 
@@ -123,6 +218,10 @@ class Trade:
     timestamp: datetime
     gas_cost: float = 0.0
 
+    def __post_init__(self):
+        """Intern the market ID."""
+        self.market_id = sys.intern(self.market_id)
+
     @property
     def total_cost(self) -> float:
         """Total cost including gas."""
@@ -137,7 +236,7 @@ class Trade:
             return self.price * self.size
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Represents a trading position."""
 
@@ -152,6 +251,17 @@ class Position:
     exit_time: Optional[datetime] = None
     realized_pnl: Optional[float] = None
     gas_costs: float = 0.0
+    notional: float = field(init=False, repr=False)  # entry_price * size
+    entry_ts: float = field(init=False, repr=False)  # entry_time as Unix seconds
+    is_yes: bool = field(init=False, repr=False)  # outcome == "YES"
+
+    def __post_init__(self):
+        """Intern the IDs and cache values derived from the entry fields."""
+        self.position_id = sys.intern(self.position_id)
+        self.market_id = sys.intern(self.market_id)
+        self.notional = self.entry_price * self.size
+        self.entry_ts = self.entry_time.timestamp()
+        self.is_yes = self.outcome == "YES"
 
     @property
     def unrealized_pnl(self) -> float:
@@ -9,14 +9,133 @@ Authentication is optional for read-only endpoints.
 """
 
 import asyncio
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from loguru import logger
 import aiohttp
+import orjson
 
+from .. import __version__
 from ..config import Config
 from .market_data import Market, MarketStatus, OrderBook
 
+# Prefer the C ISO 8601 parser when available; Python 3.11+ fromisoformat
+# accepts the trailing "Z" used by the Gamma API as well
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = datetime.fromisoformat
+
+# Seconds a fetched order book or token price is served from cache
+_BOOK_CACHE_TTL = 1.0
+_PRICE_CACHE_TTL = 5.0
+# Maximum number of entries kept in each response cache
+_RESPONSE_CACHE_SIZE = 4096
+# Decimal numbers as sent by the Gamma API, e.g. "145000", "0.62", ".5" or
+# "5.", with the surrounding whitespace float() also accepts
+_NUM_RE = re.compile(r"\s*-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*")
+# CLOB token IDs (large decimal integers in practice)
+_TOKEN_ID_RE = re.compile(r"[\w-]+", re.ASCII)
+# Headers for unauthenticated requests; shared, never mutated
+_NO_HEADERS: Dict[str, str] = {}
+
+
+def _first(data: Dict[str, Any], *keys: str, default: Any = None) -> Any:
+    """Return the value of the first key present in ``data``.
+
+    Equivalent to nested ``data.get(a, data.get(b, default))`` calls, but
+    later keys are only looked up when the earlier ones are missing.
+
+    Args:
+        data: Mapping to read from
+        *keys: Candidate keys in order of preference
+        default: Value returned when none of the keys are present
+
+    Returns:
+        The first present value, or ``default``
+    """
+    for key in keys:
+        if key in data:
+            return data[key]
+    return default
+
+
+def _to_float(value: Any, default: float = 0.0) -> float:
+    """Convert a Gamma numeric field, falling back to a default.
+
+    Malformed strings are rejected by a regex check rather than by catching
+    the ``ValueError`` from ``float()``.
+
+    Args:
+        value: Number, numeric string or anything else
+        default: Value for missing or malformed input
+
+    Returns:
+        Parsed float or ``default``
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str) and _NUM_RE.fullmatch(value):
+        return float(value)
+    return default
+
+
+def _json_list(value: Any) -> list:
+    """Return a list field that Gamma may send JSON-encoded as a string.
+
+    Args:
+        value: List, JSON array string or anything else
+
+    Returns:
+        The list, or an empty list when it cannot be decoded
+    """
+    if isinstance(value, str):
+        try:
+            value = orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return []
+    return value if isinstance(value, list) else []
+
+
+class TokenBucket:
+    """Async token-bucket rate limiter.
+
+    Up to ``capacity`` requests may go out back-to-back; after that requests
+    are admitted at ``rate`` per second.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of stored tokens
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.last) * self.rate
+            )
+            self.last = now
+            if self.tokens < 1:
+                # Sleep while holding the lock so waiters are served in order
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 0.0
+                self.last = time.monotonic()
+            else:
+                self.tokens -= 1
+
 
 class PolymarketAPIClient:
     """Client for interacting with Polymarket API."""
@@ -35,9 +154,18 @@ class PolymarketAPIClient:
         self.session: Optional[aiohttp.ClientSession] = None
         self.api_key = config.polymarket_api_key
         self.secret = config.polymarket_secret
+        # Built once rather than per authenticated request
+        self._auth_headers = (
+            {"Authorization": f"Bearer {self.api_key}"} if self.api_key else _NO_HEADERS
+        )
         # Rate limiting
-        self._last_request_time = 0
-        self._min_request_interval = 0.1  # 100ms between requests
+        self._bucket = TokenBucket(config.api_rate_limit, config.api_burst)
+        # token_id -> (fetch time, order book), plus fetches in progress
+        self._book_cache: OrderedDict = OrderedDict()
+        self._book_inflight: Dict[str, asyncio.Future] = {}
+        # (token_id, side) -> (fetch time, price), plus fetches in progress
+        self._price_cache: OrderedDict = OrderedDict()
+        self._price_inflight: Dict[tuple, asyncio.Future] = {}
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -52,7 +180,20 @@ class PolymarketAPIClient:
         """Establish connection to the API."""
         if self.session is None:
             timeout = aiohttp.ClientTimeout(total=self.config.api_timeout)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            # Keep connections to the Gamma and CLOB hosts alive across
+            # request batches and cache their DNS lookups
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            )
+            self.session = aiohttp.ClientSession(
+                timeout=timeout,
+                connector=connector,
+                headers={"User-Agent": f"polymarket-arbitrage-bot/{__version__}"},
+                json_serialize=lambda obj: orjson.dumps(obj).decode(),
+            )
             logger.info("Connected to Polymarket API")
 
     async def close(self):
@@ -64,11 +205,7 @@ class PolymarketAPIClient:
 
     async def _rate_limit(self):
         """Implement rate limiting to avoid overwhelming the API."""
-        current_time = asyncio.get_event_loop().time()
-        time_since_last = current_time - self._last_request_time
-        if time_since_last < self._min_request_interval:
-            await asyncio.sleep(self._min_request_interval - time_since_last)
-        self._last_request_time = asyncio.get_event_loop().time()
+        await self._bucket.acquire()
 
     async def _request(
         self,
@@ -86,7 +223,7 @@ class PolymarketAPIClient:
             url: Full URL to request
             params: Query parameters
             data: Request body data
-            retry_count: Current retry attempt
+            retry_count: Number of attempts already made
             use_auth: Whether to include API key authentication
 
         Returns:
@@ -95,36 +232,91 @@ class PolymarketAPIClient:
         if self.session is None:
             await self.connect()
 
-        # Rate limiting
-        await self._rate_limit()
+        headers = self._auth_headers if use_auth else _NO_HEADERS
+        attempt = retry_count
 
-        headers = {}
-        if use_auth and self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
+        while True:
+            # Rate limiting
+            await self._rate_limit()
 
-        try:
-            async with self.session.request(
-                method, url, params=params, json=data, headers=headers
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
-
-        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-            if retry_count < self.config.api_retry_attempts:
-                wait_time = 2**retry_count  # Exponential backoff
+            try:
+                async with self.session.request(
+                    method, url, params=params, json=data, headers=headers
+                ) as response:
+                    response.raise_for_status()
+                    return orjson.loads(await response.read())
+
+            # A non-JSON body (an HTML error page, an empty 200) is treated
+            # like a transport failure and retried
+            except (
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+                orjson.JSONDecodeError,
+            ) as e:
+                if attempt >= self.config.api_retry_attempts:
+                    logger.error(
+                        f"API request failed after {attempt + 1} attempts: {e}"
+                    )
+                    raise
+                wait_time = 1 << attempt  # Exponential backoff
                 logger.warning(
-                    f"API request failed (attempt {retry_count + 1}): {e}. "
+                    f"API request failed (attempt {attempt + 1}): {e}. "
                     f"Retrying in {wait_time}s..."
                 )
                 await asyncio.sleep(wait_time)
-                return await self._request(
-                    method, url, params, data, retry_count + 1, use_auth
-                )
-            else:
-                logger.error(
-                    f"API request failed after {retry_count + 1} attempts: {e}"
-                )
-                raise
+                attempt += 1
+
+    async def _cached_fetch(
+        self,
+        cache: OrderedDict,
+        inflight: Dict[Any, asyncio.Future],
+        key: Any,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return a recent cached value or fetch it, sharing concurrent fetches.
+
+        Callers asking for a key that is already being fetched wait on that
+        fetch instead of issuing their own request. ``None`` results are
+        returned but not cached.
+
+        Args:
+            cache: LRU cache of key -> (fetch time, value)
+            inflight: Futures of the fetches currently in progress
+            key: Cache key
+            ttl: Seconds a cached value stays fresh
+            fetch: Coroutine function performing the request
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            cache.move_to_end(key)
+            return entry[1]
+
+        pending = inflight.get(key)
+        if pending is not None:
+            # Shield so a cancelled waiter does not cancel the shared fetch
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        inflight[key] = future
+        try:
+            value = await fetch()
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del inflight[key]
+        future.set_result(value)
+
+        if value is not None:
+            cache[key] = (time.monotonic(), value)
+            cache.move_to_end(key)
+            if len(cache) > _RESPONSE_CACHE_SIZE:
+                cache.popitem(last=False)
+        return value
 
     async def get_markets(
         self, category: Optional[str] = None, limit: int = 100, active: bool = True
@@ -159,35 +351,52 @@ class PolymarketAPIClient:
             markets_data = (
                 response
                 if isinstance(response, list)
-                else response.get("data", response.get("markets", []))
+                else _first(response, "data", "markets", default=[])
             )
 
             logger.info(f"Received {len(markets_data)} markets from Gamma API")
 
+            # Parse every listing first (pure CPU), then price them from the
+            # CLOB concurrently, bounded so the fan-out does not flood the API
+            fallback_end_date = datetime.now()  # Shared by the whole batch
+            batch = markets_data[:limit]  # Ensure we don't exceed limit
+            parsed = [
+                market
+                for market_data in batch
+                if (market := self._parse_market(market_data, fallback_end_date))
+            ]
+
+            semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
+
+            async def enrich(market: Market) -> Market:
+                async with semaphore:
+                    return await self._enrich_with_clob(
+                        market, market.metadata["token_ids"]
+                    )
+
+            results = await asyncio.gather(
+                *(enrich(market) for market in parsed), return_exceptions=True
+            )
+
             markets = []
-            for market_data in markets_data[:limit]:  # Ensure we don't exceed limit
-                try:
-                    market = await self._parse_market_with_prices(market_data)
-                    if market:
-                        markets.append(market)
-                except Exception as e:
-                    market_id = market_data.get(
-                        "conditionId",
-                        market_data.get(
-                            "condition_id", market_data.get("id", "unknown")
-                        ),
+            for market, result in zip(parsed, results):
+                if isinstance(result, Exception):
+                    logger.warning(
+                        f"Failed to price market {market.market_id}: {result}"
                     )
-                    logger.warning(f"Failed to parse market {market_id}: {e}")
-                    continue
+                else:
+                    markets.append(result)
 
             logger.info(f"Successfully parsed {len(markets)} markets with price data")
 
             # Log sample market data for debugging
             if markets:
                 sample = markets[0]
-                logger.debug(
-                    f"Sample market: {sample.question[:50]}... | "
-                    f"YES: {sample.yes_price:.3f} | NO: {sample.no_price:.3f}"
+                logger.opt(lazy=True).debug(
+                    "Sample market: {}... | YES: {:.3f} | NO: {:.3f}",
+                    lambda: sample.question[:50],
+                    lambda: sample.yes_price,
+                    lambda: sample.no_price,
                 )
 
             return markets
@@ -196,11 +405,15 @@ class PolymarketAPIClient:
             logger.error(f"Error fetching markets: {e}", exc_info=True)
             return []
 
-    async def get_market(self, market_id: str) -> Optional[Market]:
+    async def get_market(
+        self, market_id: str, with_prices: bool = True
+    ) -> Optional[Market]:
         """Fetch a specific market by ID from Gamma API.
 
         Args:
             market_id: Market identifier
+            with_prices: Whether to fetch real-time prices from the CLOB API;
+                otherwise Gamma's outcome prices are used
 
         Returns:
             Market object or None if not found
@@ -208,6 +421,8 @@ class PolymarketAPIClient:
         try:
             url = f"{self.gamma_url}/markets/{market_id}"
             response = await self._request("GET", url)
+            if not with_prices:
+                return self._parse_market(response)
             return await self._parse_market_with_prices(response)
 
         except Exception as e:
@@ -219,10 +434,31 @@ class PolymarketAPIClient:
     ) -> Optional[float]:
         """Get current price for a token from CLOB API.
 
+        Prices are cached for a few seconds and concurrent requests for the
+        same token and side share one HTTP call.
+
         Args:
             token_id: Token identifier (from market's clobTokenIds)
             side: BUY or SELL
 
+        Returns:
+            Current price or None if unavailable
+        """
+        return await self._cached_fetch(
+            self._price_cache,
+            self._price_inflight,
+            (token_id, side),
+            _PRICE_CACHE_TTL,
+            lambda: self._fetch_token_price(token_id, side),
+        )
+
+    async def _fetch_token_price(self, token_id: str, side: str) -> Optional[float]:
+        """Request the current price for a token, bypassing the cache.
+
+        Args:
+            token_id: Token identifier
+            side: BUY or SELL
+
         Returns:
             Current price or None if unavailable
         """
@@ -232,16 +468,36 @@ class PolymarketAPIClient:
             response = await self._request("GET", url, params=params)
 
             # Response format: {"price": "0.52"} or similar
-            price_str = response.get("price", response.get("mid", "0"))
+            price_str = _first(response, "price", "mid", default="0")
             return float(price_str) if price_str else None
 
         except Exception as e:
-            logger.debug(f"Error fetching price for token {token_id}: {e}")
+            logger.debug("Error fetching price for token {}: {}", token_id, e)
             return None
 
     async def get_order_book(self, token_id: str) -> Optional[OrderBook]:
         """Fetch order book for a token from CLOB API.
 
+        Books are cached for about a second and concurrent requests for the
+        same token share one HTTP call.
+
+        Args:
+            token_id: Token identifier
+
+        Returns:
+            OrderBook object or None if not found
+        """
+        return await self._cached_fetch(
+            self._book_cache,
+            self._book_inflight,
+            token_id,
+            _BOOK_CACHE_TTL,
+            lambda: self._fetch_order_book(token_id),
+        )
+
+    async def _fetch_order_book(self, token_id: str) -> Optional[OrderBook]:
+        """Request the order book for a token, bypassing the cache.
+
         Args:
             token_id: Token identifier
 
@@ -277,24 +533,46 @@ class PolymarketAPIClient:
             )
 
         except Exception as e:
-            logger.debug(f"Error fetching order book for token {token_id}: {e}")
+            logger.debug("Error fetching order book for token {}: {}", token_id, e)
             return None
 
-    async def _parse_market_with_prices(self, data: Dict[str, Any]) -> Optional[Market]:
+    async def _parse_market_with_prices(
+        self, data: Dict[str, Any], fallback_end_date: Optional[datetime] = None
+    ) -> Optional[Market]:
         """Parse market data from Gamma API and enrich with CLOB API prices.
 
         Args:
             data: Raw market data from Gamma API
+            fallback_end_date: End date for markets without a parseable one
+                (defaults to the current time)
 
         Returns:
             Market object with real-time prices or None if parsing fails
         """
+        market = self._parse_market(data, fallback_end_date)
+        if market is None:
+            return None
+        return await self._enrich_with_clob(market, market.metadata["token_ids"])
+
+    def _parse_market(
+        self, data: Dict[str, Any], fallback_end_date: Optional[datetime] = None
+    ) -> Optional[Market]:
+        """Parse market data from Gamma API without contacting the CLOB.
+
+        Prices come from Gamma's outcome prices with an estimated spread.
+
+        Args:
+            data: Raw market data from Gamma API
+            fallback_end_date: End date for markets without a parseable one
+                (defaults to the current time)
+
+        Returns:
+            Market object, or None if the market is inactive or parsing fails
+        """
         try:
             # Extract basic market information from Gamma API response
-            condition_id = data.get(
-                "conditionId", data.get("condition_id", data.get("id", ""))
-            )
-            question = data.get("question", data.get("title", "Unknown Market"))
+            condition_id = _first(data, "conditionId", "condition_id", "id", default="")
+            question = _first(data, "question", "title", default="Unknown Market")
             description = data.get("description", "")
 
             # Get category/tags
@@ -306,7 +584,7 @@ class PolymarketAPIClient:
             # Get market status
             is_closed = data.get("closed", False)
             is_resolved = data.get("resolved", False)
-            accepting_orders = data.get("accepting_orders", data.get("active", True))
+            accepting_orders = _first(data, "accepting_orders", "active", default=True)
 
             if is_resolved:
                 status = MarketStatus.RESOLVED
@@ -320,24 +598,30 @@ class PolymarketAPIClient:
                 return None
 
             # Get end date
-            end_date_str = data.get(
-                "endDate", data.get("end_date", data.get("endTime", ""))
-            )
-            try:
-                end_date = datetime.fromisoformat(end_date_str.replace("Z", "+00:00"))
-            except (ValueError, TypeError):
-                end_date = datetime.now()
+            end_date_str = _first(data, "endDate", "end_date", "endTime")
+            end_date = None
+            # Only attempt a parse when there is a string to parse, so markets
+            # without an end date never go through the exception path
+            if end_date_str and isinstance(end_date_str, str):
+                try:
+                    end_date = _parse_datetime(end_date_str)
+                except ValueError:
+                    pass
+            if end_date is None:
+                end_date = fallback_end_date or datetime.now()
 
             # Get volume and liquidity
-            volume_24h = float(
-                data.get("volume24hr", data.get("volume", data.get("volumeUsd", 0)))
-            )
-            liquidity = float(data.get("liquidity", data.get("liquidityUsd", 0)))
+            volume_24h = _to_float(_first(data, "volume24hr", "volume", "volumeUsd"))
+            liquidity = _to_float(_first(data, "liquidity", "liquidityUsd"))
 
-            # Get token IDs for price lookup
-            token_ids = data.get("clobTokenIds", data.get("tokens", []))
+            # Get token IDs for price lookup; malformed IDs disable CLOB pricing
+            token_ids = _json_list(_first(data, "clobTokenIds", "tokens"))
+            if not all(
+                isinstance(t, str) and _TOKEN_ID_RE.fullmatch(t) for t in token_ids
+            ):
+                token_ids = []
 
-            # Initialize prices
+            # Default prices
             yes_price = 0.5
             no_price = 0.5
             yes_bid = 0.48
@@ -345,45 +629,21 @@ class PolymarketAPIClient:
             no_bid = 0.48
             no_ask = 0.52
 
-            # Try to get real-time prices from CLOB API if we have token IDs
-            prices_from_clob = False
-            if token_ids and len(token_ids) >= 2:
-                # First token is typically YES, second is NO
-                yes_token_id = token_ids[0]
-                no_token_id = token_ids[1]
-
-                try:
-                    # Get order books for both outcomes
-                    yes_book = await self.get_order_book(yes_token_id)
-                    no_book = await self.get_order_book(no_token_id)
-
-                    if yes_book and yes_book.best_bid and yes_book.best_ask:
-                        yes_bid = yes_book.best_bid[0]
-                        yes_ask = yes_book.best_ask[0]
-                        yes_price = (yes_bid + yes_ask) / 2
-                        prices_from_clob = True
-
-                    if no_book and no_book.best_bid and no_book.best_ask:
-                        no_bid = no_book.best_bid[0]
-                        no_ask = no_book.best_ask[0]
-                        no_price = (no_bid + no_ask) / 2
-                        prices_from_clob = True
-
-                except Exception as e:
-                    logger.debug(f"Could not fetch CLOB prices for {condition_id}: {e}")
-
-            # Fall back to Gamma API prices if CLOB prices unavailable
-            if not prices_from_clob:
-                outcome_prices = data.get("outcomePrices", data.get("prices", []))
-                if outcome_prices and len(outcome_prices) >= 2:
-                    yes_price = float(outcome_prices[0]) if outcome_prices[0] else 0.5
-                    no_price = float(outcome_prices[1]) if outcome_prices[1] else 0.5
-                    # Estimate bid/ask spread
-                    spread = 0.04
-                    yes_bid = max(0.01, yes_price - spread / 2)
-                    yes_ask = min(0.99, yes_price + spread / 2)
-                    no_bid = max(0.01, no_price - spread / 2)
-                    no_ask = min(0.99, no_price + spread / 2)
+            # Gamma API prices, used unless the CLOB provides better ones
+            outcome_prices = _json_list(_first(data, "outcomePrices", "prices"))
+            if len(outcome_prices) >= 2:
+                yes_price = (
+                    _to_float(outcome_prices[0], 0.5) if outcome_prices[0] else 0.5
+                )
+                no_price = (
+                    _to_float(outcome_prices[1], 0.5) if outcome_prices[1] else 0.5
+                )
+                # Estimate bid/ask spread
+                spread = 0.04
+                yes_bid = max(0.01, yes_price - spread / 2)
+                yes_ask = min(0.99, yes_price + spread / 2)
+                no_bid = max(0.01, no_price - spread / 2)
+                no_ask = min(0.99, no_price + spread / 2)
 
             # Create Market object
             return Market(
@@ -401,14 +661,62 @@ class PolymarketAPIClient:
                 no_ask=no_ask,
                 volume_24h=volume_24h,
                 liquidity=liquidity,
-                metadata={"token_ids": token_ids, "raw_data": data},
+                metadata={"token_ids": token_ids},
             )
 
         except Exception as e:
             logger.error(f"Error parsing market data: {e}", exc_info=True)
-            logger.debug(f"Market data: {data}")
+            logger.debug("Market data: {}", data)
             return None
 
+    async def _enrich_with_clob(self, market: Market, token_ids: List[str]) -> Market:
+        """Replace a market's Gamma prices with CLOB order book prices.
+
+        Each outcome keeps its Gamma prices when its book is unavailable or
+        one-sided. Markets with neither volume nor liquidity above the
+        configured minimums are returned unchanged without any request.
+
+        Args:
+            market: Parsed market to update in place
+            token_ids: CLOB token IDs, YES first then NO
+
+        Returns:
+            The same market
+        """
+        if not token_ids or len(token_ids) < 2:
+            return market
+
+        # Dead markets are not worth two rate-limited book requests
+        if (
+            market.volume_24h <= self.config.min_clob_volume
+            and market.liquidity <= self.config.min_clob_liquidity
+        ):
+            return market
+
+        # First token is typically YES, second is NO
+        try:
+            # Get order books for both outcomes concurrently
+            yes_book, no_book = await asyncio.gather(
+                self.get_order_book(token_ids[0]),
+                self.get_order_book(token_ids[1]),
+                return_exceptions=True,
+            )
+        except Exception as e:
+            logger.debug("Could not fetch CLOB prices for {}: {}", market.market_id, e)
+            return market
+
+        if isinstance(yes_book, OrderBook) and yes_book.best_bid and yes_book.best_ask:
+            market.yes_bid = yes_book.best_bid[0]
+            market.yes_ask = yes_book.best_ask[0]
+            market.yes_price = (market.yes_bid + market.yes_ask) / 2
+
+        if isinstance(no_book, OrderBook) and no_book.best_bid and no_book.best_ask:
+            market.no_bid = no_book.best_bid[0]
+            market.no_ask = no_book.best_ask[0]
+            market.no_price = (market.no_bid + market.no_ask) / 2
+
+        return market
+
     async def get_gas_price(self) -> float:
         """Get current Polygon gas price in gwei.
 
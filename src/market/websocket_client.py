@@ -1,15 +1,24 @@
 """WebSocket client for real-time Polymarket data."""
 
 import asyncio
-import json
-from typing import Callable, Optional, Set
-from datetime import datetime
+import time
+from typing import Callable, Iterable, Optional, Set, Tuple
 from loguru import logger
+import orjson
 import websockets
 from websockets.exceptions import WebSocketException
 
 from ..config import Config
-from .market_data import Market
+from .market_data import MarketUpdate
+
+# Per-market control frames; only the JSON-quoted market ID varies
+_SUBSCRIBE_FRAME = '{"type":"subscribe","channel":"market","market_id":%s}'
+_UNSUBSCRIBE_FRAME = '{"type":"unsubscribe","channel":"market","market_id":%s}'
+
+
+def _json_str(value: str) -> str:
+    """Quote and escape a string as a JSON string literal."""
+    return orjson.dumps(value).decode()
 
 
 class WebSocketClient:
@@ -25,10 +34,18 @@ class WebSocketClient:
         self.ws_url = config.polymarket_ws_url
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
         self.subscribed_markets: Set[str] = set()
-        self.callbacks: list[Callable] = []
+        # Immutable snapshot, replaced on registration, so the per-message
+        # fan-out iterates a tuple that cannot change underneath it
+        self.callbacks: Tuple[Callable, ...] = ()
         self.is_running = False
         self._reconnect_delay = 1
         self._max_reconnect_delay = 60
+        # Message type -> handler
+        self._dispatch = {
+            "market_update": self._handle_update,
+            "trade": self._handle_trade,
+            "error": self._handle_error,
+        }
 
     async def connect(self):
         """Connect to WebSocket server."""
@@ -60,15 +77,33 @@ class WebSocketClient:
         if not self.websocket:
             raise RuntimeError("WebSocket not connected")
 
+        await self.websocket.send(_SUBSCRIBE_FRAME % _json_str(market_id))
+        self.subscribed_markets.add(market_id)
+        logger.debug("Subscribed to market: {}", market_id)
+
+    async def subscribe_markets(self, market_ids: Iterable[str]):
+        """Subscribe to updates for several markets in a single frame.
+
+        Args:
+            market_ids: Market identifiers to subscribe to
+        """
+        if not self.websocket:
+            raise RuntimeError("WebSocket not connected")
+
+        market_ids = list(market_ids)
+        if not market_ids:
+            return
+
         subscribe_msg = {
             "type": "subscribe",
             "channel": "market",
-            "market_id": market_id,
+            "market_ids": market_ids,
         }
 
-        await self.websocket.send(json.dumps(subscribe_msg))
-        self.subscribed_markets.add(market_id)
-        logger.debug(f"Subscribed to market: {market_id}")
+        # Decoded so the frame goes out as text, like the single subscribe
+        await self.websocket.send(orjson.dumps(subscribe_msg).decode())
+        self.subscribed_markets.update(market_ids)
+        logger.debug("Subscribed to {} markets", len(market_ids))
 
     async def unsubscribe_market(self, market_id: str):
         """Unsubscribe from market updates.
@@ -79,23 +114,17 @@ class WebSocketClient:
         if not self.websocket:
             return
 
-        unsubscribe_msg = {
-            "type": "unsubscribe",
-            "channel": "market",
-            "market_id": market_id,
-        }
-
-        await self.websocket.send(json.dumps(unsubscribe_msg))
+        await self.websocket.send(_UNSUBSCRIBE_FRAME % _json_str(market_id))
         self.subscribed_markets.discard(market_id)
-        logger.debug(f"Unsubscribed from market: {market_id}")
+        logger.debug("Unsubscribed from market: {}", market_id)
 
     def register_callback(self, callback: Callable):
         """Register a callback for market updates.
 
         Args:
-            callback: Async function to call on market updates
+            callback: Async function called with each MarketUpdate
         """
-        self.callbacks.append(callback)
+        self.callbacks = (*self.callbacks, callback)
 
     async def listen(self):
         """Listen for WebSocket messages and process them."""
@@ -106,9 +135,9 @@ class WebSocketClient:
 
                 async for message in self.websocket:
                     try:
-                        data = json.loads(message)
+                        data = orjson.loads(message)
                         await self._handle_message(data)
-                    except json.JSONDecodeError as e:
+                    except orjson.JSONDecodeError as e:
                         logger.error(f"Failed to parse WebSocket message: {e}")
                     except Exception as e:
                         logger.error(f"Error handling WebSocket message: {e}")
@@ -135,8 +164,7 @@ class WebSocketClient:
             await self.connect()
 
             # Re-subscribe to all markets
-            for market_id in list(self.subscribed_markets):
-                await self.subscribe_market(market_id)
+            await self.subscribe_markets(self.subscribed_markets)
 
             logger.info("Reconnected and re-subscribed to markets")
         except Exception as e:
@@ -148,35 +176,61 @@ class WebSocketClient:
         Args:
             data: Parsed message data
         """
-        message_type = data.get("type")
-
-        if message_type == "market_update":
-            # Process market update and notify callbacks
-            market_id = data.get("market_id")
-            update = {
-                "market_id": market_id,
-                "yes_price": data.get("yes_price"),
-                "no_price": data.get("no_price"),
-                "yes_bid": data.get("yes_bid"),
-                "yes_ask": data.get("yes_ask"),
-                "no_bid": data.get("no_bid"),
-                "no_ask": data.get("no_ask"),
-                "timestamp": datetime.now(),
-            }
-
-            # Notify all registered callbacks
-            for callback in self.callbacks:
-                try:
-                    await callback(update)
-                except Exception as e:
-                    logger.error(f"Error in callback: {e}")
-
-        elif message_type == "trade":
-            # Handle trade execution notification
-            logger.debug(f"Trade notification: {data}")
-
-        elif message_type == "error":
-            logger.error(f"WebSocket error: {data.get('message')}")
-
-        else:
-            logger.debug(f"Unknown message type: {message_type}")
+        handler = self._dispatch.get(data.get("type"), self._handle_unknown)
+        await handler(data)
+
+    async def _handle_update(self, data: dict):
+        """Process a market update and notify callbacks.
+
+        Args:
+            data: Parsed message data
+        """
+        callbacks = self.callbacks
+        if not callbacks:
+            return
+
+        get = data.get
+        update = MarketUpdate(
+            market_id=get("market_id"),
+            yes_price=get("yes_price"),
+            no_price=get("no_price"),
+            yes_bid=get("yes_bid"),
+            yes_ask=get("yes_ask"),
+            no_bid=get("no_bid"),
+            no_ask=get("no_ask"),
+            timestamp=time.time(),
+        )
+
+        # Notify all registered callbacks concurrently so one slow
+        # subscriber does not delay the others
+        results = await asyncio.gather(
+            *(callback(update) for callback in callbacks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error in callback: {result}")
+
+    async def _handle_trade(self, data: dict):
+        """Handle a trade execution notification.
+
+        Args:
+            data: Parsed message data
+        """
+        logger.debug("Trade notification: {}", data)
+
+    async def _handle_error(self, data: dict):
+        """Handle an error message from the server.
+
+        Args:
+            data: Parsed message data
+        """
+        logger.error(f"WebSocket error: {data.get('message')}")
+
+    async def _handle_unknown(self, data: dict):
+        """Handle a message of an unrecognized type.
+
+        Args:
+            data: Parsed message data
+        """
+        logger.debug("Unknown message type: {}", data.get("type"))
@@ -1,6 +1,7 @@
 """Notifications package initialization."""
 
 from .discord import DiscordNotifier
+from .hub import NotificationHub
 from .telegram import TelegramNotifier
 
-__all__ = ["DiscordNotifier", "TelegramNotifier"]
+__all__ = ["DiscordNotifier", "NotificationHub", "TelegramNotifier"]
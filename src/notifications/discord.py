@@ -1,13 +1,118 @@
 """Discord webhook notifications."""
 
 import asyncio
-from typing import Optional, Dict, Any
-from discord_webhook import DiscordWebhook, DiscordEmbed
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Tuple
+
+import httpx
+import orjson
 from loguru import logger
 
 from ..config import Config
 from ..arbitrage.scorer import ScoredOpportunity
 
+# httpx speaks HTTP/2 only when h2 is installed; with it, bursts of posts
+# are multiplexed over a single webhook connection
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Payloads are serialized with orjson, so the content type is set by hand
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Discord embed limits, in characters
+_DESCRIPTION_LIMIT = 4096
+_FIELD_VALUE_LIMIT = 1024
+_MESSAGE_LIMIT = 6000  # Total text across all embeds in one message
+
+
+def _skeleton(title: str, color: int, *fields: Tuple[str, bool]) -> Dict[str, Any]:
+    """Build the static part of an embed for one notification type.
+
+    Args:
+        title: Embed title
+        color: Sidebar color as an RGB integer
+        *fields: Field names and inline flags, in display order
+
+    Returns:
+        Embed dictionary without description, field values or timestamp
+    """
+    return {
+        "title": title,
+        "color": color,
+        "footer": {"text": "Polymarket Arbitrage Bot"},
+        "fields": [{"name": name, "inline": inline} for name, inline in fields],
+    }
+
+
+_OPP_EMBED = _skeleton(
+    "🎯 Arbitrage Opportunity Detected!",
+    0x00FF00,
+    ("Details", False),
+    ("Score", True),
+    ("Profit Score", True),
+    ("Confidence", True),
+    ("Recommended Size", True),
+)
+_EXEC_EMBED = _skeleton(
+    "✅ Trades Executed", 0x0099FF, ("Net Profit", True), ("Number of Trades", True)
+)
+_ERR_EMBED = _skeleton("⚠️ Error Alert", 0xFF0000)
+_PERF_EMBED = _skeleton(
+    "📊 Performance Report",
+    0xFFA500,
+    ("Net P&L", True),
+    ("ROI", True),
+    ("Win Rate", True),
+    ("Total Trades", True),
+    ("Sharpe Ratio", True),
+)
+
+
+def _embed(skeleton: Dict[str, Any], description: str, *values: str) -> Dict[str, Any]:
+    """Fill in an embed skeleton for a single notification.
+
+    The skeleton itself is shared and never modified. Description and
+    field values are cut to Discord's length limits.
+
+    Args:
+        skeleton: Embed skeleton from ``_skeleton``
+        description: Embed description
+        *values: Field values, in the skeleton's field order
+
+    Returns:
+        Embed dictionary following Discord's webhook schema
+    """
+    return {
+        **skeleton,
+        "description": description[:_DESCRIPTION_LIMIT],
+        "fields": [
+            {**field, "value": value[:_FIELD_VALUE_LIMIT]}
+            for field, value in zip(skeleton["fields"], values)
+        ],
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def _embed_size(embed: Dict[str, Any]) -> int:
+    """Count the characters of an embed that Discord's message limit covers.
+
+    Args:
+        embed: Embed dictionary
+
+    Returns:
+        Combined length of the title, description, footer and fields
+    """
+    return (
+        len(embed["title"])
+        + len(embed["description"])
+        + len(embed["footer"]["text"])
+        + sum(len(field["name"]) + len(field["value"]) for field in embed["fields"])
+    )
+
 
 class DiscordNotifier:
     """Send notifications via Discord webhook."""
@@ -21,11 +126,121 @@ class DiscordNotifier:
         self.config = config
         self.webhook_url = config.discord_webhook
         self.enabled = bool(self.webhook_url)
+        # Created on first send so it binds to the running event loop
+        self._client: Optional[httpx.AsyncClient] = None
+        # Non-urgent embeds wait here to be coalesced into batched posts
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._flush_task: Optional[asyncio.Task] = None
 
         if not self.enabled:
             logger.info("Discord notifications disabled (no webhook URL)")
 
-    def send_opportunity_alert(
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+
+        Returns:
+            HTTP client that keeps the webhook connection alive between posts
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=_HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60),
+                timeout=10.0,
+            )
+        return self._client
+
+    async def aclose(self, timeout: float = 5.0):
+        """Send queued embeds, then stop the flush task and close the client.
+
+        Args:
+            timeout: Seconds to wait for queued embeds to be sent
+        """
+        if self._flush_task is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Dropping {self._queue.qsize()} unsent Discord notifications"
+                )
+            self._flush_task.cancel()
+            self._flush_task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _post(self, embeds: List[Dict[str, Any]]):
+        """Post embeds to the webhook in a single message.
+
+        Args:
+            embeds: Up to ten embed dictionaries
+        """
+        try:
+            response = await self._get_client().post(
+                self.webhook_url,
+                content=orjson.dumps({"embeds": embeds}),
+                headers=_JSON_HEADERS,
+            )
+            if response.is_success:
+                logger.debug("Sent Discord notification ({} embeds)", len(embeds))
+            else:
+                logger.warning(
+                    f"Discord webhook returned status {response.status_code}"
+                )
+        except Exception as e:
+            logger.error(f"Failed to send Discord notification: {e}")
+
+    async def _enqueue(self, embed: Dict[str, Any]):
+        """Queue an embed for the next batched post.
+
+        Args:
+            embed: Embed dictionary
+        """
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        self._queue.put_nowait(embed)
+
+    async def _flush_loop(self):
+        """Post queued embeds, coalescing those that arrive close together.
+
+        A batch is sent once it holds ``discord_max_batch`` embeds or
+        ``discord_flush_interval`` seconds after its first embed arrived,
+        whichever comes first. An embed that would push the batch over
+        Discord's per-message text limit starts the next batch instead.
+        """
+        loop = asyncio.get_running_loop()
+        max_batch = self.config.discord_max_batch
+        carry: Optional[Dict[str, Any]] = None
+
+        while True:
+            if carry is None:
+                carry = await self._queue.get()
+            batch = [carry]
+            size = _embed_size(carry)
+            carry = None
+
+            deadline = loop.time() + self.config.discord_flush_interval
+            while len(batch) < max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    embed = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                embed_size = _embed_size(embed)
+                if size + embed_size > _MESSAGE_LIMIT:
+                    carry = embed
+                    break
+                batch.append(embed)
+                size += embed_size
+
+            try:
+                await self._post(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def send_opportunity_alert(
         self, scored_opportunity: ScoredOpportunity, position_size: float
     ):
         """Send an opportunity alert to Discord.
@@ -38,61 +253,24 @@ class DiscordNotifier:
             return
 
         try:
-            webhook = DiscordWebhook(url=self.webhook_url)
-
             opp = scored_opportunity.opportunity
 
-            # Create embed
-            embed = DiscordEmbed(
-                title="🎯 Arbitrage Opportunity Detected!",
-                description=f"**Type:** {opp.__class__.__name__}",
-                color=0x00FF00,
-            )
-
-            # Add fields
-            embed.add_embed_field(
-                name="Details",
-                value=str(opp)[:1024],  # Discord field limit
-                inline=False,
-            )
-
-            embed.add_embed_field(
-                name="Score", value=f"{scored_opportunity.score:.2f}/100", inline=True
+            embed = _embed(
+                _OPP_EMBED,
+                f"**Type:** {opp.__class__.__name__}",
+                str(opp),
+                f"{scored_opportunity.score:.2f}/100",
+                f"{scored_opportunity.profit_score:.2f}",
+                f"{scored_opportunity.confidence_score:.2f}",
+                f"${position_size:.2f}",
             )
 
-            embed.add_embed_field(
-                name="Profit Score",
-                value=f"{scored_opportunity.profit_score:.2f}",
-                inline=True,
-            )
-
-            embed.add_embed_field(
-                name="Confidence",
-                value=f"{scored_opportunity.confidence_score:.2f}",
-                inline=True,
-            )
-
-            embed.add_embed_field(
-                name="Recommended Size", value=f"${position_size:.2f}", inline=True
-            )
-
-            embed.set_footer(text="Polymarket Arbitrage Bot")
-            embed.set_timestamp()
-
-            webhook.add_embed(embed)
-            response = webhook.execute()
-
-            if response.status_code == 200:
-                logger.debug("Sent Discord notification")
-            else:
-                logger.warning(
-                    f"Discord webhook returned status {response.status_code}"
-                )
+            await self._enqueue(embed)
 
         except Exception as e:
             logger.error(f"Failed to send Discord notification: {e}")
 
-    def send_execution_alert(self, trades: list, net_profit: float):
+    async def send_execution_alert(self, trades: list, net_profit: float):
         """Send a trade execution alert to Discord.
 
         Args:
@@ -103,32 +281,19 @@ class DiscordNotifier:
             return
 
         try:
-            webhook = DiscordWebhook(url=self.webhook_url)
-
-            embed = DiscordEmbed(
-                title="✅ Trades Executed",
-                description=f"Executed {len(trades)} trades",
-                color=0x0099FF,
-            )
-
-            embed.add_embed_field(
-                name="Net Profit", value=f"${net_profit:.2f}", inline=True
-            )
-
-            embed.add_embed_field(
-                name="Number of Trades", value=str(len(trades)), inline=True
+            embed = _embed(
+                _EXEC_EMBED,
+                f"Executed {len(trades)} trades",
+                f"${net_profit:.2f}",
+                str(len(trades)),
             )
 
-            embed.set_footer(text="Polymarket Arbitrage Bot")
-            embed.set_timestamp()
-
-            webhook.add_embed(embed)
-            webhook.execute()
+            await self._enqueue(embed)
 
         except Exception as e:
             logger.error(f"Failed to send Discord execution alert: {e}")
 
-    def send_error_alert(self, error_message: str):
+    async def send_error_alert(self, error_message: str):
         """Send an error alert to Discord.
 
         Args:
@@ -138,22 +303,15 @@ class DiscordNotifier:
             return
 
         try:
-            webhook = DiscordWebhook(url=self.webhook_url)
-
-            embed = DiscordEmbed(
-                title="⚠️ Error Alert", description=error_message[:2000], color=0xFF0000
-            )
-
-            embed.set_footer(text="Polymarket Arbitrage Bot")
-            embed.set_timestamp()
+            embed = _embed(_ERR_EMBED, error_message[:2000])
 
-            webhook.add_embed(embed)
-            webhook.execute()
+            # Errors skip the batching window
+            await self._post([embed])
 
         except Exception as e:
             logger.error(f"Failed to send Discord error alert: {e}")
 
-    def send_performance_report(self, metrics: Dict[str, Any]):
+    async def send_performance_report(self, metrics: Dict[str, Any]):
         """Send a performance report to Discord.
 
         Args:
@@ -163,43 +321,17 @@ class DiscordNotifier:
             return
 
         try:
-            webhook = DiscordWebhook(url=self.webhook_url)
-
-            embed = DiscordEmbed(
-                title="📊 Performance Report",
-                description="Daily performance summary",
-                color=0xFFA500,
-            )
-
-            embed.add_embed_field(
-                name="Net P&L", value=f"${metrics.get('net_pnl', 0):.2f}", inline=True
+            embed = _embed(
+                _PERF_EMBED,
+                "Daily performance summary",
+                f"${metrics.get('net_pnl', 0):.2f}",
+                f"{metrics.get('roi', 0):.2f}%",
+                f"{metrics.get('win_rate', 0):.2f}%",
+                str(metrics.get("total_trades", 0)),
+                f"{metrics.get('sharpe_ratio', 0):.2f}",
             )
 
-            embed.add_embed_field(
-                name="ROI", value=f"{metrics.get('roi', 0):.2f}%", inline=True
-            )
-
-            embed.add_embed_field(
-                name="Win Rate", value=f"{metrics.get('win_rate', 0):.2f}%", inline=True
-            )
-
-            embed.add_embed_field(
-                name="Total Trades",
-                value=str(metrics.get("total_trades", 0)),
-                inline=True,
-            )
-
-            embed.add_embed_field(
-                name="Sharpe Ratio",
-                value=f"{metrics.get('sharpe_ratio', 0):.2f}",
-                inline=True,
-            )
-
-            embed.set_footer(text="Polymarket Arbitrage Bot")
-            embed.set_timestamp()
-
-            webhook.add_embed(embed)
-            webhook.execute()
+            await self._enqueue(embed)
 
         except Exception as e:
             logger.error(f"Failed to send Discord performance report: {e}")
@@ -0,0 +1,84 @@
+"""Fan-out of notifications to every configured channel."""
+
+import asyncio
+from typing import Any, Dict
+
+from loguru import logger
+
+from ..config import Config
+from ..arbitrage.scorer import ScoredOpportunity
+from .discord import DiscordNotifier
+from .telegram import TelegramNotifier
+
+
+class NotificationHub:
+    """Send each notification to Discord and Telegram concurrently."""
+
+    def __init__(self, config: Config):
+        """Initialize notification hub.
+
+        Args:
+            config: Configuration object
+        """
+        self.discord = DiscordNotifier(config)
+        self.telegram = TelegramNotifier(config)
+
+    async def _broadcast(self, method: str, *args: Any):
+        """Call a notifier method on every channel at once.
+
+        A channel that raises is logged and does not affect the others.
+
+        Args:
+            method: Name of the notifier method to call
+            *args: Arguments for the notifier method
+        """
+        results = await asyncio.gather(
+            getattr(self.discord, method)(*args),
+            getattr(self.telegram, method)(*args),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error sending notification {method}: {result}")
+
+    async def opportunity(
+        self, scored_opportunity: ScoredOpportunity, position_size: float
+    ):
+        """Broadcast an opportunity alert.
+
+        Args:
+            scored_opportunity: Scored opportunity
+            position_size: Recommended position size
+        """
+        await self._broadcast(
+            "send_opportunity_alert", scored_opportunity, position_size
+        )
+
+    async def execution(self, trades: list, net_profit: float):
+        """Broadcast a trade execution alert.
+
+        Args:
+            trades: List of executed trades
+            net_profit: Net profit from execution
+        """
+        await self._broadcast("send_execution_alert", trades, net_profit)
+
+    async def error(self, error_message: str):
+        """Broadcast an error alert.
+
+        Args:
+            error_message: Error message to send
+        """
+        await self._broadcast("send_error_alert", error_message)
+
+    async def performance(self, metrics: Dict[str, Any]):
+        """Broadcast a performance report.
+
+        Args:
+            metrics: Performance metrics dictionary
+        """
+        await self._broadcast("send_performance_report", metrics)
+
+    async def aclose(self):
+        """Flush pending notifications and close every channel."""
+        await asyncio.gather(self.discord.aclose(), self.telegram.aclose())
@@ -1,20 +1,92 @@
 """Telegram bot notifications."""
 
-import asyncio
+import re
 from typing import Optional, Dict, Any
+
+import httpx
+import orjson
 from loguru import logger
 
+from ..config import Config
+from ..arbitrage.scorer import ScoredOpportunity
+
 try:
-    from telegram import Bot
-    from telegram.error import TelegramError
+    import h2  # noqa: F401
 
-    TELEGRAM_AVAILABLE = True
+    _HTTP2 = True
 except ImportError:
-    TELEGRAM_AVAILABLE = False
-    logger.warning("python-telegram-bot not installed, Telegram notifications disabled")
+    _HTTP2 = False
 
-from ..config import Config
-from ..arbitrage.scorer import ScoredOpportunity
+# Request bodies are pre-encoded by orjson
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Characters that must be backslash-escaped in MarkdownV2 text
+_MD_ESCAPE = re.compile(r"([_*\[\]()~`>#+\-=|{}.!\\])")
+
+
+def _esc(text: str) -> str:
+    """Escape text for Telegram's MarkdownV2 parse mode.
+
+    Args:
+        text: Plain text
+
+    Returns:
+        Text that renders literally inside a MarkdownV2 message
+    """
+    return _MD_ESCAPE.sub(r"\\\1", text)
+
+
+class _Escaped:
+    """Template value that is escaped after applying its format spec."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __format__(self, format_spec: str) -> str:
+        return _esc(format(self.value, format_spec))
+
+
+class _MarkdownValues(dict):
+    """Template values for format_map, each escaped for MarkdownV2."""
+
+    def __getitem__(self, key: str) -> _Escaped:
+        return _Escaped(dict.__getitem__(self, key))
+
+
+# Message bodies, filled in with format_map on each send. Literal text is
+# already escaped for MarkdownV2
+_OPP_TMPL = (
+    "🎯 *Arbitrage Opportunity Detected\\!*\n\n"
+    "*Type:* {type}\n"
+    "*Score:* {score:.2f}/100\n"
+    "*Profit Score:* {profit_score:.2f}\n"
+    "*Confidence:* {confidence:.2f}\n"
+    "*Position Size:* ${position_size:.2f}\n\n"
+    "*Details:*\n{details}"
+)
+_EXEC_TMPL = (
+    "✅ *Trades Executed*\n\n"
+    "*Number of Trades:* {num_trades}\n"
+    "*Net Profit:* ${net_profit:.2f}"
+)
+_ERR_TMPL = "⚠️ *Error Alert*\n\n{error}"
+_PERF_TMPL = (
+    "📊 *Performance Report*\n\n"
+    "*Net P&L:* ${net_pnl:.2f}\n"
+    "*ROI:* {roi:.2f}%\n"
+    "*Win Rate:* {win_rate:.2f}%\n"
+    "*Total Trades:* {total_trades}\n"
+    "*Sharpe Ratio:* {sharpe_ratio:.2f}"
+)
+_PERF_DEFAULTS = {
+    "net_pnl": 0,
+    "roi": 0,
+    "win_rate": 0,
+    "total_trades": 0,
+    "sharpe_ratio": 0,
+}
 
 
 class TelegramNotifier:
@@ -29,14 +101,49 @@ class TelegramNotifier:
         self.config = config
         self.bot_token = config.telegram_bot_token
         self.chat_id = config.telegram_chat_id
-        self.enabled = bool(self.bot_token and self.chat_id and TELEGRAM_AVAILABLE)
+        self.enabled = bool(self.bot_token and self.chat_id)
+        # Created on first send so it binds to the running event loop
+        self._client: Optional[httpx.AsyncClient] = None
 
-        if self.enabled:
-            self.bot = Bot(token=self.bot_token)
-        else:
-            self.bot = None
+        if not self.enabled:
             logger.info("Telegram notifications disabled")
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared Bot API client, creating it on first use.
+
+        Returns:
+            HTTP client that keeps the Bot API connection alive between posts
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=f"https://api.telegram.org/bot{self.bot_token}",
+                http2=_HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=2, keepalive_expiry=90),
+                timeout=10.0,
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the Bot API client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _send(self, text: str):
+        """Send a MarkdownV2 message to the configured chat.
+
+        Args:
+            text: Message text
+        """
+        payload = {"chat_id": self.chat_id, "text": text, "parse_mode": "MarkdownV2"}
+        response = await self._get_client().post(
+            "/sendMessage", content=orjson.dumps(payload), headers=_JSON_HEADERS
+        )
+        if response.is_success:
+            logger.debug("Sent Telegram notification")
+        else:
+            logger.warning(f"Telegram API returned status {response.status_code}")
+
     async def send_opportunity_alert(
         self, scored_opportunity: ScoredOpportunity, position_size: float
     ):
@@ -52,21 +159,20 @@ class TelegramNotifier:
         try:
             opp = scored_opportunity.opportunity
 
-            message = (
-                "🎯 *Arbitrage Opportunity Detected!*\n\n"
-                f"*Type:* {opp.__class__.__name__}\n"
-                f"*Score:* {scored_opportunity.score:.2f}/100\n"
-                f"*Profit Score:* {scored_opportunity.profit_score:.2f}\n"
-                f"*Confidence:* {scored_opportunity.confidence_score:.2f}\n"
-                f"*Position Size:* ${position_size:.2f}\n\n"
-                f"*Details:*\n{str(opp)}"
-            )
-
-            await self.bot.send_message(
-                chat_id=self.chat_id, text=message, parse_mode="Markdown"
+            message = _OPP_TMPL.format_map(
+                _MarkdownValues(
+                    {
+                        "type": opp.__class__.__name__,
+                        "score": scored_opportunity.score,
+                        "profit_score": scored_opportunity.profit_score,
+                        "confidence": scored_opportunity.confidence_score,
+                        "position_size": position_size,
+                        "details": opp,
+                    }
+                )
             )
 
-            logger.debug("Sent Telegram notification")
+            await self._send(message)
 
         except Exception as e:
             logger.error(f"Failed to send Telegram notification: {e}")
@@ -82,15 +188,11 @@ class TelegramNotifier:
             return
 
         try:
-            message = (
-                "✅ *Trades Executed*\n\n"
-                f"*Number of Trades:* {len(trades)}\n"
-                f"*Net Profit:* ${net_profit:.2f}"
+            message = _EXEC_TMPL.format_map(
+                _MarkdownValues(num_trades=len(trades), net_profit=net_profit)
             )
 
-            await self.bot.send_message(
-                chat_id=self.chat_id, text=message, parse_mode="Markdown"
-            )
+            await self._send(message)
 
         except Exception as e:
             logger.error(f"Failed to send Telegram execution alert: {e}")
@@ -105,11 +207,9 @@ class TelegramNotifier:
             return
 
         try:
-            message = f"⚠️ *Error Alert*\n\n{error_message}"
+            message = _ERR_TMPL.format_map(_MarkdownValues(error=error_message))
 
-            await self.bot.send_message(
-                chat_id=self.chat_id, text=message, parse_mode="Markdown"
-            )
+            await self._send(message)
 
         except Exception as e:
             logger.error(f"Failed to send Telegram error alert: {e}")
@@ -124,18 +224,9 @@ class TelegramNotifier:
             return
 
         try:
-            message = (
-                "📊 *Performance Report*\n\n"
-                f"*Net P&L:* ${metrics.get('net_pnl', 0):.2f}\n"
-                f"*ROI:* {metrics.get('roi', 0):.2f}%\n"
-                f"*Win Rate:* {metrics.get('win_rate', 0):.2f}%\n"
-                f"*Total Trades:* {metrics.get('total_trades', 0)}\n"
-                f"*Sharpe Ratio:* {metrics.get('sharpe_ratio', 0):.2f}"
-            )
+            message = _PERF_TMPL.format_map(_MarkdownValues(_PERF_DEFAULTS, **metrics))
 
-            await self.bot.send_message(
-                chat_id=self.chat_id, text=message, parse_mode="Markdown"
-            )
+            await self._send(message)
 
         except Exception as e:
             logger.error(f"Failed to send Telegram performance report: {e}")
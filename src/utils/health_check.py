@@ -1,10 +1,43 @@
 """Health check system for bot monitoring."""
 
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 import aiohttp
 from loguru import logger
 
+# Seconds the API part of the health status is reused between calls
+_STATUS_TTL = 1.0
+
+
+@lru_cache(maxsize=256)
+def _format_uptime(seconds: int) -> str:
+    """Format uptime in human-readable format.
+
+    Cached by whole second, so repeated status scrapes within the same
+    second reuse the string.
+
+    Args:
+        seconds: Uptime in whole seconds
+
+    Returns:
+        Formatted uptime string
+    """
+    minutes, secs = divmod(int(seconds), 60)
+    if not minutes:
+        return f"{secs}s"
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+
+    # Zero units are left out, e.g. "1d 5s"
+    return (
+        (f"{days}d " if days else "")
+        + (f"{hours}h " if hours else "")
+        + (f"{minutes}m " if minutes else "")
+        + f"{secs}s"
+    )
+
 
 class HealthChecker:
     """System health monitoring."""
@@ -12,8 +45,35 @@ class HealthChecker:
     def __init__(self):
         """Initialize health checker."""
         self.start_time = datetime.now()
+        # Monotonic reference for uptime, unaffected by wall-clock changes
+        self._start_mono = time.monotonic()
         self.last_api_check: Optional[datetime] = None
         self.api_healthy = False
+        # Bumped whenever api_healthy or last_api_check changes
+        self._status_version = 0
+        # (version, monotonic time, status fields that depend on the version)
+        self._status_cache: Optional[Tuple[int, float, Dict[str, Any]]] = None
+        # Reused across checks so probes ride an existing connection
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use.
+
+        Returns:
+            Client session with a small keep-alive connection pool
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=10, keepalive_timeout=75, ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def aclose(self):
+        """Close the shared HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     def get_uptime_seconds(self) -> float:
         """Get system uptime in seconds.
@@ -21,7 +81,7 @@ class HealthChecker:
         Returns:
             Uptime in seconds
         """
-        return (datetime.now() - self.start_time).total_seconds()
+        return time.monotonic() - self._start_mono
 
     async def check_api_connectivity(
         self, api_url: str = "https://gamma-api.polymarket.com/ping"
@@ -35,65 +95,65 @@ class HealthChecker:
             True if API is reachable
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    api_url, timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    self.api_healthy = response.status == 200
-                    self.last_api_check = datetime.now()
-                    return self.api_healthy
+            session = await self._get_session()
+            async with session.get(
+                api_url, timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                # Only the status matters; the body is never read
+                self.api_healthy = response.status == 200
+                self.last_api_check = datetime.now()
+                self._status_version += 1
+                return self.api_healthy
         except Exception as e:
             logger.warning(f"API health check failed: {e}")
             self.api_healthy = False
             self.last_api_check = datetime.now()
+            self._status_version += 1
             return False
 
     def get_health_status(self) -> Dict[str, Any]:
         """Get comprehensive health status.
 
+        The API status part is rebuilt only after a connectivity check or
+        once it is ``_STATUS_TTL`` seconds old; timestamp and uptime are
+        always current.
+
         Returns:
             Dictionary with health status information
         """
-        uptime = self.get_uptime_seconds()
+        now = time.monotonic()
+        cached = self._status_cache
+        if (
+            cached is None
+            or cached[0] != self._status_version
+            or now - cached[1] >= _STATUS_TTL
+        ):
+            cached = self._status_cache = (
+                self._status_version,
+                now,
+                {
+                    "status": "healthy" if self.api_healthy else "degraded",
+                    "api_status": {
+                        "healthy": self.api_healthy,
+                        "last_check": (
+                            self.last_api_check.isoformat()
+                            if self.last_api_check
+                            else None
+                        ),
+                    },
+                },
+            )
+        api_fields = cached[2]
+        uptime = now - self._start_mono
 
         return {
-            "status": "healthy" if self.api_healthy else "degraded",
+            "status": api_fields["status"],
             "timestamp": datetime.now().isoformat(),
             "uptime_seconds": uptime,
-            "uptime_human": self._format_uptime(uptime),
-            "api_status": {
-                "healthy": self.api_healthy,
-                "last_check": (
-                    self.last_api_check.isoformat() if self.last_api_check else None
-                ),
-            },
+            "uptime_human": _format_uptime(int(uptime)),
+            "api_status": api_fields["api_status"],
         }
 
-    def _format_uptime(self, seconds: float) -> str:
-        """Format uptime in human-readable format.
-
-        Args:
-            seconds: Uptime in seconds
-
-        Returns:
-            Formatted uptime string
-        """
-        days = int(seconds // 86400)
-        hours = int((seconds % 86400) // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-
-        parts = []
-        if days > 0:
-            parts.append(f"{days}d")
-        if hours > 0:
-            parts.append(f"{hours}h")
-        if minutes > 0:
-            parts.append(f"{minutes}m")
-        parts.append(f"{secs}s")
-
-        return " ".join(parts)
-
 
 # Global health checker instance
 health_checker = HealthChecker()
@@ -37,6 +37,10 @@ def setup_logging(
     log_path = Path(log_dir)
     log_path.mkdir(parents=True, exist_ok=True)
 
+    # File sinks are written from loguru's background thread (enqueue) so
+    # logging never blocks the event loop on disk I/O, and skip the
+    # variable-annotated tracebacks that are costly to capture
+
     # Add file handler for all logs
     logger.add(
         log_path / "bot_{time:YYYY-MM-DD}.log",
@@ -45,16 +49,22 @@ def setup_logging(
         rotation=rotation,
         retention=retention,
         compression="zip",
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
 
-    # Add separate error log
+    # Add separate error log as JSON lines for log tooling
     logger.add(
         log_path / "errors_{time:YYYY-MM-DD}.log",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
         level="ERROR",
         rotation=rotation,
         retention=retention,
         compression="zip",
+        enqueue=True,
+        serialize=True,
+        backtrace=False,
+        diagnose=False,
     )
 
     logger.info(f"Logging initialized at level {log_level}")
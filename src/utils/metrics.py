@@ -1,13 +1,36 @@
 """Prometheus metrics export for monitoring."""
 
+import re
+import time
+from functools import lru_cache
+
 from prometheus_client import (
     Counter,
     Gauge,
     Histogram,
+    disable_created_metrics,
     generate_latest,
     CONTENT_TYPE_LATEST,
 )
-from typing import Dict, Any
+from typing import Any, Dict, Optional, Tuple
+
+# Seconds a rendered scrape is reused by export_metrics
+_SNAPSHOT_TTL = 0.5
+
+# Endpoint path (IDs replaced by ":id") -> api_request_duration label. Any
+# other endpoint is recorded as "other" so the label set stays bounded
+_ENDPOINT_CANON = {
+    "/markets": "markets",
+    "/markets/:id": "market",
+    "/book": "book",
+    "/price": "price",
+}
+_ID_RE = re.compile(r"/(?:0x[0-9a-fA-F]+|\d+)(?=/|$)")
+
+# Don't export a *_created series next to every counter and histogram
+# child; nothing reads them and they make up a large share of each scrape.
+# Must run before the metrics below are declared
+disable_created_metrics()
 
 # Define metrics
 opportunities_detected = Counter(
@@ -40,6 +63,73 @@ api_request_duration = Histogram(
 
 api_errors = Counter("api_errors_total", "Total API errors", ["error_type"])
 
+# Label values -> bound child metric. ``.labels()`` takes a lock and hashes
+# the label tuple on every call; the children never change, so look them up
+# once and keep them
+_opportunity_children: Dict[Tuple[str, ...], Any] = {}
+_trade_children: Dict[Tuple[str, ...], Any] = {}
+_api_duration_children: Dict[Tuple[str, ...], Any] = {}
+_api_error_children: Dict[Tuple[str, ...], Any] = {}
+
+
+def _child(cache: Dict[Tuple[str, ...], Any], metric: Any, *values: str) -> Any:
+    """Get the child of a labelled metric, binding it on first use.
+
+    Args:
+        cache: Cache of bound children for ``metric``
+        metric: Labelled Prometheus metric
+        *values: Label values in the metric's label order
+
+    Returns:
+        Child metric for the label values
+    """
+    child = cache.get(values)
+    if child is None:
+        child = cache[values] = metric.labels(*values)
+    return child
+
+
+@lru_cache(maxsize=1024)
+def _canon(endpoint: str) -> str:
+    """Map an endpoint URL or path to a fixed metric label.
+
+    Args:
+        endpoint: Endpoint as called, e.g. ``https://host/markets/123?x=1``
+
+    Returns:
+        Label from ``_ENDPOINT_CANON``, or ``"other"``
+    """
+    path = endpoint.split("?", 1)[0]
+    if "://" in path:
+        host_and_path = path.split("://", 1)[1]
+        slash = host_and_path.find("/")
+        path = host_and_path[slash:] if slash != -1 else "/"
+    path = _ID_RE.sub("/:id", path.rstrip("/") or "/")
+    return _ENDPOINT_CANON.get(path, "other")
+
+
+def _prewarm_children():
+    """Bind the label combinations seen during normal trading up front."""
+    for strategy in (
+        "cross_market",
+        "yes_no_imbalance",
+        "multi_leg",
+        "correlated_events",
+    ):
+        _child(_opportunity_children, opportunities_detected, strategy)
+    for outcome in ("YES", "NO"):
+        for side in ("BUY", "SELL"):
+            _child(_trade_children, trades_executed, outcome, side)
+    for endpoint in {*_ENDPOINT_CANON.values(), "other"}:
+        _child(_api_duration_children, api_request_duration, endpoint)
+
+
+_prewarm_children()
+
+# Last rendered scrape and the monotonic time it was rendered at
+_snapshot: Optional[bytes] = None
+_snapshot_at = 0.0
+
 
 class MetricsExporter:
     """Export metrics in Prometheus format."""
@@ -61,7 +151,7 @@ class MetricsExporter:
         Args:
             strategy_type: Type of arbitrage strategy
         """
-        opportunities_detected.labels(strategy_type=strategy_type).inc()
+        _child(_opportunity_children, opportunities_detected, strategy_type).inc()
 
     @staticmethod
     def record_trade(outcome: str, side: str, pnl: float = 0):
@@ -72,7 +162,7 @@ class MetricsExporter:
             side: Trade side (BUY/SELL)
             pnl: Profit/loss amount
         """
-        trades_executed.labels(outcome=outcome, side=side).inc()
+        _child(_trade_children, trades_executed, outcome, side).inc()
         if pnl != 0:
             trade_pnl.observe(pnl)
 
@@ -90,22 +180,38 @@ class MetricsExporter:
         """Record API call metrics.
 
         Args:
-            endpoint: API endpoint called
+            endpoint: API endpoint called, as a URL or path
             duration: Request duration in seconds
             error: Error type if request failed
         """
-        api_request_duration.labels(endpoint=endpoint).observe(duration)
+        _child(_api_duration_children, api_request_duration, _canon(endpoint)).observe(
+            duration
+        )
         if error:
-            api_errors.labels(error_type=error).inc()
+            _child(_api_error_children, api_errors, error).inc()
 
     @staticmethod
-    def export_metrics() -> bytes:
+    def export_metrics(max_age: float = _SNAPSHOT_TTL) -> bytes:
         """Export metrics in Prometheus format.
 
+        Scrapes arriving within ``max_age`` seconds of the last render reuse
+        its output instead of walking the registry again.
+
+        Args:
+            max_age: Seconds a rendered scrape may be reused; 0 disables reuse
+
         Returns:
             Metrics in Prometheus text format
         """
-        return generate_latest()
+        global _snapshot, _snapshot_at
+
+        now = time.monotonic()
+        if _snapshot is not None and now - _snapshot_at < max_age:
+            return _snapshot
+
+        _snapshot = generate_latest()
+        _snapshot_at = now
+        return _snapshot
 
     @staticmethod
     def get_content_type() -> str:
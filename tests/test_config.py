@@ -0,0 +1,143 @@
+"""Unit tests for configuration loading."""
+
+import os
+
+import pytest
+from pydantic import ValidationError
+
+import src.config
+from src.config import Config, load_config, load_config_fast
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Write a small YAML configuration file."""
+    path = tmp_path / "config.yaml"
+    path.write_text("min_profit_threshold: 7.5\nmode: alert\n")
+    return path
+
+
+class TestLoadConfig:
+    """Test load_config."""
+
+    def test_loads_yaml_values(self, config_file):
+        """Test values from the YAML file are applied."""
+        config = load_config(str(config_file))
+
+        assert isinstance(config, Config)
+        assert config.min_profit_threshold == 7.5
+
+    def test_missing_file_uses_defaults(self, tmp_path):
+        """Test a missing file falls back to defaults."""
+        config = load_config(str(tmp_path / "missing.yaml"))
+
+        assert config.min_profit_threshold == 5.0
+
+    def test_cached_until_file_changes(self, config_file, monkeypatch):
+        """Test repeated loads reuse the parsed file until it is modified."""
+        reads = []
+        read_yaml = src.config._read_yaml
+        monkeypatch.setattr(
+            src.config, "_read_yaml", lambda path: reads.append(path) or read_yaml(path)
+        )
+        src.config._read_yaml_cached.cache_clear()
+
+        first = load_config(str(config_file))
+        load_config(str(config_file))
+        assert len(reads) == 1
+
+        config_file.write_text("min_profit_threshold: 9.0\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        reloaded = load_config(str(config_file))
+        assert len(reads) == 2
+        assert reloaded.min_profit_threshold == 9.0
+        assert first.min_profit_threshold == 7.5
+
+    def test_callers_get_independent_configs(self, config_file):
+        """Test changing one loaded config does not affect later loads."""
+        first = load_config(str(config_file))
+        first.min_profit_threshold = 1.0
+
+        second = load_config(str(config_file))
+
+        assert second is not first
+        assert second.min_profit_threshold == 7.5
+
+    def test_environment_is_read_on_every_load(self, config_file, monkeypatch):
+        """Test environment changes apply without the file changing."""
+        assert load_config(str(config_file)).kelly_fraction == 0.25
+
+        monkeypatch.setenv("KELLY_FRACTION", "0.5")
+
+        assert load_config(str(config_file)).kelly_fraction == 0.5
+
+    def test_empty_file_uses_defaults(self, tmp_path):
+        """Test an empty file falls back to defaults."""
+        path = tmp_path / "empty.yaml"
+        path.write_text("")
+
+        config = load_config(str(path))
+
+        assert config.min_profit_threshold == 5.0
+
+
+class TestLoadConfigFast:
+    """Test load_config_fast."""
+
+    def test_reload_applies_file_changes(self, config_file, monkeypatch):
+        """Test reloads pick up new values on top of the validated load."""
+        monkeypatch.setattr(src.config, "_validated_bases", {})
+
+        first = load_config_fast(str(config_file))
+        assert first.min_profit_threshold == 7.5
+
+        config_file.write_text("min_profit_threshold: 9.0\n")
+        reloaded = load_config_fast(str(config_file))
+
+        assert isinstance(reloaded, Config)
+        assert reloaded.min_profit_threshold == 9.0
+        assert reloaded.mode == first.mode
+        assert reloaded.kelly_fraction == first.kelly_fraction
+
+    def test_paths_do_not_share_a_baseline(self, tmp_path, monkeypatch):
+        """Test a second file is not laid over the first file's values."""
+        monkeypatch.setattr(src.config, "_validated_bases", {})
+        first = tmp_path / "a.yaml"
+        first.write_text("mode: auto_trade\nmax_position_size: 123.0\n")
+        second = tmp_path / "b.yaml"
+        second.write_text("min_profit_threshold: 9.0\n")
+
+        load_config_fast(str(first))
+        config = load_config_fast(str(second))
+
+        expected = load_config(str(second))
+        assert config.mode == expected.mode == "alert"
+        assert config.max_position_size == expected.max_position_size == 1000.0
+        assert config.min_profit_threshold == 9.0
+
+        # Reloading the first path still uses its own baseline
+        assert load_config_fast(str(first)).mode == "auto_trade"
+
+    def test_changed_values_are_validated(self, config_file, monkeypatch):
+        """Test changed settings are type-checked on a fast reload."""
+        monkeypatch.setattr(src.config, "_validated_bases", {})
+        load_config_fast(str(config_file))
+
+        config_file.write_text("min_profit_threshold: '8'\nmode: alert\n")
+        assert load_config_fast(str(config_file)).min_profit_threshold == 8.0
+
+        config_file.write_text("min_profit_threshold: lots\nmode: alert\n")
+        with pytest.raises(ValidationError):
+            load_config_fast(str(config_file))
+
+    def test_removed_keys_fall_back_to_full_load(self, config_file, monkeypatch):
+        """Test a key dropped from the file no longer keeps its old value."""
+        monkeypatch.setattr(src.config, "_validated_bases", {})
+        config_file.write_text("mode: auto_trade\n")
+        assert load_config_fast(str(config_file)).mode == "auto_trade"
+
+        config_file.write_text("min_profit_threshold: 7.5\n")
+
+        assert load_config_fast(str(config_file)).mode == "alert"
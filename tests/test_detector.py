@@ -4,6 +4,7 @@ import pytest
 from datetime import datetime
 
 from src.arbitrage.detector import ArbitrageDetector
+from src.arbitrage.strategies.multi_leg import MultiLegOpportunity, MultiLegStrategy
 from src.config import Config
 from src.market.market_data import Market, MarketStatus
 
@@ -203,6 +204,61 @@ class TestArbitrageDetector:
         # Should run both strategies
         assert isinstance(opportunities, list)
 
+    def test_parallel_detection_matches_serial(self):
+        """Test parallel detection returns the same opportunities in order."""
+        strategies = [
+            "cross_market",
+            "yes_no_imbalance",
+            "multi_leg",
+            "correlated_events",
+        ]
+        serial = ArbitrageDetector(create_test_config(strategies=strategies))
+        parallel = ArbitrageDetector(
+            create_test_config(strategies=strategies, parallel_detection=True)
+        )
+
+        markets = [
+            create_test_market(f"market_{i}", yes_price=0.30, no_price=0.30)
+            for i in range(4)
+        ]
+
+        try:
+            expected = serial.detect_opportunities(markets)
+            actual = parallel.detect_opportunities(markets)
+        finally:
+            parallel.shutdown()
+
+        assert len(expected) > 0
+        assert [str(opp) for opp in actual] == [str(opp) for opp in expected]
+
+    def test_parallel_detection_reuses_chain_cache(self):
+        """Test the multi-leg chain cache carries over between parallel ticks."""
+        detector = ArbitrageDetector(
+            create_test_config(
+                strategies=["yes_no_imbalance", "multi_leg"], parallel_detection=True
+            )
+        )
+        multi_leg = next(
+            s for s in detector.strategies if isinstance(s, MultiLegStrategy)
+        )
+        markets = [
+            create_test_market(f"market_{i}", yes_price=0.30, no_price=0.30)
+            for i in range(4)
+        ]
+
+        try:
+            first = detector.detect_opportunities(markets)
+            assert len(multi_leg._chain_cache) == 1
+
+            # A second tick that had to search chains again would now fail
+            multi_leg._scorers = {}
+            second = detector.detect_opportunities(markets)
+        finally:
+            detector.shutdown()
+
+        assert any(isinstance(opp, MultiLegOpportunity) for opp in second)
+        assert [str(opp) for opp in second] == [str(opp) for opp in first]
+
 
 class TestDetectorEdgeCases:
     """Test edge cases for detector."""
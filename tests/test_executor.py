@@ -0,0 +1,227 @@
+"""Unit tests for trade execution."""
+
+import asyncio
+
+import pytest
+from datetime import datetime
+from loguru import logger
+
+from src.arbitrage.scorer import ScoredOpportunity
+from src.arbitrage.strategies.multi_leg import Leg, MultiLegOpportunity
+from src.arbitrage.strategies.yes_no_imbalance import YesNoImbalanceOpportunity
+from src.config import Config
+from src.execution.executor import TradeExecutor
+from src.market.market_data import Market, MarketStatus, OrderSide, Trade
+
+
+def create_test_market(market_id: str = "market_1") -> Market:
+    """Create a test market."""
+    return Market(
+        market_id=market_id,
+        question=f"Test question {market_id}",
+        description="Test market",
+        category="test",
+        end_date=datetime(2024, 12, 31),
+        status=MarketStatus.ACTIVE,
+        yes_price=0.45,
+        no_price=0.48,
+        yes_bid=0.44,
+        yes_ask=0.46,
+        no_bid=0.47,
+        no_ask=0.49,
+        volume_24h=10000,
+        liquidity=50000,
+    )
+
+
+def score(opportunity) -> ScoredOpportunity:
+    """Wrap an opportunity in a ScoredOpportunity."""
+    return ScoredOpportunity(
+        opportunity=opportunity,
+        score=80.0,
+        profit_score=7.5,
+        capital_efficiency_score=50.0,
+        confidence_score=90.0,
+        risk_score=10.0,
+        execution_difficulty=20.0,
+    )
+
+
+def yes_no_opportunity(action: str = "buy_both") -> YesNoImbalanceOpportunity:
+    """Create a YES/NO imbalance opportunity."""
+    return YesNoImbalanceOpportunity(
+        market=create_test_market(),
+        yes_price=0.46,
+        no_price=0.49,
+        price_sum=0.95,
+        imbalance=0.05,
+        profit_percentage=5.26,
+        expected_profit=5.26,
+        action=action,
+    )
+
+
+async def instant_order(self, market_id, outcome, side, price, size):
+    """Stand-in for _place_order that fills immediately."""
+    return Trade(
+        trade_id=f"{market_id}_{outcome}",
+        market_id=market_id,
+        outcome=outcome,
+        side=side,
+        price=price,
+        size=size,
+        timestamp=datetime.now(),
+    )
+
+
+@pytest.fixture(scope="module")
+def shared_executor():
+    """Create one auto-trading executor for the whole module."""
+    return TradeExecutor(Config(mode="auto_trade", dry_run=False))
+
+
+@pytest.fixture
+def executor(monkeypatch, shared_executor):
+    """Provide the shared executor with instant orders and empty state."""
+    monkeypatch.setattr(TradeExecutor, "_place_order", instant_order)
+    shared_executor.executed_trades.clear()
+    shared_executor.open_positions.clear()
+    return shared_executor
+
+
+@pytest.fixture(scope="module")
+def alert_executor():
+    """Create one alert-mode executor; it never records trades."""
+    return TradeExecutor(Config(mode="alert"))
+
+
+class TestTradeExecutor:
+    """Test trade execution."""
+
+    @pytest.mark.asyncio
+    async def test_alert_mode_places_no_orders(self, alert_executor):
+        """Test alert mode only logs the opportunity."""
+        result = await alert_executor.execute_opportunity(
+            score(yes_no_opportunity()), 100
+        )
+
+        assert result is None
+        assert len(alert_executor.executed_trades) == 0
+
+    @pytest.mark.asyncio
+    async def test_alert_is_logged_as_one_record(self, alert_executor):
+        """Test the alert is emitted as a single log record."""
+        messages = []
+        sink_id = logger.add(messages.append, level="INFO", format="{message}")
+
+        try:
+            await alert_executor.execute_opportunity(score(yes_no_opportunity()), 100)
+        finally:
+            logger.remove(sink_id)
+
+        assert len(messages) == 1
+        assert "ARBITRAGE OPPORTUNITY DETECTED" in messages[0]
+        assert "Recommended Position Size: $100.00" in messages[0]
+
+    @pytest.mark.asyncio
+    async def test_dispatches_on_opportunity_type(self, executor):
+        """Test opportunities are routed to their execution handler."""
+        trades = await executor.execute_opportunity(score(yes_no_opportunity()), 100)
+
+        assert [(t.outcome, t.side) for t in trades] == [
+            ("YES", OrderSide.BUY),
+            ("NO", OrderSide.BUY),
+        ]
+        assert list(executor.executed_trades) == trades
+
+    @pytest.mark.asyncio
+    async def test_multi_leg_splits_size_across_legs(self, executor):
+        """Test each leg gets its side and an equal share of the position."""
+        market = create_test_market()
+        opportunity = MultiLegOpportunity(
+            markets=[market],
+            legs=[
+                Leg("m1", "buy", "YES", 0.30, "q1"),
+                Leg("m2", "sell", "NO", 0.40, "q2"),
+                Leg("m3", "buy", "YES", 0.20, "q3"),
+            ],
+            total_profit_percentage=10.0,
+            expected_profit=10.0,
+            complexity_score=3,
+        )
+
+        trades = await executor.execute_opportunity(score(opportunity), 90)
+
+        assert [(t.market_id, t.side, t.price) for t in trades] == [
+            ("m1", OrderSide.BUY, 0.30),
+            ("m2", OrderSide.SELL, 0.40),
+            ("m3", OrderSide.BUY, 0.20),
+        ]
+        assert all(t.size == pytest.approx(30.0) for t in trades)
+
+    @pytest.mark.asyncio
+    async def test_dry_run_skips_order_placement(self, monkeypatch):
+        """Test dry-run execution returns without placing any orders."""
+        executor = TradeExecutor(Config(mode="auto_trade", dry_run=True))
+
+        async def place_order(self, **kwargs):
+            raise AssertionError("dry run should not place orders")
+
+        monkeypatch.setattr(TradeExecutor, "_place_order", place_order)
+
+        trades = await executor.execute_opportunity(score(yes_no_opportunity()), 100)
+
+        assert trades == []
+
+    @pytest.mark.asyncio
+    async def test_trade_history_is_bounded(self, monkeypatch):
+        """Test only the most recent trades are kept in memory."""
+        executor = TradeExecutor(
+            Config(mode="auto_trade", dry_run=False, trade_history_size=3)
+        )
+        monkeypatch.setattr(TradeExecutor, "_place_order", instant_order)
+
+        for _ in range(2):
+            await executor.execute_opportunity(score(yes_no_opportunity()), 100)
+
+        assert len(executor.executed_trades) == 3
+
+    @pytest.mark.asyncio
+    async def test_unknown_opportunity_type(self, executor):
+        """Test unknown opportunity types are rejected."""
+        result = await executor.execute_opportunity(score(object()), 100)
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_orders_are_placed_concurrently(self, executor, monkeypatch):
+        """Test legs are in flight together and failed legs are dropped."""
+        in_flight = 0
+        peak = 0
+
+        async def place_order(self, market_id, outcome, side, price, size):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if outcome == "NO":
+                raise RuntimeError("rejected")
+            return Trade(
+                trade_id=outcome,
+                market_id=market_id,
+                outcome=outcome,
+                side=side,
+                price=price,
+                size=size,
+                timestamp=datetime.now(),
+            )
+
+        monkeypatch.setattr(TradeExecutor, "_place_order", place_order)
+
+        trades = await executor.execute_opportunity(
+            score(yes_no_opportunity("sell_both")), 100
+        )
+
+        assert peak == 2
+        assert [(t.outcome, t.side) for t in trades] == [("YES", OrderSide.SELL)]
@@ -0,0 +1,91 @@
+"""Unit tests for the health checker."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.utils.health_check import HealthChecker, _format_uptime
+
+
+def fake_session(status: int = 200) -> MagicMock:
+    """Create a session stub whose GET returns the given status."""
+    response = MagicMock(status=status)
+    context = AsyncMock()
+    context.__aenter__.return_value = response
+    session = MagicMock(closed=False)
+    session.get.return_value = context
+    session.close = AsyncMock()
+    return session
+
+
+class TestHealthChecker:
+    """Test health checker."""
+
+    @pytest.mark.asyncio
+    async def test_api_checks_reuse_one_session(self):
+        """Test repeated connectivity checks share the same session."""
+        checker = HealthChecker()
+        session = fake_session()
+        checker._session = session
+
+        assert await checker.check_api_connectivity()
+        assert await checker.check_api_connectivity()
+
+        assert session.get.call_count == 2
+        assert checker._session is session
+
+        await checker.aclose()
+        session.close.assert_awaited_once()
+        assert checker._session is None
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_status(self):
+        """Test a non-200 response marks the API as unhealthy."""
+        checker = HealthChecker()
+        checker._session = fake_session(status=503)
+
+        assert not await checker.check_api_connectivity()
+        assert checker.get_health_status()["status"] == "degraded"
+
+    def test_uptime_is_monotonic_and_formatted(self):
+        """Test uptime counts from the monotonic start and formats readably."""
+        checker = HealthChecker()
+        checker._start_mono -= 90061.5
+
+        status = checker.get_health_status()
+
+        assert status["uptime_seconds"] >= 90061.5
+        assert status["uptime_human"] == "1d 1h 1m 1s"
+
+    @pytest.mark.parametrize(
+        "seconds, expected",
+        [
+            (0, "0s"),
+            (59, "59s"),
+            (60, "1m 0s"),
+            (3600, "1h 0s"),
+            (86405, "1d 5s"),
+            (90061, "1d 1h 1m 1s"),
+        ],
+    )
+    def test_format_uptime_omits_zero_units(self, seconds, expected):
+        """Test only non-zero units are shown, seconds always."""
+        assert _format_uptime(seconds) == expected
+
+    @pytest.mark.asyncio
+    async def test_status_is_reused_until_the_api_is_checked(self):
+        """Test the API status is cached but refreshed by a new check."""
+        checker = HealthChecker()
+        checker._session = fake_session(status=200)
+
+        first = checker.get_health_status()
+        second = checker.get_health_status()
+        assert second["api_status"] is first["api_status"]
+        assert second["uptime_seconds"] >= first["uptime_seconds"]
+        assert first["status"] == "degraded"
+
+        assert await checker.check_api_connectivity()
+        third = checker.get_health_status()
+
+        assert third["status"] == "healthy"
+        assert third["api_status"]["last_check"] is not None
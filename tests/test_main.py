@@ -0,0 +1,78 @@
+"""Unit tests for the bot's main loop helpers."""
+
+from datetime import datetime
+
+import pytest
+
+from src.main import PolymarketArbitrageBot
+from src.market.market_data import Market, MarketStatus, MarketUpdate
+
+
+def create_test_market(market_id: str = "market_1") -> Market:
+    """Create a test market."""
+    return Market(
+        market_id=market_id,
+        question=f"Test question {market_id}",
+        description="Test market",
+        category="test",
+        end_date=datetime(2024, 12, 31),
+        status=MarketStatus.ACTIVE,
+        yes_price=0.45,
+        no_price=0.48,
+        yes_bid=0.44,
+        yes_ask=0.46,
+        no_bid=0.47,
+        no_ask=0.49,
+        volume_24h=10000,
+        liquidity=50000,
+    )
+
+
+class RecordingDetector:
+    """Detector stand-in that keeps the markets it was given."""
+
+    def __init__(self):
+        self.seen = None
+
+    def detect_opportunities(self, markets):
+        self.seen = markets
+        return []
+
+
+@pytest.fixture
+def bot():
+    """Create a bot shell with one market and a recording detector."""
+    # Skip __init__, which loads config.yaml and reconfigures logging
+    bot = PolymarketArbitrageBot.__new__(PolymarketArbitrageBot)
+    market = create_test_market()
+    bot.markets = [market]
+    bot._market_index = {market.market_id: market}
+    bot.detector = RecordingDetector()
+    return bot
+
+
+class TestDetectOpportunities:
+    """Test detection runs on a market snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_detection_sees_copies_of_the_markets(self, bot):
+        """Test live WebSocket updates do not reach the detection snapshot."""
+        await bot._detect_opportunities()
+        (snapshot,) = bot.detector.seen
+
+        await bot._on_market_update(
+            MarketUpdate(
+                market_id="market_1",
+                yes_price=None,
+                no_price=None,
+                yes_bid=None,
+                yes_ask=0.30,
+                no_bid=None,
+                no_ask=0.31,
+                timestamp=0.0,
+            )
+        )
+
+        assert snapshot is not bot.markets[0]
+        assert (snapshot.yes_ask, snapshot.no_ask) == (0.46, 0.49)
+        assert (bot.markets[0].yes_ask, bot.markets[0].no_ask) == (0.30, 0.31)
@@ -0,0 +1,77 @@
+"""Unit tests for market data models."""
+
+import json
+import sys
+from dataclasses import replace
+from datetime import datetime
+
+from src.market.market_data import Market, MarketStatus, OrderBook
+
+
+def create_test_market() -> Market:
+    """Create a test market."""
+    return Market(
+        market_id="market_1",
+        question="Will it rain?",
+        description="Test market",
+        category="weather",
+        end_date=datetime(2024, 12, 31),
+        status=MarketStatus.ACTIVE,
+        yes_price=0.45,
+        no_price=0.55,
+        yes_bid=0.44,
+        yes_ask=0.46,
+        no_bid=0.54,
+        no_ask=0.56,
+        volume_24h=10000,
+        liquidity=50000,
+    )
+
+
+class TestOrderBook:
+    """Test order book."""
+
+    def test_best_levels_from_unsorted_book(self):
+        """Test top of book is found regardless of input order."""
+        book = OrderBook(
+            market_id="token_yes_123",
+            outcome="YES",
+            bids=[(0.58, 500), (0.61, 1000), (0.60, 2000)],
+            asks=[(0.65, 800), (0.63, 1500), (0.64, 3000)],
+        )
+
+        assert book.best_bid == (0.61, 1000)
+        assert book.best_ask == (0.63, 1500)
+        assert book.mid_price == 0.62
+
+    def test_empty_book(self):
+        """Test an empty book has no top of book."""
+        book = OrderBook(market_id="token", outcome="NO", bids=[], asks=[])
+
+        assert book.best_bid is None
+        assert book.best_ask is None
+        assert book.mid_price is None
+
+
+class TestMarket:
+    """Test market model."""
+
+    def test_to_json_round_trips_to_dict(self):
+        """Test JSON serialization matches the dictionary form."""
+        market = create_test_market()
+
+        assert json.loads(market.to_json()) == market.to_dict()
+
+    def test_status_serializes_as_lowercase_name(self):
+        """Test integer statuses keep their string form in to_dict."""
+        market = create_test_market()
+        market.status = MarketStatus.RESOLVED
+
+        assert market.to_dict()["status"] == "resolved"
+
+    def test_market_id_is_interned(self):
+        """Test IDs built at runtime share the interned string."""
+        market_id = "".join(["market", "_1"])
+        market = replace(create_test_market(), market_id=market_id)
+
+        assert market.market_id is sys.intern(market_id)
@@ -0,0 +1,79 @@
+"""Unit tests for Prometheus metrics export."""
+
+from prometheus_client import REGISTRY
+
+from src.utils import metrics
+from src.utils.metrics import MetricsExporter
+
+
+def sample(name: str, **labels) -> float:
+    """Read a sample value from the default registry."""
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestMetricsExporter:
+    """Test metrics exporter."""
+
+    def test_record_trade_uses_bound_child(self):
+        """Test trades increment the labelled counter via the cached child."""
+        before = sample("trades_executed_total", outcome="YES", side="BUY")
+
+        MetricsExporter.record_trade("YES", "BUY", pnl=2.0)
+        MetricsExporter.record_trade("YES", "BUY")
+
+        assert sample("trades_executed_total", outcome="YES", side="BUY") == before + 2
+        assert ("YES", "BUY") in metrics._trade_children
+
+    def test_label_sets_are_prewarmed(self):
+        """Test common label combinations are bound at import."""
+        assert ("cross_market",) in metrics._opportunity_children
+        assert ("NO", "SELL") in metrics._trade_children
+        assert ("other",) in metrics._api_duration_children
+
+    def test_created_series_are_not_exported(self):
+        """Test scrapes omit the per-child *_created samples."""
+        output = MetricsExporter.export_metrics(max_age=0)
+
+        assert b"trades_executed_total{" in output
+        assert b"_created" not in output
+
+    def test_new_label_values_are_cached(self):
+        """Test each label combination is bound once and then reused."""
+        MetricsExporter.record_api_call("/book", 0.05, error="timeout")
+        child = metrics._api_duration_children[("book",)]
+
+        MetricsExporter.record_api_call("/book", 0.07)
+
+        assert metrics._api_duration_children[("book",)] is child
+        assert sample("api_request_duration_seconds_count", endpoint="book") >= 2
+        assert sample("api_errors_total", error_type="timeout") >= 1
+
+    def test_endpoint_labels_are_canonical(self):
+        """Test IDs, hosts and query strings do not create new labels."""
+        assert metrics._canon("https://gamma-api.polymarket.com/markets") == "markets"
+        assert metrics._canon("https://gamma-api.polymarket.com/markets/123") == (
+            "market"
+        )
+        assert metrics._canon("/markets/0xabc123/") == "market"
+        assert metrics._canon("https://clob.polymarket.com/book?token_id=9") == "book"
+        assert metrics._canon("https://clob.polymarket.com/orders/7/fills") == "other"
+
+    def test_export_reuses_recent_snapshot(self, monkeypatch):
+        """Test scrapes within the TTL share one render."""
+        clock = [1000.0]
+        monkeypatch.setattr(metrics.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(metrics, "_snapshot", None)
+
+        first = MetricsExporter.export_metrics()
+        MetricsExporter.record_opportunity("cross_market")
+        assert MetricsExporter.export_metrics() is first
+
+        clock[0] += 1.0
+        assert MetricsExporter.export_metrics() != first
+
+    def test_export_without_reuse(self):
+        """Test a zero max age always renders a fresh scrape."""
+        first = MetricsExporter.export_metrics(max_age=0)
+        MetricsExporter.record_opportunity("multi_leg")
+
+        assert MetricsExporter.export_metrics(max_age=0) != first
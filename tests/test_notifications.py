@@ -0,0 +1,310 @@
+"""Unit tests for notification senders."""
+
+import asyncio
+import copy
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from src.config import Config
+from src.notifications import discord as discord_module
+from src.notifications.discord import DiscordNotifier
+from src.notifications.hub import NotificationHub
+from src.notifications.telegram import TelegramNotifier
+
+
+@pytest.fixture
+def discord_posts():
+    """Record webhook requests made through a mock transport."""
+    return []
+
+
+@pytest.fixture
+def discord(discord_posts):
+    """Create a Discord notifier that posts to a mock transport."""
+
+    def handler(request):
+        assert request.headers["content-type"] == "application/json"
+        discord_posts.append(json.loads(request.content))
+        return httpx.Response(204)
+
+    notifier = DiscordNotifier(Config(discord_webhook="https://discord.test/hook"))
+    notifier._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return notifier
+
+
+@pytest.fixture
+def telegram_posts():
+    """Record Bot API requests made through a mock transport."""
+    return []
+
+
+@pytest.fixture
+def telegram(telegram_posts):
+    """Create a Telegram notifier that posts to a mock transport."""
+
+    def handler(request):
+        assert request.headers["content-type"] == "application/json"
+        telegram_posts.append((request.url.path, json.loads(request.content)))
+        return httpx.Response(200, json={"ok": True})
+
+    notifier = TelegramNotifier(
+        Config(telegram_bot_token="123:abc", telegram_chat_id="42")
+    )
+    notifier._client = httpx.AsyncClient(
+        base_url="https://api.telegram.test/bot123:abc",
+        transport=httpx.MockTransport(handler),
+    )
+    return notifier
+
+
+def scored_opportunity():
+    """Create a minimal scored opportunity."""
+    return SimpleNamespace(
+        opportunity="YES/NO imbalance on market_1",
+        score=82.5,
+        profit_score=70.0,
+        confidence_score=0.9,
+    )
+
+
+class TestDiscordNotifier:
+    """Test Discord notifier."""
+
+    @pytest.mark.asyncio
+    async def test_opportunity_alert_payload(self, discord, discord_posts):
+        """Test opportunity alerts post a single embed with all fields."""
+        await discord.send_opportunity_alert(scored_opportunity(), 250.0)
+        await discord.aclose()
+
+        assert len(discord_posts) == 1
+        (embed,) = discord_posts[0]["embeds"]
+        assert embed["title"] == "🎯 Arbitrage Opportunity Detected!"
+        assert embed["footer"] == {"text": "Polymarket Arbitrage Bot"}
+        fields = {f["name"]: f["value"] for f in embed["fields"]}
+        assert fields["Score"] == "82.50/100"
+        assert fields["Recommended Size"] == "$250.00"
+
+    @pytest.mark.asyncio
+    async def test_embed_skeleton_is_not_modified(self, discord, discord_posts):
+        """Test filled-in embeds leave the shared skeleton untouched."""
+        skeleton = copy.deepcopy(discord_module._OPP_EMBED)
+
+        await discord.send_opportunity_alert(scored_opportunity(), 250.0)
+        await discord.send_opportunity_alert(scored_opportunity(), 100.0)
+        await discord.aclose()
+
+        assert discord_module._OPP_EMBED == skeleton
+        first, second = discord_posts[0]["embeds"]
+        assert first["fields"][0] == {
+            "name": "Details",
+            "value": "YES/NO imbalance on market_1",
+            "inline": False,
+        }
+        assert first["fields"][4]["value"] == "$250.00"
+        assert second["fields"][4]["value"] == "$100.00"
+
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced_into_one_post(self, discord, discord_posts):
+        """Test alerts sent together share one webhook message."""
+        for _ in range(3):
+            await discord.send_opportunity_alert(scored_opportunity(), 250.0)
+        await discord.send_execution_alert([object()], 12.5)
+        await discord.aclose()
+
+        assert [len(post["embeds"]) for post in discord_posts] == [4]
+
+    @pytest.mark.asyncio
+    async def test_batches_respect_max_size(self, discord, discord_posts):
+        """Test a large burst is split into Discord-sized messages."""
+        for _ in range(12):
+            await discord.send_opportunity_alert(scored_opportunity(), 250.0)
+        await discord.aclose()
+
+        assert [len(post["embeds"]) for post in discord_posts] == [10, 2]
+
+    @pytest.mark.asyncio
+    async def test_batches_respect_message_text_limit(self, discord, discord_posts):
+        """Test long embeds are split so no message exceeds 6000 characters."""
+        long_opportunity = scored_opportunity()
+        long_opportunity.opportunity = "x" * 5000
+
+        for _ in range(6):
+            await discord.send_opportunity_alert(long_opportunity, 250.0)
+        await discord.aclose()
+
+        # Each embed is ~1.1k characters once Details is cut to 1024
+        assert [len(post["embeds"]) for post in discord_posts] == [5, 1]
+        embeds = discord_posts[0]["embeds"]
+        assert all(len(e["fields"][0]["value"]) == 1024 for e in embeds)
+
+    @pytest.mark.asyncio
+    async def test_error_alerts_are_sent_immediately(self, discord, discord_posts):
+        """Test error alerts do not wait for the batching window."""
+        await discord.send_opportunity_alert(scored_opportunity(), 250.0)
+        await discord.send_error_alert("boom")
+
+        assert len(discord_posts) == 1
+        assert discord_posts[0]["embeds"][0]["title"] == "⚠️ Error Alert"
+
+        await discord.aclose()
+        assert len(discord_posts) == 2
+
+    @pytest.mark.parametrize("http2", [True, False])
+    def test_client_uses_http2_when_available(self, monkeypatch, http2):
+        """Test HTTP/2 is requested only when h2 can be imported."""
+        created = []
+        monkeypatch.setattr(discord_module, "_HTTP2", http2)
+        monkeypatch.setattr(
+            discord_module.httpx,
+            "AsyncClient",
+            lambda **kwargs: created.append(kwargs) or object(),
+        )
+
+        DiscordNotifier(
+            Config(discord_webhook="https://discord.test/hook")
+        )._get_client()
+
+        assert created[0]["http2"] is http2
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_webhook(self):
+        """Test nothing is sent when no webhook is configured."""
+        notifier = DiscordNotifier(Config(discord_webhook=None))
+
+        await notifier.send_error_alert("boom")
+
+        assert notifier._client is None
+
+    @pytest.mark.asyncio
+    async def test_send_failures_are_logged_not_raised(self, discord):
+        """Test transport errors do not propagate to the caller."""
+
+        def handler(request):
+            raise httpx.ConnectError("unreachable")
+
+        discord._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        await discord.send_error_alert("boom")
+        await discord.aclose()
+
+
+class TestTelegramNotifier:
+    """Test Telegram notifier."""
+
+    @pytest.mark.asyncio
+    async def test_opportunity_alert_message(self, telegram, telegram_posts):
+        """Test opportunity alerts fill in every template placeholder."""
+        await telegram.send_opportunity_alert(scored_opportunity(), 250.0)
+
+        ((path, payload),) = telegram_posts
+        assert path == "/bot123:abc/sendMessage"
+        assert payload["chat_id"] == "42"
+        assert payload["parse_mode"] == "MarkdownV2"
+        assert payload["text"] == (
+            "🎯 *Arbitrage Opportunity Detected\\!*\n\n"
+            "*Type:* str\n"
+            "*Score:* 82\\.50/100\n"
+            "*Profit Score:* 70\\.00\n"
+            "*Confidence:* 0\\.90\n"
+            "*Position Size:* $250\\.00\n\n"
+            "*Details:*\nYES/NO imbalance on market\\_1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_performance_report_defaults_missing_metrics(
+        self, telegram, telegram_posts
+    ):
+        """Test metrics absent from the report are shown as zero."""
+        await telegram.send_performance_report({"net_pnl": 12.345, "roi": 1.5})
+
+        text = telegram_posts[0][1]["text"]
+        assert "*Net P&L:* $12\\.35\n" in text
+        assert "*ROI:* 1\\.50%\n" in text
+        assert "*Total Trades:* 0\n" in text
+        assert text.endswith("*Sharpe Ratio:* 0\\.00")
+
+    @pytest.mark.asyncio
+    async def test_error_text_is_escaped(self, telegram, telegram_posts):
+        """Test MarkdownV2 special characters in errors are escaped."""
+        await telegram.send_error_alert("bad [market_1] (price=-0.5)!")
+
+        assert telegram_posts[0][1]["text"] == (
+            "⚠️ *Error Alert*\n\nbad \\[market\\_1\\] \\(price\\=\\-0\\.5\\)\\!"
+        )
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_credentials(self):
+        """Test nothing is sent when no chat is configured."""
+        notifier = TelegramNotifier(Config(telegram_bot_token="123:abc"))
+
+        await notifier.send_error_alert("boom")
+
+        assert notifier._client is None
+
+    @pytest.mark.asyncio
+    async def test_api_errors_are_logged_not_raised(self, telegram):
+        """Test a rejected message does not propagate to the caller."""
+
+        def handler(request):
+            return httpx.Response(400, json={"ok": False})
+
+        telegram._client = httpx.AsyncClient(
+            base_url="https://api.telegram.test/bot123:abc",
+            transport=httpx.MockTransport(handler),
+        )
+
+        await telegram.send_error_alert("boom")
+        await telegram.aclose()
+
+        assert telegram._client is None
+
+
+class TestNotificationHub:
+    """Test notification hub."""
+
+    @pytest.mark.asyncio
+    async def test_channels_are_sent_concurrently(self):
+        """Test both channels are in flight at the same time."""
+        hub = NotificationHub(Config())
+        started = []
+        both_started = asyncio.Event()
+
+        async def send(error_message):
+            started.append(error_message)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), 1.0)
+
+        hub.discord.send_error_alert = send
+        hub.telegram.send_error_alert = send
+
+        await hub.error("boom")
+
+        assert started == ["boom", "boom"]
+
+    @pytest.mark.asyncio
+    async def test_failing_channel_does_not_block_others(self, telegram_posts):
+        """Test one channel raising still lets the other send."""
+        hub = NotificationHub(
+            Config(telegram_bot_token="123:abc", telegram_chat_id="42")
+        )
+
+        async def fail(*args):
+            raise RuntimeError("discord down")
+
+        hub.discord.send_execution_alert = fail
+        hub.telegram._client = httpx.AsyncClient(
+            base_url="https://api.telegram.test/bot123:abc",
+            transport=httpx.MockTransport(
+                lambda request: telegram_posts.append(request)
+                or httpx.Response(200, json={"ok": True})
+            ),
+        )
+
+        await hub.execution([object()], 12.5)
+        await hub.aclose()
+
+        assert len(telegram_posts) == 1
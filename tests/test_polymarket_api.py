@@ -1,10 +1,14 @@
 """Unit tests for Polymarket API client."""
 
+import asyncio
+import time
+
+import aiohttp
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, Mock, patch
 from src.config import Config
-from src.market.polymarket_api import PolymarketAPIClient
+from src.market.polymarket_api import PolymarketAPIClient, TokenBucket
 from src.market.market_data import MarketStatus
 
 
@@ -121,6 +125,91 @@ async def test_parse_market_with_orderbook(
         assert market.no_price == 0.38  # Mid price
 
 
+@pytest.mark.asyncio
+async def test_get_market_without_prices_skips_clob(api_client, sample_gamma_market):
+    """Test get_market can return Gamma prices without any CLOB request."""
+    with patch.object(api_client, "_request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = sample_gamma_market
+
+        market = await api_client.get_market("0x123abc", with_prices=False)
+
+    assert mock_request.call_count == 1
+    assert market.yes_price == 0.62
+    assert market.metadata["token_ids"] == ["token_yes_123", "token_no_456"]
+
+
+@pytest.mark.asyncio
+async def test_dead_markets_skip_order_books(api_client, sample_gamma_market):
+    """Test markets without volume or liquidity keep Gamma prices."""
+    sample_gamma_market["volume24hr"] = "0"
+    sample_gamma_market["liquidity"] = "0"
+
+    with patch.object(
+        api_client, "get_order_book", new_callable=AsyncMock
+    ) as mock_book:
+        market = await api_client._parse_market_with_prices(sample_gamma_market)
+
+    mock_book.assert_not_called()
+    assert market.yes_price == 0.62
+
+
+def test_parse_json_encoded_and_malformed_fields(api_client, sample_gamma_market):
+    """Test string-encoded lists parse and malformed fields get defaults."""
+    sample_gamma_market["outcomePrices"] = '["0.7", "0.3"]'
+    sample_gamma_market["clobTokenIds"] = '["123", "456"]'
+    sample_gamma_market["volume24hr"] = "n/a"
+
+    market = api_client._parse_market(sample_gamma_market)
+
+    assert market.yes_price == 0.7
+    assert market.no_price == 0.3
+    assert market.metadata["token_ids"] == ["123", "456"]
+    assert market.volume_24h == 0.0
+
+    sample_gamma_market["clobTokenIds"] = ["123", "bad id; drop"]
+    assert api_client._parse_market(sample_gamma_market).metadata["token_ids"] == []
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("145000", 145000.0),
+        ("0.62", 0.62),
+        (".5", 0.5),
+        ("5.", 5.0),
+        (" 0.5", 0.5),
+        ("-1e3", -1000.0),
+        ("n/a", 0.0),
+        ("", 0.0),
+        (".", 0.0),
+        ("1.2.3", 0.0),
+    ],
+)
+def test_numeric_string_fields(api_client, sample_gamma_market, value, expected):
+    """Test numeric strings float() accepts parse and malformed ones default."""
+    sample_gamma_market["volume24hr"] = value
+
+    assert api_client._parse_market(sample_gamma_market).volume_24h == expected
+
+
+@pytest.mark.asyncio
+async def test_end_date_parsing(api_client, sample_gamma_market):
+    """Test UTC end dates parse and bad ones use the fallback date."""
+    fallback = datetime(2030, 1, 1)
+    sample_gamma_market["clobTokenIds"] = []
+
+    market = await api_client._parse_market_with_prices(sample_gamma_market, fallback)
+    assert market.end_date == datetime(2026, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+
+    sample_gamma_market["endDate"] = "not a date"
+    market = await api_client._parse_market_with_prices(sample_gamma_market, fallback)
+    assert market.end_date is fallback
+
+    del sample_gamma_market["endDate"]
+    market = await api_client._parse_market_with_prices(sample_gamma_market, fallback)
+    assert market.end_date is fallback
+
+
 @pytest.mark.asyncio
 async def test_skip_inactive_markets(api_client):
     """Test that inactive markets are skipped."""
@@ -191,6 +280,28 @@ async def test_get_markets_with_mock_response(api_client):
             assert markets[1].yes_price == 0.30
 
 
+@pytest.mark.asyncio
+async def test_get_markets_keeps_order_and_skips_failures(api_client):
+    """Test concurrent pricing keeps API order and drops failed markets."""
+    mock_response = [
+        {"conditionId": f"0x{i}", "clobTokenIds": [f"y{i}", f"n{i}"]} for i in range(4)
+    ]
+
+    async def enrich(market, token_ids):
+        if market.market_id == "0x1":
+            raise ValueError("bad market")
+        # Finish later markets first
+        await asyncio.sleep(0.001 * (4 - int(market.market_id[2:])))
+        return market
+
+    with patch.object(api_client, "_request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response
+        with patch.object(api_client, "_enrich_with_clob", side_effect=enrich):
+            markets = await api_client.get_markets(limit=10)
+
+    assert [m.market_id for m in markets] == ["0x0", "0x2", "0x3"]
+
+
 @pytest.mark.asyncio
 async def test_error_handling(api_client):
     """Test error handling when API fails."""
@@ -203,10 +314,120 @@ async def test_error_handling(api_client):
         assert markets == []
 
 
+@pytest.mark.asyncio
+async def test_order_book_requests_are_shared_and_cached(api_client, sample_orderbook):
+    """Test concurrent and repeated book requests reuse one HTTP call."""
+
+    async def slow_response(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return sample_orderbook
+
+    with patch.object(
+        api_client, "_request", side_effect=slow_response
+    ) as mock_request:
+        first, second = await asyncio.gather(
+            api_client.get_order_book("token_yes_123"),
+            api_client.get_order_book("token_yes_123"),
+        )
+        third = await api_client.get_order_book("token_yes_123")
+
+    assert mock_request.call_count == 1
+    assert first is second is third
+    assert first.best_bid == (0.61, 1000.0)
+
+
+@pytest.mark.asyncio
+async def test_failed_price_lookups_are_not_cached(api_client):
+    """Test a failed price request is retried on the next call."""
+    with patch.object(api_client, "_request", new_callable=AsyncMock) as mock_request:
+        mock_request.side_effect = [Exception("Network error"), {"price": "0.52"}]
+
+        assert await api_client.get_token_price("token_yes_123") is None
+        assert await api_client.get_token_price("token_yes_123") == 0.52
+        assert await api_client.get_token_price("token_yes_123") == 0.52
+
+    assert mock_request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_request_decodes_response_body(api_client):
+    """Test _request parses the raw response body as JSON."""
+    response = Mock()
+    response.read = AsyncMock(return_value=b'{"price": "0.52", "ok": true}')
+    context = AsyncMock()
+    context.__aenter__.return_value = response
+    api_client.session = Mock()
+    api_client.session.request.return_value = context
+
+    result = await api_client._request("GET", "https://example.com/price")
+
+    assert result == {"price": "0.52", "ok": True}
+    response.raise_for_status.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_request_retries_with_backoff(api_client, monkeypatch):
+    """Test failed requests are retried with doubling waits, then raised."""
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    api_client.session = Mock()
+    api_client.session.request.side_effect = aiohttp.ClientError("down")
+
+    with pytest.raises(aiohttp.ClientError):
+        await api_client._request("GET", "https://example.com/markets")
+
+    assert api_client.session.request.call_count == 4
+    assert sleeps == [1, 2, 4]
+
+
+@pytest.mark.asyncio
+async def test_request_retries_non_json_body(api_client, monkeypatch):
+    """Test an HTML or empty body is retried like a transport error."""
+
+    async def fake_sleep(seconds):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    bodies = iter([b"<html>Bad gateway</html>", b"", b'{"price": "0.52"}'])
+    response = Mock()
+    response.read = AsyncMock(side_effect=lambda: next(bodies))
+    context = AsyncMock()
+    context.__aenter__.return_value = response
+    api_client.session = Mock()
+    api_client.session.request.return_value = context
+
+    result = await api_client._request("GET", "https://example.com/price")
+
+    assert result == {"price": "0.52"}
+    assert api_client.session.request.call_count == 3
+
+
 def test_rate_limiting(api_client):
     """Test that rate limiting is configured."""
-    assert api_client._min_request_interval == 0.1
-    assert api_client._last_request_time == 0
+    assert api_client._bucket.rate == 10.0
+    assert api_client._bucket.capacity == 5
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_throttles():
+    """Test a full bucket admits a burst and then paces requests."""
+    bucket = TokenBucket(rate=100.0, capacity=3)
+
+    start = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire()
+    burst = time.monotonic() - start
+
+    for _ in range(2):
+        await bucket.acquire()
+    throttled = time.monotonic() - start - burst
+
+    assert burst < 0.01
+    assert throttled >= 0.015
 
 
 @pytest.mark.asyncio
@@ -1,7 +1,13 @@
 """Unit tests for position sizing."""
 
 import pytest
-from src.execution.position_sizing import kelly_criterion, PositionSizer
+from types import SimpleNamespace
+
+from src.execution.position_sizing import (
+    kelly_criterion,
+    CapitalAllocator,
+    PositionSizer,
+)
 from src.config import Config
 
 
@@ -266,3 +272,64 @@ class TestPositionSizerEdgeCases:
 
         # Fractional Kelly should be smaller (more conservative)
         assert fractional_size < full_size
+
+
+class TestCapitalAllocator:
+    """Test capital allocation across opportunities."""
+
+    @staticmethod
+    def make_opportunities():
+        """Create scored opportunity stand-ins."""
+        return [
+            SimpleNamespace(profit_score=profit, confidence_score=confidence)
+            for profit, confidence in [
+                (150.0, 95.0),
+                (80.0, 90.0),
+                (5.0, 80.0),
+                (-5.0, 90.0),
+                (200.0, 99.0),
+                (120.0, 70.0),
+            ]
+        ]
+
+    @pytest.mark.parametrize("strategy", ["kelly", "fixed", "percentage"])
+    def test_matches_per_opportunity_sizing(self, strategy):
+        """Test vectorized allocation matches sizing each opportunity in turn."""
+        config = create_test_config(
+            position_sizing_strategy=strategy,
+            kelly_fraction=0.5,
+            max_position_size=800.0,
+            max_total_exposure=2500.0,
+        )
+        allocator = CapitalAllocator(config)
+        sizer = PositionSizer(config)
+        opportunities = self.make_opportunities()
+
+        expected = {}
+        remaining, exposure = 4000.0, 500.0
+        for i, opp in enumerate(opportunities):
+            size = sizer.calculate_position_size(
+                opp.profit_score, opp.confidence_score / 100, remaining
+            )
+            size = min(size, remaining, config.max_total_exposure - exposure)
+            if size > 0:
+                expected[i] = size
+                remaining -= size
+                exposure += size
+
+        allocation = allocator.allocate_capital(opportunities, 4500.0, 500.0)
+
+        assert allocation.keys() == expected.keys()
+        for i, size in expected.items():
+            assert allocation[i] == pytest.approx(size)
+
+    def test_exposure_limit_reached(self):
+        """Test nothing is allocated once the exposure limit is reached."""
+        config = create_test_config(max_total_exposure=1000.0)
+        allocator = CapitalAllocator(config)
+
+        allocation = allocator.allocate_capital(
+            self.make_opportunities(), 10000.0, 1000.0
+        )
+
+        assert allocation == {}
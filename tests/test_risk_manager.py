@@ -0,0 +1,191 @@
+"""Unit tests for risk management."""
+
+import pytest
+from datetime import datetime, timedelta
+
+from src.config import Config
+from src.execution.risk_manager import RiskManager
+from src.market.market_data import Market, MarketStatus, Position
+
+
+def create_test_market(market_id: str, yes_price: float, no_price: float) -> Market:
+    """Create a test market."""
+    return Market(
+        market_id=market_id,
+        question=f"Test question {market_id}",
+        description="Test market",
+        category="test",
+        end_date=datetime(2024, 12, 31),
+        status=MarketStatus.ACTIVE,
+        yes_price=yes_price,
+        no_price=no_price,
+        yes_bid=yes_price - 0.02,
+        yes_ask=yes_price + 0.02,
+        no_bid=no_price - 0.02,
+        no_ask=no_price + 0.02,
+        volume_24h=10000,
+        liquidity=50000,
+    )
+
+
+def create_test_position(
+    position_id: str,
+    market_id: str,
+    outcome: str = "YES",
+    entry_price: float = 0.50,
+    size: float = 100.0,
+    entry_time: datetime = None,
+) -> Position:
+    """Create a test position."""
+    return Position(
+        position_id=position_id,
+        market_id=market_id,
+        outcome=outcome,
+        size=size,
+        entry_price=entry_price,
+        entry_time=entry_time or datetime.now(),
+    )
+
+
+@pytest.fixture
+def risk_manager():
+    """Create a risk manager with a 5% stop loss."""
+    return RiskManager(Config(stop_loss_percentage=0.05))
+
+
+class TestRiskManager:
+    """Test risk manager."""
+
+    def test_update_position_prices(self, risk_manager):
+        """Test positions take the price of their outcome."""
+        risk_manager.add_position(create_test_position("p1", "m1", "YES"))
+        risk_manager.add_position(create_test_position("p2", "m1", "NO"))
+        risk_manager.add_position(create_test_position("p3", "m2", "YES"))
+
+        risk_manager.update_position_prices({"m1": create_test_market("m1", 0.6, 0.4)})
+
+        positions = risk_manager.positions
+        assert positions["p1"].current_price == pytest.approx(0.6)
+        assert positions["p2"].current_price == pytest.approx(0.4)
+        # No quote for m2, price is left unchanged
+        assert positions["p3"].current_price == 0.0
+
+    def test_stop_losses(self, risk_manager):
+        """Test positions past the stop loss are flagged."""
+        risk_manager.add_position(create_test_position("loser", "m1", "YES"))
+        risk_manager.add_position(create_test_position("winner", "m1", "NO"))
+        risk_manager.add_position(create_test_position("unpriced", "m2", "YES"))
+
+        risk_manager.update_position_prices({"m1": create_test_market("m1", 0.4, 0.6)})
+
+        assert risk_manager.check_stop_losses() == ["loser"]
+
+    def test_removed_positions_are_not_checked(self, risk_manager):
+        """Test removing a position keeps the remaining rows consistent."""
+        for i in range(100):
+            risk_manager.add_position(create_test_position(f"p{i}", f"m{i}"))
+        for i in range(0, 100, 2):
+            risk_manager.remove_position(f"p{i}")
+
+        markets = {f"m{i}": create_test_market(f"m{i}", 0.3, 0.7) for i in range(100)}
+        risk_manager.update_position_prices(markets)
+
+        assert sorted(risk_manager.check_stop_losses()) == sorted(
+            f"p{i}" for i in range(1, 100, 2)
+        )
+        assert all(p.current_price == 0.3 for p in risk_manager.positions.values())
+
+    def test_position_age(self, risk_manager):
+        """Test positions older than the maximum age are flagged."""
+        old = datetime.now() - timedelta(hours=25)
+        risk_manager.add_position(create_test_position("old", "m1", entry_time=old))
+        risk_manager.add_position(create_test_position("new", "m2"))
+
+        assert risk_manager.check_position_age() == ["old"]
+        # Stays flagged until removed
+        assert risk_manager.check_position_age() == ["old"]
+
+        risk_manager.remove_position("old")
+        assert risk_manager.check_position_age() == []
+
+    def test_position_age_at_given_time(self, risk_manager):
+        """Test the age check uses the caller's clock when given."""
+        entry = datetime(2024, 1, 1, 12, 0)
+        risk_manager.add_position(create_test_position("p1", "m1", entry_time=entry))
+
+        hour = 3600
+        assert risk_manager.check_position_age(entry.timestamp() + 23 * hour) == []
+        assert risk_manager.check_position_age(entry.timestamp() + 25 * hour) == ["p1"]
+
+    def test_risk_metrics(self, risk_manager):
+        """Test exposure and unrealized P&L are reported."""
+        risk_manager.add_position(create_test_position("p1", "m1", "YES"))
+        risk_manager.update_position_prices({"m1": create_test_market("m1", 0.6, 0.4)})
+
+        metrics = risk_manager.get_risk_metrics()
+
+        assert metrics["current_exposure"] == pytest.approx(50.0)
+        assert metrics["total_unrealized_pnl"] == pytest.approx(10.0)
+        assert metrics["open_positions"] == 1
+
+    def test_unrealized_pnl_tracks_updates_and_removals(self, risk_manager):
+        """Test the running P&L total matches summing the positions."""
+        risk_manager.add_position(create_test_position("p1", "m1", "YES"))
+        risk_manager.add_position(create_test_position("p2", "m2", "NO", size=50.0))
+        risk_manager.update_position_prices(
+            {
+                "m1": create_test_market("m1", 0.6, 0.4),
+                "m2": create_test_market("m2", 0.3, 0.7),
+            }
+        )
+        risk_manager.update_position_prices(
+            {"m1": create_test_market("m1", 0.55, 0.45)}
+        )
+        risk_manager.remove_position("p2")
+
+        expected = sum(p.unrealized_pnl for p in risk_manager.positions.values())
+        metrics = risk_manager.get_risk_metrics()
+
+        assert metrics["total_unrealized_pnl"] == pytest.approx(expected)
+        assert metrics["current_exposure"] == pytest.approx(50.0)
+
+    def test_diversification_score(self, risk_manager):
+        """Test the score follows the number of distinct markets held."""
+        assert risk_manager.get_diversification_score() == 100.0
+
+        risk_manager.add_position(create_test_position("p1", "m1"))
+        risk_manager.add_position(create_test_position("p2", "m1"))
+        risk_manager.add_position(create_test_position("p3", "m2"))
+        assert risk_manager.get_diversification_score() == pytest.approx(20.0)
+
+        risk_manager.remove_position("p1")
+        assert risk_manager.get_diversification_score() == pytest.approx(20.0)
+
+        risk_manager.remove_position("p2")
+        assert risk_manager.get_diversification_score() == pytest.approx(10.0)
+
+    def test_re_adding_a_position_keeps_market_counts(self, risk_manager):
+        """Test adding a tracked ID again counts its market once."""
+        risk_manager.add_position(create_test_position("p1", "m1", "YES"))
+        risk_manager.add_position(create_test_position("p1", "m1", "YES"))
+
+        assert risk_manager._market_counts == {"m1": 1}
+        assert risk_manager.get_diversification_score() == pytest.approx(10.0)
+
+        risk_manager.remove_position("p1")
+
+        assert risk_manager._market_counts == {}
+        assert risk_manager.get_diversification_score() == 100.0
+
+    def test_re_adding_a_position_keeps_pnl_and_exposure(self, risk_manager):
+        """Test a replaced position's P&L and exposure are not counted twice."""
+        risk_manager.add_position(create_test_position("p1", "m1", "YES"))
+        risk_manager.update_position_prices({"m1": create_test_market("m1", 0.6, 0.4)})
+        risk_manager.add_position(create_test_position("p1", "m1", "YES"))
+        risk_manager.update_position_prices({"m1": create_test_market("m1", 0.6, 0.4)})
+
+        metrics = risk_manager.get_risk_metrics()
+
+        assert metrics["open_positions"] == 1
+        assert metrics["current_exposure"] == pytest.approx(50.0)
+        assert metrics["total_unrealized_pnl"] == pytest.approx(10.0)
@@ -7,7 +7,7 @@ from src.arbitrage.strategies.cross_market import CrossMarketStrategy
 from src.arbitrage.strategies.yes_no_imbalance import YesNoImbalanceStrategy
 from src.arbitrage.strategies.multi_leg import MultiLegStrategy
 from src.arbitrage.strategies.correlated_events import CorrelatedEventsStrategy
-from src.market.market_data import Market, MarketStatus
+from src.market.market_data import Market, MarketArrayView, MarketStatus
 
 
 def create_test_market(
@@ -129,6 +129,47 @@ class TestYesNoImbalanceStrategy:
 
         assert len(opportunities) == 0
 
+    def test_detect_arr_matches_detect(self):
+        """Test vectorized detection agrees with the per-market loop."""
+        strategy = YesNoImbalanceStrategy(min_profit_pct=0.5)
+
+        markets = [
+            create_test_market(
+                "buy", "Buy both", 0.45, 0.48, yes_ask=0.46, no_ask=0.49
+            ),
+            create_test_market("flat", "Balanced", 0.50, 0.50),
+            create_test_market(
+                "sell", "Sell both", 0.58, 0.46, yes_bid=0.58, no_bid=0.46
+            ),
+        ]
+
+        expected = strategy.detect(markets)
+        actual = strategy.detect_arr(MarketArrayView.from_markets(markets))
+
+        assert [(o.market.market_id, o.action) for o in actual] == [
+            (o.market.market_id, o.action) for o in expected
+        ]
+        for a, e in zip(actual, expected):
+            assert a.price_sum == pytest.approx(e.price_sum)
+            assert a.profit_percentage == pytest.approx(e.profit_percentage)
+
+    def test_detect_arr_reports_view_prices(self):
+        """Test opportunities carry the prices the view was built from."""
+        strategy = YesNoImbalanceStrategy(min_profit_pct=0.5)
+        market = create_test_market(
+            "buy", "Buy both", 0.45, 0.48, yes_ask=0.46, no_ask=0.49
+        )
+        view = MarketArrayView.from_markets([market])
+
+        # A live update lands after the snapshot was taken
+        market.yes_ask = 0.60
+
+        (opportunity,) = strategy.detect_arr(view)
+
+        assert opportunity.yes_price == pytest.approx(0.46)
+        assert opportunity.no_price == pytest.approx(0.49)
+        assert opportunity.price_sum == pytest.approx(0.95)
+
 
 class TestCrossMarketStrategy:
     """Test cross-market arbitrage detection."""
@@ -224,6 +265,61 @@ class TestMultiLegStrategy:
         for opp in opportunities:
             assert opp.complexity_score <= 3
 
+    def test_legs_alternate_outcomes(self):
+        """Test chain legs alternate YES/NO and carry the ask price."""
+        strategy = MultiLegStrategy(min_profit_pct=1.0, max_legs=3)
+
+        markets = [
+            create_test_market(f"market_{i}", f"Outcome {i}", 0.28, 0.38)
+            for i in range(3)
+        ]
+
+        opportunities = strategy.detect(markets)
+
+        assert len(opportunities) == 1
+        legs = opportunities[0].legs
+        assert [leg.outcome for leg in legs] == ["YES", "NO", "YES"]
+        assert [leg.market_id for leg in legs] == ["market_0", "market_1", "market_2"]
+        assert legs[0].price == pytest.approx(0.30)
+        assert legs[1].price == pytest.approx(0.40)
+
+    def test_skips_chains_that_cannot_be_profitable(self, monkeypatch):
+        """Test chain enumeration is skipped when asks rule out any profit."""
+        strategy = MultiLegStrategy(min_profit_pct=1.0, max_legs=5)
+
+        markets = [
+            create_test_market(f"market_{i}", f"Outcome {i}", 0.98, 0.98)
+            for i in range(6)
+        ]
+
+        def fail_check_chain(chain):
+            raise AssertionError("chain should have been pruned")
+
+        monkeypatch.setattr(strategy, "_check_chain", fail_check_chain)
+
+        assert strategy.detect(markets) == []
+
+    def test_reuses_chain_search_for_unchanged_prices(self):
+        """Test an unchanged group skips the search but uses fresh markets."""
+        strategy = MultiLegStrategy(min_profit_pct=1.0, max_legs=4)
+
+        def make_markets():
+            return [
+                create_test_market(f"market_{i}", f"Outcome {i}", 0.28, 0.38)
+                for i in range(4)
+            ]
+
+        first = strategy.detect(make_markets())
+
+        # Any fresh chain search would now fail
+        strategy._scorers = {}
+        markets = make_markets()
+        second = strategy.detect(markets)
+
+        assert [str(opp) for opp in second] == [str(opp) for opp in first]
+        market_ids = {id(m) for m in markets}
+        assert all(id(m) in market_ids for opp in second for m in opp.markets)
+
 
 class TestCorrelatedEventsStrategy:
     """Test correlated events arbitrage detection."""
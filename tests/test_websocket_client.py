@@ -0,0 +1,132 @@
+"""Unit tests for the WebSocket client."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.config import Config
+from src.market.market_data import MarketUpdate
+from src.market.websocket_client import WebSocketClient
+
+
+@pytest.fixture
+def ws_client():
+    """Create a WebSocket client without connecting."""
+    return WebSocketClient(Config())
+
+
+@pytest.mark.asyncio
+async def test_market_update_reaches_callbacks(ws_client):
+    """Test market updates are passed to every registered callback."""
+    received = []
+
+    async def callback(update):
+        received.append(update)
+
+    ws_client.register_callback(callback)
+    ws_client.register_callback(callback)
+
+    await ws_client._handle_message(
+        {"type": "market_update", "market_id": "m1", "yes_price": 0.6}
+    )
+
+    assert len(received) == 2
+    assert isinstance(received[0], MarketUpdate)
+    assert received[0].market_id == "m1"
+    assert received[0].yes_price == 0.6
+    assert received[0].no_price is None
+
+
+@pytest.mark.asyncio
+async def test_other_message_types_skip_callbacks(ws_client):
+    """Test trade, error and unknown messages do not notify callbacks."""
+    received = []
+
+    async def callback(update):
+        received.append(update)
+
+    ws_client.register_callback(callback)
+
+    for message_type in ("trade", "error", "heartbeat", None):
+        await ws_client._handle_message({"type": message_type})
+
+    assert received == []
+
+
+@pytest.mark.asyncio
+async def test_callbacks_run_concurrently_and_failures_are_isolated(ws_client):
+    """Test a slow or failing callback does not hold back the others."""
+    order = []
+
+    async def slow(update):
+        await asyncio.sleep(0.01)
+        order.append("slow")
+
+    async def failing(update):
+        raise RuntimeError("subscriber bug")
+
+    async def fast(update):
+        order.append("fast")
+
+    for callback in (slow, failing, fast):
+        ws_client.register_callback(callback)
+
+    await ws_client._handle_message({"type": "market_update", "market_id": "m1"})
+
+    assert order == ["fast", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_markets_sends_one_frame(ws_client):
+    """Test batch subscription sends all IDs in a single text frame."""
+    ws_client.websocket = AsyncMock()
+
+    await ws_client.subscribe_markets(["m1", "m2", "m3"])
+
+    ws_client.websocket.send.assert_awaited_once()
+    frame = ws_client.websocket.send.await_args.args[0]
+    assert isinstance(frame, str)
+    assert json.loads(frame) == {
+        "type": "subscribe",
+        "channel": "market",
+        "market_ids": ["m1", "m2", "m3"],
+    }
+    assert ws_client.subscribed_markets == {"m1", "m2", "m3"}
+
+
+@pytest.mark.asyncio
+async def test_reconnect_resubscribes_in_one_frame(ws_client, monkeypatch):
+    """Test reconnecting restores every subscription with one send."""
+    websocket = AsyncMock()
+
+    async def fake_connect():
+        ws_client.websocket = websocket
+
+    monkeypatch.setattr(ws_client, "connect", fake_connect)
+    monkeypatch.setattr(ws_client, "_reconnect_delay", 0)
+    ws_client.subscribed_markets = {"m1", "m2"}
+
+    await ws_client._reconnect()
+
+    websocket.send.assert_awaited_once()
+    frame = json.loads(websocket.send.await_args.args[0])
+    assert sorted(frame["market_ids"]) == ["m1", "m2"]
+
+
+@pytest.mark.asyncio
+async def test_single_subscribe_frames(ws_client):
+    """Test per-market frames are valid JSON, including awkward IDs."""
+    ws_client.websocket = AsyncMock()
+    market_id = 'odd "id"\\'
+
+    await ws_client.subscribe_market(market_id)
+    await ws_client.unsubscribe_market(market_id)
+
+    frames = [call.args[0] for call in ws_client.websocket.send.await_args_list]
+    assert [json.loads(frame) for frame in frames] == [
+        {"type": "subscribe", "channel": "market", "market_id": market_id},
+        {"type": "unsubscribe", "channel": "market", "market_id": market_id},
+    ]
+    assert ws_client.subscribed_markets == set()